@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from app.clients.llm_client import LLMClientFactory
 from app.models.enums.ai_model_enums import ModelProvider, OpenAIModels
@@ -7,6 +8,8 @@ from app.prompts.join_report_prompt import SYSTEM_JOIN_REPORT_PROMPT, HUMAN_JOIN
 from langchain_core.messages import SystemMessage, HumanMessage
 from typing import Dict
 
+from app.services.token_budget_service import token_budget_manager
+
 from app.prompts.growth_interanual_prompt import GROWTH_INTERANUAL_PROMPT
 from app.prompts.regimen_prompt import REGIMEN_PROMPT
 from app.prompts.sectors_prompt import SECTORS_PROMPT
@@ -34,16 +37,18 @@ class BaseGeneralInformationAgent(ABC):
         """Retorna el nombre del agente para logging. Debe ser implementado por las subclases."""
         pass
     
-    def run(self, input_question: str, context = "") -> str:
+    def _build_prompt(self, input_question: str, context = "") -> str:
         """
-        Método común para ejecutar el agente.
-        Reemplaza el placeholder {{#context#}} en el prompt y genera la respuesta.
+        Reemplaza el placeholder {{#context#}} en el prompt y añade la pregunta del usuario.
         Admite context como str o dict.
         """
         print(f"--- Agente de Reporte de {self.agent_name} en ejecución ---")
         print("="*40 + "\n")
         print("="*40 + "\n")
 
+        # Presupuesto de tokens: el contexto se reduce antes de la llamada si el prompt no cabe
+        context = self._fit_context(input_question, context)
+
         # Si el contexto es dict, conviértelo a string legible
         if isinstance(context, dict):
             import json
@@ -54,10 +59,40 @@ class BaseGeneralInformationAgent(ABC):
             system_prompt_with_context = self.system_prompt.replace("{{#context#}}", context_str)
         else:
             system_prompt_with_context = self.system_prompt
-        full_prompt = f"{system_prompt_with_context}\n\nPregunta del usuario: {input_question}"
+        return f"{system_prompt_with_context}\n\nPregunta del usuario: {input_question}"
+
+    def _fit_context(self, input_question: str, context):
+        """Ajusta el contexto (str o dict de datasets) al presupuesto de tokens del agente."""
+        if not context:
+            return context
+        model = getattr(self.llm_client, "_model_name", None)
+        reserved = token_budget_manager.count(f"{self.system_prompt}\n\nPregunta del usuario: {input_question}", model)
+        if not isinstance(context, dict):
+            return token_budget_manager.fit_context(self.agent_name, context, reserved_tokens=reserved, model=model)
+        # Con varios datasets el presupuesto se reparte por igual entre ellos (con un mínimo por dataset)
+        share = token_budget_manager.context_allowance(self.agent_name, reserved, parts=len(context))
+        return {
+            key: token_budget_manager.fit_context(f"{self.agent_name}:{key}", value, model=model, budget=share)
+            for key, value in context.items()
+        }
+
+    def run(self, input_question: str, context = "") -> str:
+        """
+        Método común para ejecutar el agente.
+        Reemplaza el placeholder {{#context#}} en el prompt y genera la respuesta.
+        Admite context como str o dict.
+        """
+        full_prompt = self._build_prompt(input_question, context)
         response = self.llm_client.generate_response(full_prompt)
         return response
 
+    async def arun(self, input_question: str, context = "") -> str:
+        """Versión asíncrona de run; no bloquea el event loop durante la llamada al LLM."""
+        # El conteo de tokens y el recorte del contexto son CPU: se ejecutan fuera del event loop
+        full_prompt = await asyncio.to_thread(self._build_prompt, input_question, context)
+        response = await self.llm_client.agenerate_response(full_prompt)
+        return response
+
 
 class GeneralInformationAgent(BaseGeneralInformationAgent):
     def _get_system_prompt(self) -> str:
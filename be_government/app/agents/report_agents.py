@@ -1,11 +1,14 @@
+import asyncio
 from abc import ABC, abstractmethod
 from app.clients.llm_client import LLMClientFactory
 from app.models.enums.ai_model_enums import ModelProvider, OpenAIModels
 from app.prompts.spent_prompt import SPENT_PROMPT
 from app.prompts.industry_prompt import INDUSTRY_PROMPT
-from app.prompts.join_report_prompt import SYSTEM_JOIN_REPORT_PROMPT, HUMAN_JOIN_REPORT_PROMPT
+from app.prompts.join_report_prompt import SYSTEM_JOIN_REPORT_PROMPT, HUMAN_JOIN_REPORT_PROMPT, SUMMARY_JOIN_REPORT_PROMPT
+from app.core.config import INTERANUAL_GROWTH_DATA_RELATIVE_PATH, REPORT_JOIN_MODE, REPORT_JOIN_SUMMARY
+from app.services.token_budget_service import token_budget_manager
 from langchain_core.messages import SystemMessage, HumanMessage
-from typing import Dict
+from typing import AsyncIterator, Dict, Optional
 
 from app.prompts.growth_interanual_prompt import GROWTH_INTERANUAL_PROMPT
 from app.prompts.regimen_prompt import REGIMEN_PROMPT
@@ -33,10 +36,9 @@ class BaseReportAgent(ABC):
         """Retorna el nombre del agente para logging. Debe ser implementado por las subclases."""
         pass
     
-    def run(self, input_question: str, context: str = "") -> str:
+    def _build_prompt(self, input_question: str, context: str = "") -> str:
         """
-        Método común para ejecutar el agente.
-        Reemplaza el placeholder {{#context#}} en el prompt y genera la respuesta.
+        Reemplaza el placeholder {{#context#}} en el prompt y añade la pregunta del usuario.
         """
         print(f"--- Agente de Reporte de {self.agent_name} en ejecución ---")
         print("="*40 + "\n")
@@ -49,17 +51,38 @@ class BaseReportAgent(ABC):
         else:
             print("Sin contexto proporcionado.")
         print("="*40 + "\n")
-        
+
+        if context:
+            # Presupuesto de tokens: se mide el prompt antes de la llamada y se reduce el contexto si no cabe
+            question_part = f"\n\nPregunta del usuario: {input_question}"
+            model = getattr(self.llm_client, "_model_name", None)
+            reserved = token_budget_manager.count(self.system_prompt + question_part, model)
+            context = token_budget_manager.fit_context(self.agent_name, context, reserved_tokens=reserved, model=model)
+
         if context:
             # Replace the {{#context#}} placeholder in the system prompt
             system_prompt_with_context = self.system_prompt.replace("{{#context#}}", context)
         else:
             system_prompt_with_context = self.system_prompt
         
-        full_prompt = f"{system_prompt_with_context}\n\nPregunta del usuario: {input_question}"
+        return f"{system_prompt_with_context}\n\nPregunta del usuario: {input_question}"
+
+    def run(self, input_question: str, context: str = "") -> str:
+        """
+        Método común para ejecutar el agente.
+        Reemplaza el placeholder {{#context#}} en el prompt y genera la respuesta.
+        """
+        full_prompt = self._build_prompt(input_question, context)
         response = self.llm_client.generate_response(full_prompt)
         return response
 
+    async def arun(self, input_question: str, context: str = "") -> str:
+        """Versión asíncrona de run; no bloquea el event loop durante la llamada al LLM."""
+        # El conteo de tokens y el recorte del contexto son CPU: se ejecutan fuera del event loop
+        full_prompt = await asyncio.to_thread(self._build_prompt, input_question, context)
+        response = await self.llm_client.agenerate_response(full_prompt)
+        return response
+
 
 class ReportSpentAgent(BaseReportAgent):
     def _get_system_prompt(self) -> str:
@@ -102,38 +125,74 @@ class ReportGrowthInteranualAgent(BaseReportAgent):
 
 
 class ReportCompletedAgent:    
-    def __init__(self):
+    def __init__(self, mode: str = REPORT_JOIN_MODE, summary: bool = REPORT_JOIN_SUMMARY):
         """
         Inicializa el agente ensamblador.
         
         Args:
-            system_prompt: La plantilla de string para el SystemMessage (JOIN_REPORT_PROMPT).
-            human_prompt_template: La plantilla de string para el HumanMessage 
-                                     (HUMAN_JOIN_REPORT_PROMPT).
+            mode: "local" ensambla el informe sin LLM (ReportAssembler);
+                  "llm" lo redacta el editor GPT-4.1 con SYSTEM_JOIN_REPORT_PROMPT.
+            summary: En modo "local", añade un párrafo de resumen escrito por
+                     un modelo pequeño (única llamada al LLM del ensamblado).
         """
-        self.llm_client = LLMClientFactory.create_client(ModelProvider.OPENAI, config={"model":OpenAIModels.GPT_4_1.value})
+        self.mode = mode
+        self.summary = summary
+        self._llm_client = None
+        self._summary_client = None
+        self._assembler = None
         
         # 1. Almacenamos las plantillas recibidas
         self.system_prompt = SYSTEM_JOIN_REPORT_PROMPT
         self.human_prompt_template = HUMAN_JOIN_REPORT_PROMPT
 
-    def run(self, 
-            user_question: str, 
-            csv_context_data: str | None, 
-            reports: Dict[str, str]
-           ) -> str:
+    # Los clientes se crean al primer uso: en modo local sin resumen no se necesita ninguno
+    @property
+    def llm_client(self):
+        if self._llm_client is None:
+            self._llm_client = LLMClientFactory.create_client(ModelProvider.OPENAI, config={"model":OpenAIModels.GPT_4_1.value})
+        return self._llm_client
+
+    @property
+    def summary_client(self):
+        if self._summary_client is None:
+            self._summary_client = LLMClientFactory.create_client(
+                ModelProvider.OPENAI,
+                config={"model": OpenAIModels.GPT_CURRENT_USE.value, "max_tokens": 400, "temperature": 0.3},
+            )
+        return self._summary_client
+
+    @property
+    def assembler(self):
+        if self._assembler is None:
+            from app.services.data_load_service import DataLoadService
+            from app.services.report_assembly_service import ReportAssembler
+            frame = DataLoadService().load_frame(INTERANUAL_GROWTH_DATA_RELATIVE_PATH)
+            self._assembler = ReportAssembler(frame)
+        return self._assembler
+
+    def _summary_messages(self, user_question: str, reports: Dict[str, str]) -> list:
+        body = self.assembler.body(user_question, reports)
+        model = getattr(self.summary_client, "_model_name", None)
+        reserved = token_budget_manager.count(f"{SUMMARY_JOIN_REPORT_PROMPT}Pregunta del usuario: {user_question}\n\n", model)
+        body = token_budget_manager.fit_sections("join_summary", {"informe": body}, reserved_tokens=reserved, model=model)["informe"]
+        return [
+            SystemMessage(content=SUMMARY_JOIN_REPORT_PROMPT),
+            HumanMessage(content=f"Pregunta del usuario: {user_question}\n\n{body}"),
+        ]
+
+    def _assemble_local(self, user_question: str, reports: Dict[str, str], summary: Optional[str] = None) -> str:
+        print("--- Agente de Reporte ensamblador en ejecución (local) ---")
+        return self.assembler.assemble(user_question, reports, summary=summary)
+
+    def _build_messages(self,
+                        user_question: str,
+                        csv_context_data: str | None,
+                        reports: Dict[str, str]
+                       ) -> list:
         """
-        Ejecuta el agente ensamblador.
-        
-        Args:
-            user_question: La pregunta original del usuario.
-            csv_context_data: El string de los CSV originales (para metadatos).
-            reports: Un diccionario con los informes de los sub-agentes.
-                     Ej: {"gasto": "...", "industria": "..."}
+        Construye los mensajes (system + human) para el editor.
+        Lanza KeyError si la plantilla HUMAN_JOIN_REPORT_PROMPT no coincide.
         """
-        import time
-        start_time = time.time()
-
         print("--- Agente de Reporte ensamblador en ejecución ---")
 
         # DEBUG: Mostrar qué reports se reciben
@@ -150,12 +209,38 @@ class ReportCompletedAgent:
         print("="*60 + "\n")
 
         # 2. PREPARAR LOS DATOS PARA EL TEMPLATE
-        # Extrae los informes con un fallback para evitar errores
-        report_gasto = reports.get('gasto', 'No se proporcionó informe de gasto.')
-        report_industria = reports.get('industria', 'No se proporcionó informe de industria.')
-        report_sectors = reports.get('sectors', 'No se proporcionó informe sectorial.')
-        report_regimen = reports.get('regimen', 'No se proporcionó informe de régimen.')
-        report_growth_interanual = reports.get('growth_interanual', 'No se proporcionó informe de crecimiento interanual.')
+        # Extrae los informes con un fallback; las claves ausentes son analistas que el
+        # enrutador no ejecutó para esta pregunta
+        skipped = 'No aplica: la pregunta no requiere este análisis; omite esta sección.'
+        report_gasto = reports.get('gasto', skipped)
+        report_industria = reports.get('industria', skipped)
+        report_sectors = reports.get('sectors', skipped)
+        report_regimen = reports.get('regimen', skipped)
+        report_growth_interanual = reports.get('growth_interanual', skipped)
+
+        # Presupuesto de tokens del editor: plantilla vacía + contexto CSV reservados; los sub-reportes se ajustan
+        model = getattr(self.llm_client, "_model_name", None)
+        empty_template = self.human_prompt_template.format(
+            user_question=user_question, report_gasto='', report_industria='', report_sectors='',
+            report_regimen='', report_growth_interanual='', csv_context_data=csv_context_data or ''
+        )
+        fitted = token_budget_manager.fit_sections(
+            "join_report",
+            {
+                'gasto': report_gasto,
+                'industria': report_industria,
+                'sectors': report_sectors,
+                'regimen': report_regimen,
+                'growth_interanual': report_growth_interanual,
+            },
+            reserved_tokens=token_budget_manager.count(self.system_prompt + empty_template, model),
+            model=model,
+        )
+        report_gasto = fitted['gasto']
+        report_industria = fitted['industria']
+        report_sectors = fitted['sectors']
+        report_regimen = fitted['regimen']
+        report_growth_interanual = fitted['growth_interanual']
 
         print(f"📊 report_gasto: {len(report_gasto)} caracteres")
         print(f"📊 report_industria: {len(report_industria)} caracteres")
@@ -166,34 +251,28 @@ class ReportCompletedAgent:
 
         # 3. FORMATEAR EL MENSAJE HUMANO
         # Rellena la plantilla `HUMAN_JOIN_REPORT_PROMPT` con los datos
-        try:
-            human_message_content = self.human_prompt_template.format(
-                user_question=user_question,
-                report_gasto=report_gasto,
-                report_industria=report_industria,
-                report_sectors=report_sectors,
-                report_regimen=report_regimen,
-                report_growth_interanual=report_growth_interanual,
-                csv_context_data=csv_context_data or ''
-            )
-            print(f"✅ Template formateado correctamente: {len(human_message_content)} caracteres")
-        except KeyError as e:
-            print(f"❌ Error: Falta una clave en la plantilla HUMAN_JOIN_REPORT_PROMPT: {e}")
-            return f"Error de configuración del agente: falta la clave {e}"
+        human_message_content = self.human_prompt_template.format(
+            user_question=user_question,
+            report_gasto=report_gasto,
+            report_industria=report_industria,
+            report_sectors=report_sectors,
+            report_regimen=report_regimen,
+            report_growth_interanual=report_growth_interanual,
+            csv_context_data=csv_context_data or ''
+        )
+        print(f"✅ Template formateado correctamente: {len(human_message_content)} caracteres")
 
         # 4. CONSTRUIR LA LISTA DE MENSAJES
-        messages = [
+        return [
             SystemMessage(content=self.system_prompt),
             HumanMessage(content=human_message_content)
         ]
 
-        # 5. LLAMAR AL MÉTODO DE CHAT
-        print("Generando informe final...")
-        response = self.llm_client.generate_chat_response(messages)
+    def _log_response(self, response: str, start_time: float) -> None:
+        import time
         print(f"Informe final generado. Longitud: {len(response)} caracteres")
 
-        end_time = time.time()
-        elapsed = end_time - start_time
+        elapsed = time.time() - start_time
         print(f"⏱️ Tiempo total de ejecución del informe final: {elapsed:.2f} segundos")
 
         if not response or len(response.strip()) == 0:
@@ -201,4 +280,111 @@ class ReportCompletedAgent:
         elif len(response) < 50:
             print(f"⚠️  ADVERTENCIA: La respuesta es muy corta: {response}")
 
-        return response
\ No newline at end of file
+    def run(self, 
+            user_question: str, 
+            csv_context_data: str | None, 
+            reports: Dict[str, str]
+           ) -> str:
+        """
+        Ejecuta el agente ensamblador.
+        
+        Args:
+            user_question: La pregunta original del usuario.
+            csv_context_data: El string de los CSV originales (para metadatos).
+            reports: Un diccionario con los informes de los sub-agentes.
+                     Ej: {"gasto": "...", "industria": "..."}
+        """
+        import time
+        start_time = time.time()
+
+        if self.mode == "local":
+            summary = None
+            if self.summary:
+                summary = self.summary_client.generate_chat_response(self._summary_messages(user_question, reports))
+            response = self._assemble_local(user_question, reports, summary)
+            self._log_response(response, start_time)
+            return response
+
+        try:
+            messages = self._build_messages(user_question, csv_context_data, reports)
+        except KeyError as e:
+            print(f"❌ Error: Falta una clave en la plantilla HUMAN_JOIN_REPORT_PROMPT: {e}")
+            return f"Error de configuración del agente: falta la clave {e}"
+
+        # 5. LLAMAR AL MÉTODO DE CHAT
+        print("Generando informe final...")
+        response = self.llm_client.generate_chat_response(messages)
+        self._log_response(response, start_time)
+        return response
+
+    async def arun(self,
+                   user_question: str,
+                   csv_context_data: str | None,
+                   reports: Dict[str, str]
+                  ) -> str:
+        """Versión asíncrona de run (mismos argumentos)."""
+        import time
+        start_time = time.time()
+
+        if self.mode == "local":
+            summary = None
+            if self.summary:
+                messages = await asyncio.to_thread(self._summary_messages, user_question, reports)
+                summary = await self.summary_client.agenerate_chat_response(messages)
+            # El primer ensamblado carga el dataset de administraciones: fuera del event loop
+            response = await asyncio.to_thread(self._assemble_local, user_question, reports, summary)
+            self._log_response(response, start_time)
+            return response
+
+        try:
+            messages = await asyncio.to_thread(self._build_messages, user_question, csv_context_data, reports)
+        except KeyError as e:
+            print(f"❌ Error: Falta una clave en la plantilla HUMAN_JOIN_REPORT_PROMPT: {e}")
+            return f"Error de configuración del agente: falta la clave {e}"
+
+        print("Generando informe final...")
+        response = await self.llm_client.agenerate_chat_response(messages)
+        self._log_response(response, start_time)
+        return response
+
+    async def astream(self,
+                      user_question: str,
+                      csv_context_data: str | None,
+                      reports: Dict[str, str]
+                     ) -> AsyncIterator[str]:
+        """Igual que arun, pero emite el informe final por fragmentos a medida que se genera."""
+        import time
+        start_time = time.time()
+
+        if self.mode == "local":
+            # El resumen (si se pide) se emite token a token; el resto del informe de una vez
+            if not self.summary:
+                response = await asyncio.to_thread(self._assemble_local, user_question, reports)
+                yield response
+                self._log_response(response, start_time)
+                return
+            head = "## INFORME FINAL\n\n### Resumen\n"
+            yield head
+            chunks = []
+            messages = await asyncio.to_thread(self._summary_messages, user_question, reports)
+            async for chunk in self.summary_client.astream_chat_response(messages):
+                chunks.append(chunk)
+                yield chunk
+            tail = "\n\n" + await asyncio.to_thread(self.assembler.body, user_question, reports)
+            yield tail
+            self._log_response(head + "".join(chunks) + tail, start_time)
+            return
+
+        try:
+            messages = await asyncio.to_thread(self._build_messages, user_question, csv_context_data, reports)
+        except KeyError as e:
+            print(f"❌ Error: Falta una clave en la plantilla HUMAN_JOIN_REPORT_PROMPT: {e}")
+            yield f"Error de configuración del agente: falta la clave {e}"
+            return
+
+        print("Generando informe final (stream)...")
+        chunks = []
+        async for chunk in self.llm_client.astream_chat_response(messages):
+            chunks.append(chunk)
+            yield chunk
+        self._log_response("".join(chunks), start_time)
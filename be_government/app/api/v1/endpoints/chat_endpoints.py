@@ -1,8 +1,11 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+import json
 import time
 from app.services.chat_service import ChatService
 from app.dependencies import get_chat_service
-from app.models.chat_models import ChatRequest, ChatResponse
+from app.models.chat_models import ChatRequest, ChatResponse, NumericQueryResponse
 
 
 router = APIRouter()
@@ -15,7 +18,7 @@ async def chat_report(
 ):
     start_time = time.time()
     try:
-        response = chat_service.report_generation(chat_request.question)
+        response = await chat_service.areport_generation(chat_request.question)
         elapsed = time.time() - start_time
         print(f"⏱️ Tiempo total de ejecución del endpoint /report: {elapsed:.2f} segundos")
         return ChatResponse(response=response)
@@ -25,6 +28,51 @@ async def chat_report(
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
 
+def _sse(event: str, payload: dict) -> str:
+    """Formatea un evento Server-Sent Events."""
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+@router.post("/report/stream")
+async def chat_report_stream(
+    request: Request,
+    chat_request: ChatRequest,
+    chat_service: ChatService = Depends(get_chat_service)
+):
+    """
+    Variante en streaming (Server-Sent Events) de /report.
+    Emite un evento `section` por cada sub-reporte en cuanto su agente termina,
+    eventos `token` con el informe final del editor y un evento `done` al final.
+    """
+    async def event_stream():
+        start_time = time.time()
+        # Se conserva el generador para cerrarlo explícitamente: así se cancelan
+        # los agentes en curso en cuanto el cliente se va
+        agen = chat_service.astream_report_generation(chat_request.question)
+        try:
+            async for event in agen:
+                if await request.is_disconnected():
+                    print("⚠️ Cliente desconectado, se cancela el stream de /report")
+                    await agen.aclose()
+                    return
+                payload = {k: v for k, v in event.items() if k != "event"}
+                yield _sse(event["event"], payload)
+        except ValueError as ve:
+            yield _sse("error", {"detail": str(ve)})
+        except Exception as e:
+            yield _sse("error", {"detail": f"Internal server error: {e}"})
+        finally:
+            await agen.aclose()
+            elapsed = time.time() - start_time
+            print(f"⏱️ Tiempo total de ejecución del endpoint /report/stream: {elapsed:.2f} segundos")
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/general_information", response_model=ChatResponse)
 async def chat_general_information(
     request: Request,
@@ -33,11 +81,29 @@ async def chat_general_information(
 ):
     start_time = time.time()
     try:
-        response = chat_service.general_information(chat_request.question)
+        response = await chat_service.ageneral_information(chat_request.question)
         elapsed = time.time() - start_time
         print(f"⏱️ Tiempo total de ejecución del endpoint /general_information: {elapsed:.2f} segundos")
         return ChatResponse(response=response)
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
+@router.post("/query", response_model=NumericQueryResponse)
+async def chat_numeric_query(
+    request: Request,
+    chat_request: ChatRequest,
+    chat_service: ChatService = Depends(get_chat_service)
+):
+    """
+    Respuesta determinística (sin LLM) para preguntas numéricas por
+    administración. `answered` es False si la pregunta necesita /report.
+    """
+    start_time = time.perf_counter()
+    answer = await asyncio.to_thread(chat_service.answer_numeric, chat_request.question)
+    elapsed = (time.perf_counter() - start_time) * 1000
+    print(f"⏱️ Tiempo total de ejecución del endpoint /query: {elapsed:.2f} ms")
+    if answer is None:
+        return NumericQueryResponse(answered=False)
+    return NumericQueryResponse(answered=True, response=answer.to_text(), **answer.to_dict())
@@ -0,0 +1,140 @@
+# cached_llm_client.py
+import asyncio
+import hashlib
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage
+
+from app.clients.llm_client import LLMClient
+from app.services.response_cache_service import ResponseCache, get_response_cache
+
+# Marcador con el que los agentes separan el prompt de sistema de la pregunta del usuario
+QUESTION_MARKER = "Pregunta del usuario:"
+
+
+def _default_fingerprint() -> str:
+    from app.services.data_load_service import DataLoadService
+    return DataLoadService().datasets_fingerprint()
+
+
+class CachedLLMClient(LLMClient):
+    """
+    Decorador de LLMClient que consulta un ResponseCache antes de llamar al modelo.
+    La clave combina el modelo, el alcance del prompt (todo lo que precede a la
+    pregunta), la pregunta normalizada y la huella de los datasets pib_yoy_*.
+    Las respuestas de error no se guardan, ni los streams que fallan o se
+    interrumpen. En los métodos async la consulta y la escritura en sqlite
+    corren en un hilo para no bloquear el event loop.
+    """
+
+    def __init__(self,
+                 inner: LLMClient,
+                 cache: Optional[ResponseCache] = None,
+                 fingerprint_fn: Optional[Callable[[], str]] = None):
+        self.inner = inner
+        self.cache = cache if cache is not None else get_response_cache()
+        self.fingerprint_fn = fingerprint_fn or _default_fingerprint
+        self._model_name = getattr(inner, "_model_name", type(inner).__name__)
+
+    # ---------------------------
+    # Claves
+    # ---------------------------
+    @staticmethod
+    def _split_prompt(prompt: str) -> Tuple[str, str]:
+        scope, marker, question = prompt.rpartition(QUESTION_MARKER)
+        if not marker:
+            return "", prompt
+        return scope, question
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _prompt_key(self, prompt: str) -> Tuple[str, str]:
+        scope, question = self._split_prompt(prompt)
+        return self._hash(scope), question
+
+    def _messages_key(self, messages: List[BaseMessage]) -> Tuple[str, str]:
+        # Para chat, el alcance es el mensaje de sistema y la "pregunta" el resto de mensajes
+        scope = "\n".join(str(m.content) for m in messages[:1])
+        rest = "\n".join(f"{m.type}:{m.content}" for m in messages[1:])
+        return self._hash(scope), rest
+
+    @staticmethod
+    def _is_error(response) -> bool:
+        # Los clientes devuelven (o emiten como último fragmento) "Error..." en lugar de lanzar
+        return isinstance(response, str) and response.startswith("Error")
+
+    @classmethod
+    def _is_cacheable(cls, response) -> bool:
+        return isinstance(response, str) and bool(response.strip()) and not cls._is_error(response)
+
+    def _lookup(self, scope: str, question: str, semantic: bool) -> Tuple[Optional[str], str]:
+        fingerprint = self.fingerprint_fn()
+        cached = self.cache.get(self._model_name, scope, question, fingerprint, semantic=semantic)
+        if cached is not None:
+            print(f"⚡ Respuesta servida desde cache ({self._model_name})")
+        return cached, fingerprint
+
+    def _store(self, scope: str, question: str, fingerprint: str, response) -> None:
+        if self._is_cacheable(response):
+            self.cache.set(self._model_name, scope, question, fingerprint, response)
+
+    # ---------------------------
+    # Interfaz LLMClient
+    # ---------------------------
+    def generate_response(self, prompt: str) -> str:
+        scope, question = self._prompt_key(prompt)
+        cached, fingerprint = self._lookup(scope, question, semantic=True)
+        if cached is not None:
+            return cached
+        response = self.inner.generate_response(prompt)
+        self._store(scope, question, fingerprint, response)
+        return response
+
+    def generate_chat_response(self, messages: List[BaseMessage]) -> str:
+        scope, question = self._messages_key(messages)
+        cached, fingerprint = self._lookup(scope, question, semantic=False)
+        if cached is not None:
+            return cached
+        response = self.inner.generate_chat_response(messages)
+        self._store(scope, question, fingerprint, response)
+        return response
+
+    async def agenerate_response(self, prompt: str) -> str:
+        scope, question = self._prompt_key(prompt)
+        cached, fingerprint = await asyncio.to_thread(self._lookup, scope, question, True)
+        if cached is not None:
+            return cached
+        response = await self.inner.agenerate_response(prompt)
+        await asyncio.to_thread(self._store, scope, question, fingerprint, response)
+        return response
+
+    async def agenerate_chat_response(self, messages: List[BaseMessage]) -> str:
+        scope, question = self._messages_key(messages)
+        cached, fingerprint = await asyncio.to_thread(self._lookup, scope, question, False)
+        if cached is not None:
+            return cached
+        response = await self.inner.agenerate_chat_response(messages)
+        await asyncio.to_thread(self._store, scope, question, fingerprint, response)
+        return response
+
+    async def astream_chat_response(self, messages: List[BaseMessage]) -> AsyncIterator[str]:
+        scope, question = self._messages_key(messages)
+        cached, fingerprint = await asyncio.to_thread(self._lookup, scope, question, False)
+        if cached is not None:
+            yield cached
+            return
+        chunks = []
+        failed = False
+        async for chunk in self.inner.astream_chat_response(messages):
+            # El error llega como un fragmento más, después de lo ya emitido
+            failed = failed or self._is_error(chunk)
+            chunks.append(chunk)
+            yield chunk
+        # Solo se llega aquí si el stream terminó: una excepción o un aclose() del
+        # consumidor (cliente desconectado) salen antes y no se guarda nada
+        if failed:
+            print(f"⚠️  Stream con error, no se guarda en cache ({self._model_name})")
+            return
+        await asyncio.to_thread(self._store, scope, question, fingerprint, "".join(chunks))
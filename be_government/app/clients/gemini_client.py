@@ -1,6 +1,6 @@
 # gemini_client.py
 import os
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import (
     HumanMessage, 
@@ -141,93 +141,11 @@ class GeminiClient(LLMClient):
             print(f"  Enviando Prompt: '{prompt[:60]}...'")
 
             response: BaseMessage = self.client.invoke(messages)
-            
-            # Debug: información detallada de la respuesta
-            print(f"  🔍 DEBUG - Tipo de respuesta: {type(response)}")
-            print(f"  🔍 DEBUG - Es AIMessage: {isinstance(response, AIMessage)}")
-            
-            if isinstance(response, AIMessage):
-                content = response.content
-                print(f"  🔍 DEBUG - Tipo de content: {type(content)}")
-                print(f"  🔍 DEBUG - Content value: {repr(content)[:200]}")  # Primeros 200 caracteres
-                print(f"  🔍 DEBUG - Content length: {len(str(content)) if content else 0}")
-                
-                # Verificar metadatos adicionales de la respuesta
-                if hasattr(response, 'response_metadata'):
-                    print(f"  🔍 DEBUG - response_metadata: {response.response_metadata}")
-                if hasattr(response, 'usage_metadata'):
-                    print(f"  🔍 DEBUG - usage_metadata: {response.usage_metadata}")
-                if hasattr(response, 'additional_kwargs'):
-                    print(f"  🔍 DEBUG - additional_kwargs: {response.additional_kwargs}")
-                
-                # Listar todos los atributos disponibles
-                print(f"  🔍 DEBUG - Atributos disponibles: {[attr for attr in dir(response) if not attr.startswith('_')]}")
-                
-                # Si content es None, intentar otros atributos
-                if content is None:
-                    print("  ⚠️  Content es None, buscando otros atributos...")
-                    # Intentar acceder a otros atributos comunes
-                    if hasattr(response, 'text'):
-                        content = response.text
-                        print(f"  🔍 DEBUG - Usando response.text: {len(str(content)) if content else 0}")
-                    elif hasattr(response, 'message'):
-                        content = response.message
-                        print(f"  🔍 DEBUG - Usando response.message: {len(str(content)) if content else 0}")
-                
-                # Verificar si el contenido está vacío
-                if not content or (isinstance(content, str) and len(content.strip()) == 0):
-                    print("⚠️  ADVERTENCIA: La respuesta de Gemini está vacía")
-                    print(f"  🔍 DEBUG - Content completo: {repr(content)}")
-                    print(f"  ⚠️  Posibles causas:")
-                    print(f"     1. El modelo '{self._model_name}' podría no existir o no estar disponible")
-                    print(f"     2. El prompt podría estar causando que el modelo no responda")
-                    print(f"     3. Podría haber un bloqueo de seguridad del modelo")
-                    print(f"  💡 Sugerencia: Intenta cambiar el modelo a 'gemini-1.5-flash' o 'gemini-1.5-pro'")
-                    return "Error: La respuesta del modelo está vacía."
-                
-                # Si content es una lista, extraer el texto
-                if isinstance(content, list):
-                    print(f"  🔍 DEBUG - Content es una lista con {len(content)} elementos")
-                    text_parts = []
-                    for i, item in enumerate(content):
-                        print(f"  🔍 DEBUG - Item {i}: tipo={type(item)}, valor={repr(str(item)[:50])}")
-                        if isinstance(item, dict):
-                            text_parts.append(item.get('text', str(item)))
-                        elif isinstance(item, str):
-                            text_parts.append(item)
-                        else:
-                            text_parts.append(str(item))
-                    content = '\n'.join(text_parts)
-                    print(f"  🔍 DEBUG - Content después de procesar lista: {len(content)} caracteres")
-                
-                result = content if isinstance(content, str) else str(content)
-                print(f"  ✅ Respuesta final: {len(result)} caracteres")
-                return result
-            else:
-                print(f"  ⚠️  Respuesta no es AIMessage, tipo: {type(response)}")
-                result = str(response)
-                print(f"  ✅ Respuesta convertida a string: {len(result)} caracteres")
-                return result
+            return self._parse_response(response)
 
         except Exception as e:
-            error_msg = f"Error durante la llamada a LangChain: {e}"
-            print(f"  ❌ ERROR: {error_msg}")
-            print(f"  🔍 DEBUG - Tipo de excepción: {type(e).__name__}")
-            print(f"  🔍 DEBUG - Detalles del error: {str(e)}")
-            
-            # Detectar errores específicos de modelo no encontrado
-            if "404" in str(e) and "not found" in str(e).lower():
-                print(f"  ⚠️  El modelo '{self._model_name}' no está disponible")
-                print(f"  💡 Sugerencias:")
-                print(f"     1. Verifica que tu API key tenga acceso a este modelo")
-                print(f"     2. Intenta usar 'gemini-pro' (modelo legacy más compatible)")
-                print(f"     3. Verifica los modelos disponibles en: https://ai.google.dev/models")
-                print(f"     4. Puedes configurar el modelo en la inicialización del cliente")
-            
-            import traceback
-            print(f"  🔍 DEBUG - Traceback: {traceback.format_exc()}")
-            return error_msg
-            
+            return self._handle_response_error(e)
+
     def generate_chat_response(self, messages: List[BaseMessage]) -> str:
         """
         Genera una respuesta de chat más compleja.
@@ -240,41 +158,197 @@ class GeminiClient(LLMClient):
             print(f"\n[LangChain GeminiClient]: Conectando a {self._model_name}...")
             print(f"  Enviando {len(messages)} mensajes...")          
             response: BaseMessage = self.client.invoke(messages)
+            return self._parse_chat_response(response)
+
+        except Exception as e:
+            return self._handle_chat_response_error(e)
+
+    async def agenerate_response(self, prompt: str) -> str:
+        """
+        Versión asíncrona de generate_response usando ainvoke de LangChain.
+        """
+        if not self.api_key:
+            error_msg = "Error: Falta la API key de Google. No se puede conectar."
+            print(error_msg)
+            return error_msg
+
+        messages: List[BaseMessage] = [HumanMessage(content=prompt)]
+
+        try:
+            print(f"\n[LangChain GeminiClient async]: Conectando a {self._model_name}...")
+            print(f"  Enviando Prompt: '{prompt[:60]}...'")
+            response: BaseMessage = await self.client.ainvoke(messages)
+            return self._parse_response(response)
+
+        except Exception as e:
+            return self._handle_response_error(e)
+
+    async def agenerate_chat_response(self, messages: List[BaseMessage]) -> str:
+        """
+        Versión asíncrona de generate_chat_response usando ainvoke de LangChain.
+        """
+        if not self.api_key:
+            return "Error: Falta la API key de Google."
+
+        try:
+            print(f"\n[LangChain GeminiClient async]: Conectando a {self._model_name}...")
+            print(f"  Enviando {len(messages)} mensajes...")
+            response: BaseMessage = await self.client.ainvoke(messages)
+            return self._parse_chat_response(response)
+
+        except Exception as e:
+            return self._handle_chat_response_error(e)
+
+    async def astream_chat_response(self, messages: List[BaseMessage]) -> AsyncIterator[str]:
+        """
+        Emite la respuesta de chat por fragmentos usando astream de LangChain.
+        """
+        if not self.api_key:
+            yield "Error: Falta la API key de Google."
+            return
+
+        try:
+            print(f"\n[LangChain GeminiClient stream]: Conectando a {self._model_name}...")
+            print(f"  Enviando {len(messages)} mensajes...")
+            async for chunk in self.client.astream(messages):
+                content = chunk.content
+                # Algunos modelos devuelven el contenido como lista de partes
+                if isinstance(content, list):
+                    content = ''.join(
+                        item.get('text', '') if isinstance(item, dict) else str(item)
+                        for item in content
+                    )
+                if content:
+                    yield content
+
+        except Exception as e:
+            yield self._handle_chat_response_error(e)
+
+    def _parse_response(self, response: BaseMessage) -> str:
+        """Extrae el texto de la respuesta de Gemini (con diagnóstico detallado)."""
+        # Debug: información detallada de la respuesta
+        print(f"  🔍 DEBUG - Tipo de respuesta: {type(response)}")
+        print(f"  🔍 DEBUG - Es AIMessage: {isinstance(response, AIMessage)}")
+        
+        if isinstance(response, AIMessage):
+            content = response.content
+            print(f"  🔍 DEBUG - Tipo de content: {type(content)}")
+            print(f"  🔍 DEBUG - Content value: {repr(content)[:200]}")  # Primeros 200 caracteres
+            print(f"  🔍 DEBUG - Content length: {len(str(content)) if content else 0}")
             
-            # Debug: imprimir tipo de respuesta
-            print(f"  Tipo de respuesta: {type(response)}")
+            # Verificar metadatos adicionales de la respuesta
+            if hasattr(response, 'response_metadata'):
+                print(f"  🔍 DEBUG - response_metadata: {response.response_metadata}")
+            if hasattr(response, 'usage_metadata'):
+                print(f"  🔍 DEBUG - usage_metadata: {response.usage_metadata}")
+            if hasattr(response, 'additional_kwargs'):
+                print(f"  🔍 DEBUG - additional_kwargs: {response.additional_kwargs}")
             
-            if isinstance(response, AIMessage):
-                content = response.content
-                print(f"  Contenido extraído: {len(content) if content else 0} caracteres")
-                
-                # Verificar si el contenido está vacío o es solo whitespace
-                if not content or (isinstance(content, str) and len(content.strip()) == 0):
-                    print("⚠️  ADVERTENCIA: La respuesta de Gemini está vacía o solo contiene whitespace")
-                    return "Error: La respuesta del modelo está vacía."
-                
-                # Si content es una lista (algunos modelos devuelven listas), extraer el texto
-                if isinstance(content, list):
-                    print(f"  Contenido es una lista con {len(content)} elementos")
-                    # Intentar extraer texto de la lista
-                    text_parts = []
-                    for item in content:
-                        if isinstance(item, dict):
-                            text_parts.append(item.get('text', str(item)))
-                        elif isinstance(item, str):
-                            text_parts.append(item)
-                        else:
-                            text_parts.append(str(item))
-                    content = '\n'.join(text_parts)
-                    print(f"  Contenido extraído de lista: {len(content)} caracteres")
-                
-                return content if isinstance(content, str) else str(content)
-            else:
-                print(f"  Respuesta no es AIMessage, convirtiendo a string")
-                return str(response)
+            # Listar todos los atributos disponibles
+            print(f"  🔍 DEBUG - Atributos disponibles: {[attr for attr in dir(response) if not attr.startswith('_')]}")
+            
+            # Si content es None, intentar otros atributos
+            if content is None:
+                print("  ⚠️  Content es None, buscando otros atributos...")
+                # Intentar acceder a otros atributos comunes
+                if hasattr(response, 'text'):
+                    content = response.text
+                    print(f"  🔍 DEBUG - Usando response.text: {len(str(content)) if content else 0}")
+                elif hasattr(response, 'message'):
+                    content = response.message
+                    print(f"  🔍 DEBUG - Usando response.message: {len(str(content)) if content else 0}")
+            
+            # Verificar si el contenido está vacío
+            if not content or (isinstance(content, str) and len(content.strip()) == 0):
+                print("⚠️  ADVERTENCIA: La respuesta de Gemini está vacía")
+                print(f"  🔍 DEBUG - Content completo: {repr(content)}")
+                print(f"  ⚠️  Posibles causas:")
+                print(f"     1. El modelo '{self._model_name}' podría no existir o no estar disponible")
+                print(f"     2. El prompt podría estar causando que el modelo no responda")
+                print(f"     3. Podría haber un bloqueo de seguridad del modelo")
+                print(f"  💡 Sugerencia: Intenta cambiar el modelo a 'gemini-1.5-flash' o 'gemini-1.5-pro'")
+                return "Error: La respuesta del modelo está vacía."
+            
+            # Si content es una lista, extraer el texto
+            if isinstance(content, list):
+                print(f"  🔍 DEBUG - Content es una lista con {len(content)} elementos")
+                text_parts = []
+                for i, item in enumerate(content):
+                    print(f"  🔍 DEBUG - Item {i}: tipo={type(item)}, valor={repr(str(item)[:50])}")
+                    if isinstance(item, dict):
+                        text_parts.append(item.get('text', str(item)))
+                    elif isinstance(item, str):
+                        text_parts.append(item)
+                    else:
+                        text_parts.append(str(item))
+                content = '\n'.join(text_parts)
+                print(f"  🔍 DEBUG - Content después de procesar lista: {len(content)} caracteres")
+            
+            result = content if isinstance(content, str) else str(content)
+            print(f"  ✅ Respuesta final: {len(result)} caracteres")
+            return result
+        else:
+            print(f"  ⚠️  Respuesta no es AIMessage, tipo: {type(response)}")
+            result = str(response)
+            print(f"  ✅ Respuesta convertida a string: {len(result)} caracteres")
+            return result
+
+    def _handle_response_error(self, e: Exception) -> str:
+        """Registra el error de la llamada a Gemini y devuelve el mensaje de error."""
+        error_msg = f"Error durante la llamada a LangChain: {e}"
+        print(f"  ❌ ERROR: {error_msg}")
+        print(f"  🔍 DEBUG - Tipo de excepción: {type(e).__name__}")
+        print(f"  🔍 DEBUG - Detalles del error: {str(e)}")
         
-        except Exception as e:
-            error_msg = f"Error durante la llamada a LangChain: {e}"
-            print(f"  ❌ {error_msg}")
-            return error_msg
+        # Detectar errores específicos de modelo no encontrado
+        if "404" in str(e) and "not found" in str(e).lower():
+            print(f"  ⚠️  El modelo '{self._model_name}' no está disponible")
+            print(f"  💡 Sugerencias:")
+            print(f"     1. Verifica que tu API key tenga acceso a este modelo")
+            print(f"     2. Intenta usar 'gemini-pro' (modelo legacy más compatible)")
+            print(f"     3. Verifica los modelos disponibles en: https://ai.google.dev/models")
+            print(f"     4. Puedes configurar el modelo en la inicialización del cliente")
+        
+        import traceback
+        print(f"  🔍 DEBUG - Traceback: {traceback.format_exc()}")
+        return error_msg
+
+    def _parse_chat_response(self, response: BaseMessage) -> str:
+        """Extrae el texto de una respuesta de chat de Gemini."""
+        # Debug: imprimir tipo de respuesta
+        print(f"  Tipo de respuesta: {type(response)}")
+        
+        if isinstance(response, AIMessage):
+            content = response.content
+            print(f"  Contenido extraído: {len(content) if content else 0} caracteres")
+            
+            # Verificar si el contenido está vacío o es solo whitespace
+            if not content or (isinstance(content, str) and len(content.strip()) == 0):
+                print("⚠️  ADVERTENCIA: La respuesta de Gemini está vacía o solo contiene whitespace")
+                return "Error: La respuesta del modelo está vacía."
+            
+            # Si content es una lista (algunos modelos devuelven listas), extraer el texto
+            if isinstance(content, list):
+                print(f"  Contenido es una lista con {len(content)} elementos")
+                # Intentar extraer texto de la lista
+                text_parts = []
+                for item in content:
+                    if isinstance(item, dict):
+                        text_parts.append(item.get('text', str(item)))
+                    elif isinstance(item, str):
+                        text_parts.append(item)
+                    else:
+                        text_parts.append(str(item))
+                content = '\n'.join(text_parts)
+                print(f"  Contenido extraído de lista: {len(content)} caracteres")
+            
+            return content if isinstance(content, str) else str(content)
+        else:
+            print(f"  Respuesta no es AIMessage, convirtiendo a string")
+            return str(response)
 
+    def _handle_chat_response_error(self, e: Exception) -> str:
+        """Registra el error de la llamada de chat a Gemini y devuelve el mensaje de error."""
+        error_msg = f"Error durante la llamada a LangChain: {e}"
+        print(f"  ❌ {error_msg}")
+        return error_msg
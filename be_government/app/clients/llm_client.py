@@ -1,6 +1,7 @@
+import asyncio
 import os
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 from langchain_core.messages import (
     BaseMessage, 
 )
@@ -25,7 +26,27 @@ class LLMClient(ABC):
     def generate_chat_response(self, messages: List[BaseMessage] ) -> str | list[str | dict]:
         """Genera una respuesta basada en varios  prompts."""
         pass
-        
+
+    async def agenerate_response(self, prompt: str) -> str:
+        """
+        Versión asíncrona de generate_response.
+        Por defecto delega la llamada bloqueante a un hilo para no congelar el
+        event loop; los clientes concretos la sobreescriben con una llamada nativa.
+        """
+        return await asyncio.to_thread(self.generate_response, prompt)
+
+    async def agenerate_chat_response(self, messages: List[BaseMessage]) -> str | list[str | dict]:
+        """Versión asíncrona de generate_chat_response (mismo fallback a hilo)."""
+        return await asyncio.to_thread(self.generate_chat_response, messages)
+
+    async def astream_chat_response(self, messages: List[BaseMessage]) -> AsyncIterator[str]:
+        """
+        Genera la respuesta de chat como un flujo de fragmentos de texto.
+        Por defecto emite la respuesta completa en un solo fragmento; los clientes
+        concretos la sobreescriben para emitir los tokens a medida que llegan.
+        """
+        yield await self.agenerate_chat_response(messages)
+
 
 
 # --- 2. Fábrica (El Creador) ---
@@ -39,7 +60,8 @@ class LLMClientFactory:
     @staticmethod
     def create_client(
         provider: ModelProvider, 
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        use_cache: Optional[bool] = None
     ) -> LLMClient:
         """
         Crea y devuelve un cliente LLM basado en el proveedor.
@@ -48,6 +70,8 @@ class LLMClientFactory:
             provider: El ModelProvider (ej. ModelProvider.OPENAI).
             config: Un diccionario opcional para sobreescribir la 
                     configuración por defecto del cliente.
+            use_cache: Si es True, envuelve el cliente en un CachedLLMClient.
+                       Por defecto usa LLM_CACHE_ENABLED de la configuración.
 
         Returns:
             Una instancia de un cliente que cumple con la interfaz LLMClient.
@@ -55,6 +79,21 @@ class LLMClientFactory:
         Raises:
             ValueError: Si el proveedor no está soportado.
         """
+        client = LLMClientFactory._create_provider_client(provider, config)
+
+        if use_cache is None:
+            from app.core.config import LLM_CACHE_ENABLED
+            use_cache = LLM_CACHE_ENABLED
+        if use_cache:
+            from .cached_llm_client import CachedLLMClient
+            return CachedLLMClient(client)
+        return client
+
+    @staticmethod
+    def _create_provider_client(
+        provider: ModelProvider,
+        config: Optional[Dict[str, Any]] = None
+    ) -> LLMClient:
         
         if provider == ModelProvider.OPENAI:
             try:
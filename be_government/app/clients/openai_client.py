@@ -1,6 +1,6 @@
 # openai_client.py
 import os
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import (
     HumanMessage, 
@@ -113,4 +113,69 @@ class OpenAIClient(LLMClient):
                 return str(response)
         
         except Exception as e:
-            return f"Error durante la llamada a LangChain: {e}"
\ No newline at end of file
+            return f"Error durante la llamada a LangChain: {e}"
+
+    async def agenerate_response(self, prompt: str) -> str:
+        """
+        Versión asíncrona de generate_response usando ainvoke de LangChain.
+        No bloquea el event loop mientras espera a la API de OpenAI.
+        """
+        if not self.api_key:
+            error_msg = "Error: Falta la API key de OpenAI. No se puede conectar."
+            print(error_msg)
+            return error_msg
+
+        messages: List[BaseMessage] = [HumanMessage(content=prompt)]
+
+        try:
+            print(f"\n[LangChain OpenAIClient async]: Conectando a {self._model_name}...")
+            print(f"  Enviando Prompt: '{prompt[:60]}...'")
+
+            response: BaseMessage = await self.client.ainvoke(messages)
+
+            if isinstance(response, AIMessage):
+                return response.content
+            else:
+                return str(response)
+
+        except Exception as e:
+            error_msg = f"Error durante la llamada a LangChain: {e}"
+            print(error_msg)
+            return error_msg
+
+    async def agenerate_chat_response(self, messages: List[BaseMessage]) -> str:
+        """
+        Versión asíncrona de generate_chat_response usando ainvoke de LangChain.
+        """
+        if not self.api_key:
+            return "Error: Falta la API key de OpenAI."
+
+        try:
+            print(f"\n[LangChain OpenAIClient async]: Conectando a {self._model_name}...")
+            print(f"  Enviando {len(messages)} mensajes...")
+            response: BaseMessage = await self.client.ainvoke(messages)
+            if isinstance(response, AIMessage):
+                return response.content
+            else:
+                return str(response)
+
+        except Exception as e:
+            return f"Error durante la llamada a LangChain: {e}"
+
+    async def astream_chat_response(self, messages: List[BaseMessage]) -> AsyncIterator[str]:
+        """
+        Emite la respuesta de chat token a token usando astream de LangChain.
+        """
+        if not self.api_key:
+            yield "Error: Falta la API key de OpenAI."
+            return
+
+        try:
+            print(f"\n[LangChain OpenAIClient stream]: Conectando a {self._model_name}...")
+            print(f"  Enviando {len(messages)} mensajes...")
+            async for chunk in self.client.astream(messages):
+                if chunk.content:
+                    yield chunk.content
+
+        except Exception as e:
+            yield f"Error durante la llamada a LangChain: {e}"
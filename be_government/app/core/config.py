@@ -12,9 +12,40 @@ DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 TOKEN_LIMIT = int(os.getenv("TOKEN_LIMIT", 4096))
+# Presupuestos de tokens de entrada (prompt completo) por tipo de agente
+TOKEN_BUDGET_ENABLED = os.getenv("TOKEN_BUDGET_ENABLED", "true").lower() in ("1", "true", "yes")
+TOKEN_BUDGET_REPORT_AGENT = int(os.getenv("TOKEN_BUDGET_REPORT_AGENT", 12000))
+TOKEN_BUDGET_GENERAL_INFORMATION = int(os.getenv("TOKEN_BUDGET_GENERAL_INFORMATION", 16000))
+TOKEN_BUDGET_JOIN_REPORT = int(os.getenv("TOKEN_BUDGET_JOIN_REPORT", 16000))
+TOKEN_BUDGET_MIN_CONTEXT = int(os.getenv("TOKEN_BUDGET_MIN_CONTEXT", 500))  # mínimo por dataset aunque la plantilla agote el presupuesto
 SPENT_DATA_RELATIVE_PATH = os.getenv("SPENT_DATA_RELATIVE_PATH", "data/datasets/pib_yoy_componentes_gasto.txt")
 INDUSTRY_DATA_RELATIVE_PATH = os.getenv("INDUSTRY_DATA_RELATIVE_PATH", "data/datasets/pib_yoy_industrias.txt")
 REGIMEN_DATA_RELATIVE_PATH = os.getenv("REGIMEN_DATA_RELATIVE_PATH", "data/datasets/pib_yoy_regimen.txt")
 SECTORS_DATA_RELATIVE_PATH = os.getenv("SECTORS_DATA_RELATIVE_PATH", "data/datasets/pib_yoy_sectores.txt")
 INTERANUAL_GROWTH_DATA_RELATIVE_PATH = os.getenv("INTERANUAL_GROWTH_DATA_RELATIVE_PATH", "data/datasets/pib_yoy.txt")
-GENERAL_INFORMATION_DATA_RELATIVE_PATH = os.getenv("GENERAL_INFORMATION_DATA_RELATIVE_PATH", "data/raw/Variables_PIB_TCV2.xlsx")
\ No newline at end of file
+GENERAL_INFORMATION_DATA_RELATIVE_PATH = os.getenv("GENERAL_INFORMATION_DATA_RELATIVE_PATH", "data/raw/Variables_PIB_TCV2.xlsx")
+WARM_UP_ON_STARTUP = os.getenv("WARM_UP_ON_STARTUP", "true").lower() in ("1", "true", "yes")  # solo sirve porque DataLoadService comparte un DatasetCache
+REPORT_AGENTS_MAX_CONCURRENCY = int(os.getenv("REPORT_AGENTS_MAX_CONCURRENCY", 5))
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "data/cache/llm_responses.sqlite3")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 1000))
+LLM_CACHE_SEMANTIC_ENABLED = os.getenv("LLM_CACHE_SEMANTIC_ENABLED", "false").lower() in ("1", "true", "yes")
+LLM_CACHE_SEMANTIC_THRESHOLD = float(os.getenv("LLM_CACHE_SEMANTIC_THRESHOLD", 0.95))
+LLM_CACHE_VERSION = os.getenv("LLM_CACHE_VERSION", "1")  # se combina con la huella de app/prompts; subirlo invalida el cache a mano
+CONTEXT_PRUNING_ENABLED = os.getenv("CONTEXT_PRUNING_ENABLED", "true").lower() in ("1", "true", "yes")
+REPORT_CONTEXT_MODE = os.getenv("REPORT_CONTEXT_MODE", "stats").lower()  # "stats" | "raw"
+# "grouped" es el formato con menos tokens en los cinco datasets (~9k frente a ~35k del texto original);
+# se comprueba con `python script.py encodings`
+CONTEXT_ENCODING = os.getenv("CONTEXT_ENCODING", "grouped").lower()  # "raw" (texto original) | "csv" | "grouped" | "markdown" | "blocks"
+CONTEXT_PRECISION = int(os.getenv("CONTEXT_PRECISION", 2))  # decimales de las filas y de las estadísticas del contexto
+PARQUET_STORE_DIR = os.getenv("PARQUET_STORE_DIR", "data/parquet")
+PARQUET_SYNC_ON_STARTUP = os.getenv("PARQUET_SYNC_ON_STARTUP", "true").lower() in ("1", "true", "yes")  # escribe las copias Parquet que falten al precalentar
+EXCEL_ENGINE = os.getenv("EXCEL_ENGINE", "")  # "calamine", "openpyxl", "default" o vacío (auto)
+EXCEL_INGEST_WORKERS = int(os.getenv("EXCEL_INGEST_WORKERS", 0))  # 0 = os.cpu_count()
+EXCEL_INGEST_CACHE_DIR = os.getenv("EXCEL_INGEST_CACHE_DIR", "data/cache/ingest")
+REPORT_JOIN_MODE = os.getenv("REPORT_JOIN_MODE", "local").lower()  # "local" (ensamblado sin LLM) | "llm"
+REPORT_JOIN_SUMMARY = os.getenv("REPORT_JOIN_SUMMARY", "false").lower() in ("1", "true", "yes")
+QUESTION_ROUTER_ENABLED = os.getenv("QUESTION_ROUTER_ENABLED", "true").lower() in ("1", "true", "yes")
+QUESTION_ROUTER_MODEL_ENABLED = os.getenv("QUESTION_ROUTER_MODEL_ENABLED", "false").lower() in ("1", "true", "yes")
+NUMERIC_FAST_PATH_ENABLED = os.getenv("NUMERIC_FAST_PATH_ENABLED", "true").lower() in ("1", "true", "yes")
@@ -1,5 +1,48 @@
+import threading
+from typing import Optional
+
 from app.services.chat_service import ChatService
 from fastapi import Depends
 
+
+class ServiceContainer:
+    """
+    Contenedor de servicios con el ciclo de vida de la aplicación.
+    Construye una única instancia de ChatService (pipelines compilados,
+    agentes y clientes LLM) y la comparte entre todas las peticiones.
+    """
+
+    def __init__(self):
+        self._chat_service: Optional[ChatService] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._chat_service is not None
+
+    def startup(self, warm_up: bool = False) -> None:
+        """Construye los servicios una sola vez y, opcionalmente, los precalienta."""
+        chat_service = self.get_chat_service()
+        if warm_up:
+            chat_service.warm_up()
+
+    def shutdown(self) -> None:
+        """Libera los servicios; la siguiente petición los reconstruye."""
+        with self._lock:
+            self._chat_service = None
+
+    def get_chat_service(self) -> ChatService:
+        # Construcción perezosa con doble verificación por si el lifespan no se ejecutó
+        if self._chat_service is None:
+            with self._lock:
+                if self._chat_service is None:
+                    print("--- Construyendo ChatService (una vez por proceso) ---")
+                    self._chat_service = ChatService()
+        return self._chat_service
+
+
+container = ServiceContainer()
+
+
 def get_chat_service():
-    return ChatService()
+    return container.get_chat_service()
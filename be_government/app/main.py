@@ -1,11 +1,26 @@
 from dotenv import load_dotenv
 load_dotenv()
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.endpoints.__init__ import api_router
+from app.core.config import WARM_UP_ON_STARTUP
+from app.dependencies import container
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Construye los servicios una sola vez al arrancar y los libera al apagar.
+    Los handlers reutilizan los grafos compilados y los clientes LLM.
+    """
+    container.startup(warm_up=WARM_UP_ON_STARTUP)
+    app.state.container = container
+    yield
+    container.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "http://localhost:3000",
@@ -1,7 +1,17 @@
+from typing import Dict, List, Optional
+
 from pydantic import BaseModel
 
 class ChatRequest(BaseModel):
     question: str
 
 class ChatResponse(BaseModel):
-    response: str
\ No newline at end of file
+    response: str
+
+class NumericQueryResponse(BaseModel):
+    answered: bool
+    response: Optional[str] = None
+    statistic: Optional[str] = None
+    variable: Optional[str] = None
+    dataset: Optional[str] = None
+    rows: List[Dict] = []
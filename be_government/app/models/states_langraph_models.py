@@ -1,4 +1,9 @@
-from typing import TypedDict
+from typing import Annotated, TypedDict
+
+
+def merge_dicts(left: dict, right: dict) -> dict:
+    """Reducer para claves escritas en paralelo por varios nodos del grafo."""
+    return {**(left or {}), **(right or {})}
 
 
 class GeneralInformationState(TypedDict):
@@ -11,8 +16,10 @@ class ReportState(TypedDict):
     question: str = ""
     response: str = ""
     context: dict = {}  # Changed to dict to match usage
+    agents: list = []  # Analysts chosen by the question router (empty = all)
     spent_response: str = ""  # Store spent agent response
     industry_response: str = ""  # Store industry agent response
     regimen_response: str = ""  # Store regimen agent response
     sectors_response: str = ""  # Store sectors agent response
-    growth_interanual_response: str = ""  # Store growth_interanual agent response
\ No newline at end of file
+    growth_interanual_response: str = ""  # Store growth_interanual agent response
+    agent_timings: Annotated[dict, merge_dicts]  # Seconds spent by each analyst agent
@@ -1,5 +1,6 @@
 from typing import TypedDict
 from langgraph.graph import StateGraph, END
+from langchain_core.runnables import RunnableLambda
 from app.agents.general_information_agents import GeneralInformationAgent
 from app.models.states_langraph_models import GeneralInformationState
 
@@ -7,8 +8,11 @@ class GeneralInformationPipeline:
     def __init__(self):
         self.general_information_agent = GeneralInformationAgent()
         workflow = StateGraph(GeneralInformationState)
-        # Use lambda to capture which agent to use for each node
-        workflow.add_node("agent_general_information_node", lambda state: self._call_agent(state, "agent_general_information_node"))
+        # Sync and async implementations so the graph works with invoke and ainvoke
+        workflow.add_node("agent_general_information_node", RunnableLambda(
+            lambda state: self._call_agent(state, "agent_general_information_node"),
+            afunc=self._acall_general_information_agent,
+        ))
         workflow.add_node("start", lambda state: state)
         workflow.set_entry_point("start")
         workflow.add_edge("start", "agent_general_information_node")
@@ -25,10 +29,22 @@ class GeneralInformationPipeline:
         context = state["context"]
         #general_information_agent_context = context.get("general_information_agent", "")
         response = self.general_information_agent.run(question, context=context)
-        return {"response": response}      
+        return {"response": response}
+
+    async def _acall_general_information_agent(self, state: GeneralInformationState):
+        """Async counterpart of _call_agent used when the graph runs with ainvoke."""
+        print("--- Agente de Reporte (agent_general_information_node) en ejecución (Langgraph async) ---")
+        response = await self.general_information_agent.arun(state["question"], context=state["context"])
+        return {"response": response}
 
     def run(self, question: str, context: dict = {}): # Add context parameter here
         print("--- Pipeline de Reporte en ejecución (Langgraph) ---")
         initial_state = GeneralInformationState(question=question, context=context)
         final_state = self.app.invoke(initial_state)
         return final_state["response"]
+
+    async def arun(self, question: str, context: dict = {}):
+        print("--- Pipeline de Reporte en ejecución (Langgraph async) ---")
+        initial_state = GeneralInformationState(question=question, context=context)
+        final_state = await self.app.ainvoke(initial_state)
+        return final_state["response"]
@@ -1,10 +1,17 @@
+import time
 from langgraph.graph import StateGraph, END
+from langchain_core.runnables import RunnableLambda
+from langgraph.config import get_stream_writer
+from typing import AsyncIterator, List, Optional
 from app.agents.report_agents import ReportCompletedAgent, ReportGrowthInteranualAgent, ReportRegimenAgent, ReportSectorsAgent, ReportSpentAgent, ReportIndustryAgent
 from app.models.enums.ai_agent_enums import AgentType
 from app.models.states_langraph_models import ReportState
+from app.core.config import REPORT_AGENTS_MAX_CONCURRENCY
 
 class ReportPipeline:
-    def __init__(self):
+    def __init__(self, max_concurrency: int = REPORT_AGENTS_MAX_CONCURRENCY):
+        # Maximum number of analyst agents running at the same time within one report
+        self.max_concurrency = max(1, int(max_concurrency))
         self.report_spent_agent = ReportSpentAgent()
         self.report_industry_agent = ReportIndustryAgent()
         self.report_regimen_agent = ReportRegimenAgent()
@@ -13,21 +20,17 @@ class ReportPipeline:
         self.complete_agent = ReportCompletedAgent()
 
         workflow = StateGraph(ReportState)
-        # Use lambda to capture which agent to use for each node
-        workflow.add_node("agent_spent_node", lambda state: self._call_agent(state, "spent"))
-        workflow.add_node("agent_industry_node", lambda state: self._call_agent(state, "industry"))
-        workflow.add_node("agent_regimen_node", lambda state: self._call_agent(state, "regimen"))
-        workflow.add_node("agent_sectors_node", lambda state: self._call_agent(state, "sectors"))
-        workflow.add_node("agent_growth_interanual_node", lambda state: self._call_agent(state, "growth_interanual"))
-        workflow.add_node("agent_completed_node", lambda state: self._call_agent(state, "completed"))
+        # Each node has a sync and an async implementation so the graph works with invoke and ainvoke
+        workflow.add_node("agent_spent_node", self._node(AgentType.SPENT.value))
+        workflow.add_node("agent_industry_node", self._node(AgentType.INDUSTRY.value))
+        workflow.add_node("agent_regimen_node", self._node(AgentType.REGIMEN.value))
+        workflow.add_node("agent_sectors_node", self._node(AgentType.SECTORS.value))
+        workflow.add_node("agent_growth_interanual_node", self._node(AgentType.GROWTH_INTERANUAL.value))
+        workflow.add_node("agent_completed_node", self._node(AgentType.COMPLETED.value))
         workflow.add_node("start", lambda state: state)
         workflow.set_entry_point("start")
-        # Agents execute in parallel from start
-        workflow.add_edge("start", "agent_spent_node")
-        workflow.add_edge("start", "agent_industry_node")
-        workflow.add_edge("start", "agent_regimen_node")
-        workflow.add_edge("start", "agent_sectors_node")
-        workflow.add_edge("start", "agent_growth_interanual_node")
+        # The routed analysts execute in parallel from start (all of them when no route is given)
+        workflow.add_conditional_edges("start", self._select_agents, list(self._agent_nodes().values()))
 
         workflow.add_edge("agent_spent_node", "agent_completed_node")
         workflow.add_edge("agent_industry_node", "agent_completed_node")
@@ -38,17 +41,31 @@ class ReportPipeline:
         workflow.add_edge("agent_completed_node", END)
         self.app = workflow.compile()
 
-    def _call_agent(self, state: ReportState, agent_type: str):
-        """
-        Generic method to call the appropriate agent based on agent_type.
-        This keeps the pattern of a single _call_agent method while being scalable.
-        """
-        print(f"--- Agente de Reporte ({agent_type}) en ejecución (Langgraph) ---")
-        question = state["question"]
-        context = state.get("context", {})
+    def _node(self, agent_type: str) -> RunnableLambda:
+        """Builds a graph node bound to agent_type with both sync and async entry points."""
+        async def _acall(state: ReportState):
+            return await self._acall_agent(state, agent_type)
+        return RunnableLambda(lambda state: self._call_agent(state, agent_type), afunc=_acall)
+
+    @staticmethod
+    def _agent_nodes() -> dict:
+        return {
+            AgentType.SPENT.value: "agent_spent_node",
+            AgentType.INDUSTRY.value: "agent_industry_node",
+            AgentType.REGIMEN.value: "agent_regimen_node",
+            AgentType.SECTORS.value: "agent_sectors_node",
+            AgentType.GROWTH_INTERANUAL.value: "agent_growth_interanual_node",
+        }
 
+    def _select_agents(self, state: ReportState) -> List[str]:
+        """Conditional edge from start: graph nodes of the analysts chosen for this question."""
+        nodes = self._agent_nodes()
+        agents = [agent for agent in (state.get("agents") or []) if agent in nodes]
+        return [nodes[agent] for agent in agents] if agents else list(nodes.values())
+
+    def _agent_map(self):
         # Mapeo de agentes y claves de respuesta
-        agent_map = [
+        return [
             (AgentType.SPENT.value, self.report_spent_agent, "spent_response"),
             (AgentType.INDUSTRY.value, self.report_industry_agent, "industry_response"),
             (AgentType.REGIMEN.value, self.report_regimen_agent, "regimen_response"),
@@ -56,39 +73,143 @@ class ReportPipeline:
             (AgentType.GROWTH_INTERANUAL.value, self.report_growth_interanual_agent, "growth_interanual_response"),
         ]
 
-        for key, agent, response_key in agent_map:
+    def _collect_reports(self, state: ReportState) -> dict:
+        # Report keys expected by ReportCompletedAgent; analysts that were not routed are left out
+        report_keys = {
+            AgentType.SPENT.value: "gasto",
+            AgentType.INDUSTRY.value: "industria",
+            AgentType.REGIMEN.value: "regimen",
+            AgentType.SECTORS.value: "sectors",
+            AgentType.GROWTH_INTERANUAL.value: "growth_interanual",
+        }
+        reports = {}
+        for key, agent, response_key in self._agent_map():
+            if response_key in state:
+                reports[report_keys[key]] = state.get(response_key, "")
+                print(f"REPORTE DE {key}: {state.get(response_key, '')}")
+        return reports
+
+    def _call_agent(self, state: ReportState, agent_type: str):
+        """
+        Generic method to call the appropriate agent based on agent_type.
+        This keeps the pattern of a single _call_agent method while being scalable.
+        """
+        print(f"--- Agente de Reporte ({agent_type}) en ejecución (Langgraph) ---")
+        question = state["question"]
+        context = state.get("context", {})
+
+        for key, agent, response_key in self._agent_map():
             if agent_type == key:
                 agent_context = context.get(key, "")
+                start_time = time.perf_counter()
                 response = agent.run(question, context=agent_context)
-                return {response_key: response}
-
-        if agent_type == AgentType.COMPLETED.value:  
-            responses = []
-            for key, agent, response_key in agent_map:   
-                responses.append(state.get(response_key, ""))     
-            for report in agent_map:
-                print(f"REPORTE DE {report[0]}: {state.get(report[2], '')}")
-            
-            reports = {
-                "gasto": responses[0],
-                "industria": responses[1],
-                "regimen": responses[2],
-                "sectors": responses[3],
-                "growth_interanual": responses[4]
-            }
-            response = self.complete_agent.run(user_question=question, 
-                                                csv_context_data='', 
-                                                reports=reports)            
-            # Combinar todos los contextos CSV para metadatos            
-            context = state.get("context", {})
+                return {response_key: response, "agent_timings": {key: time.perf_counter() - start_time}}
+
+        if agent_type == AgentType.COMPLETED.value:
+            reports = self._collect_reports(state)
+            response = self.complete_agent.run(user_question=question,
+                                                csv_context_data='',
+                                                reports=reports)
             print("------- REPORTES FINAL GENERADO -----------")
             print(response)
             return {"response": response}
         else:
             return {"response": ""}
 
-    def run(self, question: str, context: dict = {}): # Add context parameter here
+    async def _acall_agent(self, state: ReportState, agent_type: str):
+        """Async counterpart of _call_agent used when the graph runs with ainvoke."""
+        print(f"--- Agente de Reporte ({agent_type}) en ejecución (Langgraph async) ---")
+        question = state["question"]
+        context = state.get("context", {})
+
+        for key, agent, response_key in self._agent_map():
+            if agent_type == key:
+                agent_context = context.get(key, "")
+                start_time = time.perf_counter()
+                response = await agent.arun(question, context=agent_context)
+                return {response_key: response, "agent_timings": {key: time.perf_counter() - start_time}}
+
+        if agent_type == AgentType.COMPLETED.value:
+            reports = self._collect_reports(state)
+            # Editor tokens are forwarded to the "custom" stream as they arrive (no-op under ainvoke)
+            writer = get_stream_writer()
+            chunks = []
+            async for chunk in self.complete_agent.astream(user_question=question,
+                                                           csv_context_data='',
+                                                           reports=reports):
+                chunks.append(chunk)
+                writer({"token": chunk})
+            response = "".join(chunks)
+            print("------- REPORTES FINAL GENERADO -----------")
+            print(response)
+            return {"response": response}
+        else:
+            return {"response": ""}
+
+    def _run_config(self) -> dict:
+        # The analyst nodes form a single superstep; max_concurrency bounds how many
+        # of them LangGraph runs at once (thread pool for invoke, semaphore for ainvoke)
+        return {"max_concurrency": self.max_concurrency}
+
+    def _log_timings(self, final_state: ReportState, elapsed: float) -> None:
+        timings = final_state.get("agent_timings") or {}
+        if not timings:
+            return
+        print("⏱️ Tiempos por agente analista:")
+        for key, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+            print(f"   - {key}: {seconds:.2f} s")
+        slowest = max(timings.values())
+        print(f"⏱️ Agente más lento: {slowest:.2f} s | suma secuencial: {sum(timings.values()):.2f} s "
+              f"| pipeline total: {elapsed:.2f} s (concurrencia máx.: {self.max_concurrency})")
+
+    def run(self, question: str, context: dict = {}, agents: Optional[List[str]] = None): # Add context parameter here
         print("--- Pipeline de Reporte en ejecución (Langgraph) ---")
-        initial_state = ReportState(question=question,context=context)
-        final_state = self.app.invoke(initial_state)
+        start_time = time.perf_counter()
+        initial_state = ReportState(question=question, context=context, agents=agents or [])
+        final_state = self.app.invoke(initial_state, config=self._run_config())
+        self._log_timings(final_state, time.perf_counter() - start_time)
+        return final_state["response"]
+
+    async def arun(self, question: str, context: dict = {}, agents: Optional[List[str]] = None):
+        print("--- Pipeline de Reporte en ejecución (Langgraph async) ---")
+        start_time = time.perf_counter()
+        initial_state = ReportState(question=question, context=context, agents=agents or [])
+        final_state = await self.app.ainvoke(initial_state, config=self._run_config())
+        self._log_timings(final_state, time.perf_counter() - start_time)
         return final_state["response"]
+
+    async def astream(self, question: str, context: dict = {}, agents: Optional[List[str]] = None) -> AsyncIterator[dict]:
+        """
+        Runs the report graph and yields events as soon as they are available:
+        - {"event": "section", ...} when an analyst node finishes
+        - {"event": "token", ...} for every chunk of the editor's final report
+        - {"event": "done", ...} with the assembled report
+        """
+        print("--- Pipeline de Reporte en ejecución (Langgraph stream) ---")
+        start_time = time.perf_counter()
+        initial_state = ReportState(question=question, context=context, agents=agents or [])
+        timings = {}
+        async for mode, chunk in self.app.astream(initial_state,
+                                                  config=self._run_config(),
+                                                  stream_mode=["updates", "custom"]):
+            if mode == "custom":
+                yield {"event": "token", "content": chunk.get("token", "")}
+                continue
+
+            for node, update in chunk.items():
+                if not update or node == "start":
+                    continue
+                for key, agent, response_key in self._agent_map():
+                    if response_key in update:
+                        seconds = update.get("agent_timings", {}).get(key)
+                        timings[key] = seconds
+                        yield {
+                            "event": "section",
+                            "section": key,
+                            "key": response_key,
+                            "content": update[response_key],
+                            "seconds": seconds,
+                        }
+                if node == "agent_completed_node" and "response" in update:
+                    self._log_timings({"agent_timings": timings}, time.perf_counter() - start_time)
+                    yield {"event": "done", "response": update["response"]}
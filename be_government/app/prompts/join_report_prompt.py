@@ -72,4 +72,18 @@ Aquí están los datos para ensamblar el informe:
 --- DATOS CSV (PARA METADATOS) ---
 {{#context#}}
 {csv_context_data}
-"""
\ No newline at end of file
+"""
+
+# Ensamblado local (REPORT_JOIN_MODE="local"): el LLM solo redacta el resumen
+SUMMARY_JOIN_REPORT_PROMPT = """
+# Rol
+Eres el "Editor Económico Principal". Recibes los informes de tus analistas ya ensamblados.
+
+# Tarea
+Escribe un único párrafo de resumen ejecutivo (máximo 5 oraciones) que responda la pregunta del usuario.
+
+# Reglas Estrictas
+1. Usa solo cifras y afirmaciones presentes en los informes; no hagas nuevos cálculos.
+2. No repitas los títulos de las secciones ni uses listas.
+3. Responde solo con el párrafo, sin encabezados.
+"""
@@ -1,9 +1,16 @@
+import asyncio
 import os
+from typing import List, Optional
 from app.clients.llm_client import LLMClientFactory
-from app.models.enums.ai_model_enums import ModelProvider
+from app.models.enums.ai_model_enums import ModelProvider, OpenAIModels
 from app.pipelines.report_pipeline import ReportPipeline
 from app.services.data_load_service import DataLoadService
-from app.core.config import GENERAL_INFORMATION_DATA_RELATIVE_PATH, INDUSTRY_DATA_RELATIVE_PATH, INTERANUAL_GROWTH_DATA_RELATIVE_PATH, REGIMEN_DATA_RELATIVE_PATH, SECTORS_DATA_RELATIVE_PATH, SPENT_DATA_RELATIVE_PATH
+from app.services.context_pruning_service import ContextPruningService, QuestionScope, detect_question_scope
+from app.services.stats_service import AdministrationStatsService
+from app.services.question_router_service import QuestionRouter
+from app.services.numeric_query_service import NumericAnswer, NumericQueryService
+from app.services.context_encoding_service import SECTION_PREFIX, ContextEncoder, ContextText
+from app.core.config import CONTEXT_ENCODING, CONTEXT_PRECISION, CONTEXT_PRUNING_ENABLED, NUMERIC_FAST_PATH_ENABLED, PARQUET_SYNC_ON_STARTUP, QUESTION_ROUTER_ENABLED, QUESTION_ROUTER_MODEL_ENABLED, REPORT_CONTEXT_MODE, GENERAL_INFORMATION_DATA_RELATIVE_PATH, INDUSTRY_DATA_RELATIVE_PATH, INTERANUAL_GROWTH_DATA_RELATIVE_PATH, REGIMEN_DATA_RELATIVE_PATH, SECTORS_DATA_RELATIVE_PATH, SPENT_DATA_RELATIVE_PATH
 from app.pipelines.general_information_pipeline import GeneralInformationPipeline
 
 
@@ -11,43 +18,297 @@ class ChatService:
     def __init__(self):
         self.report_pipeline = ReportPipeline()
         self.data_load_service = DataLoadService()
+        self.context_pruning_service = ContextPruningService()
+        self.stats_service = AdministrationStatsService(self.data_load_service)
+        self.context_encoder = ContextEncoder(precision=CONTEXT_PRECISION)
         self.general_information_pipeline = GeneralInformationPipeline()  # Assuming similar pipeline for general information
+        self._question_router: QuestionRouter | None = None
+        # growth_interanual primero: de ahí se leen las administraciones de la pregunta
+        self.numeric_query_service = NumericQueryService(
+            self.stats_service,
+            [INTERANUAL_GROWTH_DATA_RELATIVE_PATH]
+            + [p for p in self._report_paths().values() if p != INTERANUAL_GROWTH_DATA_RELATIVE_PATH],
+        )
+
+    def warm_up(self):
+        """
+        Precalienta el servicio al arrancar la aplicación: sincroniza las copias
+        Parquet de los datasets, los carga una vez (DataFrames desde Parquet y el
+        texto que usan los agentes), precalcula sus estadísticas por
+        administración y prepara el ensamblador local del informe, para que la
+        primera petición no pague ese costo.
+        El efecto depende del DatasetCache compartido de DataLoadService: sin ese
+        cache cada petición volvería a leer los archivos y precalentar no serviría.
+        """
+        print("--- Precalentando ChatService ---")
+        paths = list(self._report_paths().values())
+        if PARQUET_SYNC_ON_STARTUP:
+            try:
+                written = self.data_load_service.sync_parquet(paths)
+                if written:
+                    print(f"🗄️  Copias Parquet actualizadas: {', '.join(written)}")
+            except (OSError, ImportError) as e:
+                print(f"⚠️  No se pudieron escribir las copias Parquet (se usará el CSV): {e}")
+        for relative_path in paths:
+            try:
+                self.data_load_service.load_frame(relative_path)
+                self.data_load_service.load_data(relative_path)
+            except FileNotFoundError as e:
+                print(f"⚠️  No se pudo precargar {relative_path}: {e}")
+        if REPORT_CONTEXT_MODE == "stats" or NUMERIC_FAST_PATH_ENABLED:
+            self.stats_service.warm_up(self._report_paths().values())
+        if NUMERIC_FAST_PATH_ENABLED:
+            try:
+                self.numeric_query_service.warm_up()
+            except FileNotFoundError as e:
+                print(f"⚠️  No se pudo preparar la respuesta numérica directa: {e}")
+        if QUESTION_ROUTER_ENABLED:
+            self.question_router
+        complete_agent = self.report_pipeline.complete_agent
+        if complete_agent.mode == "local":
+            try:
+                complete_agent.assembler
+            except FileNotFoundError as e:
+                print(f"⚠️  No se pudo preparar el ensamblador local del informe: {e}")
+
+    @staticmethod
+    def _report_paths() -> dict:
+        return {
+            "spent": SPENT_DATA_RELATIVE_PATH,
+            "industry": INDUSTRY_DATA_RELATIVE_PATH,
+            "regimen": REGIMEN_DATA_RELATIVE_PATH,
+            "sectors": SECTORS_DATA_RELATIVE_PATH,
+            "growth_interanual": INTERANUAL_GROWTH_DATA_RELATIVE_PATH,
+        }
+
+    @property
+    def question_router(self) -> QuestionRouter:
+        """Enrutador de preguntas; el vocabulario sale de las columnas de cada dataset."""
+        if self._question_router is None:
+            columns = {}
+            for key, path in self._report_paths().items():
+                try:
+                    columns[key] = list(self.data_load_service.load_frame(path).columns)
+                except FileNotFoundError as e:
+                    print(f"⚠️  Enrutador sin columnas de {path}: {e}")
+            llm_client = None
+            if QUESTION_ROUTER_MODEL_ENABLED:
+                llm_client = LLMClientFactory.create_client(
+                    ModelProvider.OPENAI,
+                    config={"model": OpenAIModels.GPT_4_1_NANO.value, "max_tokens": 20, "temperature": 0},
+                )
+            self._question_router = QuestionRouter(columns, llm_client=llm_client)
+        return self._question_router
+
+    def answer_numeric(self, question: str) -> Optional[NumericAnswer]:
+        """
+        Respuesta directa desde la tabla de estadísticas por administración
+        para preguntas puramente numéricas; None si hace falta el pipeline.
+        """
+        if not NUMERIC_FAST_PATH_ENABLED:
+            return None
+        try:
+            answer = self.numeric_query_service.answer(question)
+        except Exception as e:
+            print(f"⚠️  Respuesta numérica directa no disponible: {e}")
+            return None
+        if answer is not None:
+            print(f"⚡ Respuesta numérica directa: {answer.statistic} de {answer.variable} "
+                  f"({', '.join(r['Label'] for r in answer.rows)})")
+        return answer
+
+    def _route_question(self, question: str) -> Optional[List[str]]:
+        """Analistas que necesita la pregunta (None = todos)."""
+        if not QUESTION_ROUTER_ENABLED:
+            return None
+        decision = self.question_router.route(question)
+        print(f"🧭 Enrutador: {decision.agents} ({decision.reason})")
+        return None if decision.is_full else decision.agents
+
+    async def _aroute_question(self, question: str) -> Optional[List[str]]:
+        """Versión asíncrona de _route_question (el enrutador LLM usa agenerate_response)."""
+        if not QUESTION_ROUTER_ENABLED:
+            return None
+        # La primera construcción lee los datasets; fuera del event loop
+        router = self._question_router or await asyncio.to_thread(lambda: self.question_router)
+        decision = await router.aroute(question)
+        print(f"🧭 Enrutador: {decision.agents} ({decision.reason})")
+        return None if decision.is_full else decision.agents
+
+    def _load_report_context(self,
+                             question: str | None = None,
+                             stats: bool = False,
+                             agents: Optional[List[str]] = None) -> dict:
+        """
+        Carga el contexto de los agentes analistas.
+        - Con `agents`, solo el de esos analistas.
+        - Con `question`, recorta los datasets a los gobiernos/fechas que menciona.
+        - Con `stats`, el contexto pasa a ser la tabla precalculada de estadísticas
+          por administración; las filas trimestrales solo se añaden cuando la
+          pregunta acota un rango de fechas.
+        - Salvo con CONTEXT_ENCODING="raw", las filas se serializan con
+          ContextEncoder (valores redondeados, columnas políticas por administración).
+        """
+        # Load the context data using the DataLoadService with the relative path from config
+        paths = self._report_paths()
+        if agents:
+            paths = {key: path for key, path in paths.items() if key in agents}
+        scope = self._question_scope(question, paths) if question and CONTEXT_PRUNING_ENABLED else None
+        if stats:
+            return self._stats_report_context(scope, paths)
+        return self._rows_context(scope, paths)
+
+    def _rows_context(self, scope: QuestionScope | None, paths: dict, encoding: str = CONTEXT_ENCODING) -> dict:
+        """Filas trimestrales de cada dataset, recortadas al alcance y en el formato `encoding`."""
+        if encoding != "raw":
+            return self._encode_report_context(scope, paths, encoding)
+        context_data = {key: self.data_load_service.load_data(path) for key, path in paths.items()}
+        if scope is not None and not scope.is_empty:
+            context_data = self._prune_report_context(scope, paths, context_data)
+        return context_data
+
+    def _load_general_context(self) -> dict:
+        """
+        Contexto del agente de información general: el texto original de cada
+        dataset. ContextEncoder solo se aplica a los analistas del reporte; este
+        prompt se mantiene como estaba.
+        """
+        return {key: self.data_load_service.load_data(path) for key, path in self._report_paths().items()}
+
+    def _question_scope(self, question: str, paths: dict) -> QuestionScope:
+        # Todos los datasets comparten las columnas políticas; se detecta una sola vez
+        frame = self.data_load_service.load_frame(next(iter(paths.values())))
+        scope = detect_question_scope(question, frame)
+        print(f"✂️  Poda de contexto: {scope.describe()}")
+        return scope
+
+    def _prune_report_context(self, scope: QuestionScope, paths: dict, context_data: dict) -> dict:
+        """Recorta cada dataset a las filas de los gobiernos/fechas mencionados en la pregunta."""
+        pruned = {}
+        for key, path in paths.items():
+            frame = self.data_load_service.load_frame(path)
+            pruned[key] = self.context_pruning_service.prune(context_data[key], frame, scope=scope)
+            print(f"   - {key}: {len(context_data[key])} -> {len(pruned[key])} caracteres")
+        return pruned
+
+    def _encode_report_context(self, scope: QuestionScope | None, paths: dict, encoding: str = CONTEXT_ENCODING) -> dict:
+        """Serializa cada dataset (recortado al alcance de la pregunta) en el formato `encoding`."""
+        encoded = {}
+        for key, path in paths.items():
+            frame = self.data_load_service.load_frame(path)
+            if scope is not None and not scope.is_empty:
+                mask = self.context_pruning_service.row_mask(frame, scope)
+                if mask.any():
+                    frame = frame[mask.to_numpy()]
+            encoded[key] = self.context_encoder.encode(frame, encoding)
+            print(f"🗜️  {key}: {len(frame)} filas -> {len(encoded[key])} caracteres ({encoding})")
+        return encoded
+
+    def _stats_report_context(self, scope: QuestionScope | None, paths: dict) -> dict:
+        """
+        Sustituye las filas crudas por la tabla de estadísticas por administración.
+        Las filas trimestrales solo se serializan cuando la pregunta acota fechas;
+        van al final como un único bloque CSV cuya cabecera (una línea) nombra
+        las columnas, para que el recorte por presupuesto no las separe.
+        """
+        observations = {}
+        if scope is not None and scope.date_ranges:
+            observations = self._rows_context(scope, paths, encoding="raw" if CONTEXT_ENCODING == "raw" else "csv")
+        stats_context = {}
+        for key, path in paths.items():
+            legend = ("Estadísticas precalculadas por administración (Label) de cada variable "
+                      "(count = trimestres observados; p25/p75 = percentiles 25 y 75):")
+            rendered = self.stats_service.render(path, scope, encoding="csv" if CONTEXT_ENCODING == "raw" else CONTEXT_ENCODING)
+            block = f"{legend}\n{rendered}"
+            if key in observations:
+                columns, _, rows = observations[key].partition("\n")
+                block += f"{SECTION_PREFIX}Observaciones trimestrales del período consultado (columnas: {columns})\n{rows}"
+            # Leyenda + encabezado del encoder: se conservan siempre al recortar
+            block = ContextText(block, header_lines=1 + rendered.header_lines, section_lines=rendered.section_lines)
+            stats_context[key] = block
+            print(f"📊 {key}: contexto de estadísticas de {len(block)} caracteres")
+        return stats_context
 
     def report_generation(self, question):
         print("--- 1. Iniciando generación de reporte ---")
         try:
-            # Load the context data using the DataLoadService with the relative path from config
-            context_data = {}
-            context_spent_data = self.data_load_service.load_data(SPENT_DATA_RELATIVE_PATH)
-            context_industry_data = self.data_load_service.load_data(INDUSTRY_DATA_RELATIVE_PATH)
-            context_regimen_data = self.data_load_service.load_data(REGIMEN_DATA_RELATIVE_PATH)
-            context_sectors_data = self.data_load_service.load_data(SECTORS_DATA_RELATIVE_PATH)
-            context_interannual_growth_data = self.data_load_service.load_data(INTERANUAL_GROWTH_DATA_RELATIVE_PATH)
-            ###### TODO Agregar aqui el contexto de los otros agentes ######
-            context_data["spent"] = context_spent_data
-            context_data["industry"] = context_industry_data
-            context_data["regimen"] = context_regimen_data
-            context_data["sectors"] = context_sectors_data
-            context_data["growth_interanual"] = context_interannual_growth_data
-            response = self.report_pipeline.run(question, context=context_data)
+            numeric = self.answer_numeric(question)
+            if numeric is not None:
+                return f"{numeric.to_text()}\n"
+            agents = self._route_question(question)
+            context_data = self._load_report_context(question, stats=REPORT_CONTEXT_MODE == "stats", agents=agents)
+            response = self.report_pipeline.run(question, context=context_data, agents=agents)
             print(f"Respuesta del pipeline: {response}\n")
             return f"{response}\n"
         except Exception as e:
             print(f"Error en la generación del reporte: {e}\n")
             raise e
 
+    async def areport_generation(self, question):
+        """Versión asíncrona de report_generation; usa ainvoke en el grafo y en los LLM."""
+        print("--- 1. Iniciando generación de reporte (async) ---")
+        try:
+            # El trabajo con CSV/pandas corre en hilos para no bloquear el event loop
+            numeric = await asyncio.to_thread(self.answer_numeric, question)
+            if numeric is not None:
+                return f"{numeric.to_text()}\n"
+            agents = await self._aroute_question(question)
+            context_data = await asyncio.to_thread(
+                self._load_report_context, question, REPORT_CONTEXT_MODE == "stats", agents
+            )
+            response = await self.report_pipeline.arun(question, context=context_data, agents=agents)
+            print(f"Respuesta del pipeline: {response}\n")
+            return f"{response}\n"
+        except Exception as e:
+            print(f"Error en la generación del reporte: {e}\n")
+            raise e
+
+    async def astream_report_generation(self, question):
+        """
+        Genera el reporte como flujo de eventos: cada sub-reporte en cuanto su
+        agente termina y luego los tokens del informe final.
+        """
+        print("--- 1. Iniciando generación de reporte (stream) ---")
+        try:
+            numeric = await asyncio.to_thread(self.answer_numeric, question)
+            if numeric is not None:
+                yield {"event": "done", "response": numeric.to_text()}
+                return
+            agents = await self._aroute_question(question)
+            context_data = await asyncio.to_thread(
+                self._load_report_context, question, REPORT_CONTEXT_MODE == "stats", agents
+            )
+            async for event in self.report_pipeline.astream(question, context=context_data, agents=agents):
+                yield event
+        except Exception as e:
+            print(f"Error en la generación del reporte: {e}\n")
+            raise e
+
     def general_information(self, question):
         print("--- Iniciando agente de información general ---")
         try:
-            context_data = {}
-            context_data["spent"] = self.data_load_service.load_data(SPENT_DATA_RELATIVE_PATH)
-            context_data["industry"] = self.data_load_service.load_data(INDUSTRY_DATA_RELATIVE_PATH)
-            context_data["regimen"] = self.data_load_service.load_data(REGIMEN_DATA_RELATIVE_PATH)
-            context_data["sectors"] = self.data_load_service.load_data(SECTORS_DATA_RELATIVE_PATH)
-            context_data["growth_interanual"] = self.data_load_service.load_data(INTERANUAL_GROWTH_DATA_RELATIVE_PATH)            
+            numeric = self.answer_numeric(question)
+            if numeric is not None:
+                return f"{numeric.to_text()}\n"
+            context_data = self._load_general_context()
             response = self.general_information_pipeline.run(question, context=context_data)
             print(f"Respuesta del agente de información general: {response}\n")
             return f"{response}\n"
         except Exception as e:
             print(f"Error en el agente de información general: {e}\n")
-            raise e
\ No newline at end of file
+            raise e
+
+    async def ageneral_information(self, question):
+        """Versión asíncrona de general_information."""
+        print("--- Iniciando agente de información general (async) ---")
+        try:
+            numeric = await asyncio.to_thread(self.answer_numeric, question)
+            if numeric is not None:
+                return f"{numeric.to_text()}\n"
+            context_data = await asyncio.to_thread(self._load_general_context)
+            response = await self.general_information_pipeline.arun(question, context=context_data)
+            print(f"Respuesta del agente de información general: {response}\n")
+            return f"{response}\n"
+        except Exception as e:
+            print(f"Error en el agente de información general: {e}\n")
+            raise e
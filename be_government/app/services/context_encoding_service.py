@@ -0,0 +1,201 @@
+# be_government/app/services/context_encoding_service.py
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from app.services.context_pruning_service import POLITICAL_COLUMNS
+from app.utils.token_counter import count_tokens
+
+# Formatos de contexto disponibles:
+# - csv: CSV completo con los valores redondeados
+# - grouped: una cabecera por administración y sus filas sin columnas políticas
+# - markdown: tabla Markdown ancha con la etiqueta de la administración en cada fila
+# - blocks: un bloque por período con una línea por variable (serie transpuesta)
+ENCODINGS = ("csv", "grouped", "markdown", "blocks")
+
+_NO_ADMINISTRATION = "Sin administración"
+# Prefijo de la línea que abre el bloque de cada administración
+SECTION_PREFIX = "### "
+
+
+class ContextText(str):
+    """
+    Texto de contexto que declara su estructura para que el recorte por
+    presupuesto no dependa de heurísticas:
+
+    - `header_lines`: líneas iniciales de leyenda/columnas que siempre se conservan.
+    - `section_lines`: líneas que abren cada bloque "### ..." (la cabecera y,
+      en `blocks`, la línea de fechas); se repiten si el bloque se recorta.
+    """
+    header_lines: int
+    section_lines: int
+
+    def __new__(cls, text: str, header_lines: int = 1, section_lines: int = 1):
+        obj = super().__new__(cls, text)
+        obj.header_lines = header_lines
+        obj.section_lines = section_lines
+        return obj
+
+
+class ContextEncoder:
+    """
+    Serializa los DataFrames de contexto de los agentes en formatos compactos.
+
+    Los valores se redondean a `precision` decimales y los atributos
+    políticos (President, Party, Term, Label), que se repiten en cada
+    trimestre, se escriben una sola vez por administración. Sirve tanto para
+    los datasets trimestrales como para la tabla de estadísticas por
+    administración (filas = variables).
+    """
+
+    def __init__(self, precision: int = 2, date_format: str = "%Y-%m"):
+        self.precision = precision
+        self.date_format = date_format
+
+    # ---------------------------
+    # Utilidades
+    # ---------------------------
+    def _prepare(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Redondea los valores y formatea las fechas."""
+        out = frame.copy()
+        numeric = out.select_dtypes("number").columns
+        out[numeric] = out[numeric].round(self.precision)
+        for col in out.columns:
+            if pd.api.types.is_datetime64_any_dtype(out[col]):
+                out[col] = out[col].dt.strftime(self.date_format)
+        return out
+
+    @staticmethod
+    def _value_columns(frame: pd.DataFrame) -> List[str]:
+        return [c for c in frame.columns if c not in POLITICAL_COLUMNS]
+
+    @staticmethod
+    def _key_column(frame: pd.DataFrame) -> Optional[str]:
+        """Columna que identifica cada fila: `fecha` o, en la tabla de estadísticas, `variable`."""
+        for col in ("fecha", "variable"):
+            if col in frame.columns:
+                return col
+        return None
+
+    @staticmethod
+    def _groups(frame: pd.DataFrame) -> Iterable:
+        """(cabecera, filas) por administración, en el orden en que aparecen."""
+        if "Label" not in frame.columns:
+            yield None, frame
+            return
+        labels = frame["Label"].astype(object)
+        has_label = labels.notna()
+        for label in pd.unique(labels[has_label]):
+            rows = frame[labels == label]
+            first = rows.iloc[0]
+            attrs = [str(first[c]) for c in ("Party", "Term") if c in frame.columns]
+            president = first["President"] if "President" in frame.columns else label
+            yield f"{label}: {president} ({', '.join(attrs)})" if attrs else str(label), rows
+        if not has_label.all():
+            yield _NO_ADMINISTRATION, frame[~has_label]
+
+    @staticmethod
+    def _format_value(value) -> str:
+        return "" if pd.isna(value) else str(value)
+
+    # ---------------------------
+    # Formatos
+    # ---------------------------
+    def encode_csv(self, frame: pd.DataFrame) -> ContextText:
+        return ContextText(self._prepare(frame).to_csv(index=False), header_lines=1)
+
+    def encode_grouped(self, frame: pd.DataFrame) -> ContextText:
+        data = self._prepare(frame)
+        columns = self._value_columns(data)
+        lines = [
+            "Filas agrupadas por administración (### Label: Presidente (Partido, Período)).",
+            "Columnas: " + ",".join(columns),
+        ]
+        for header, rows in self._groups(data):
+            if header is not None:
+                lines.append(f"{SECTION_PREFIX}{header}")
+            lines.append(rows[columns].to_csv(index=False, header=False).rstrip("\n"))
+        return ContextText("\n".join(lines) + "\n", header_lines=2, section_lines=1)
+
+    def encode_markdown(self, frame: pd.DataFrame) -> ContextText:
+        data = self._prepare(frame)
+        columns = self._value_columns(data)
+        lines = []
+        if "Label" in data.columns:
+            lines.append("Administraciones (Label: Presidente (Partido, Período)):")
+            lines += [f"- {header}" for header, _ in self._groups(data) if header is not None]
+            columns = columns + ["Label"]
+        lines.append("| " + " | ".join(columns) + " |")
+        lines.append("|" + "---|" * len(columns))
+        header_lines = len(lines)
+        for row in data[columns].itertuples(index=False):
+            lines.append("| " + " | ".join(self._format_value(v) for v in row) + " |")
+        return ContextText("\n".join(lines) + "\n", header_lines=header_lines)
+
+    def encode_blocks(self, frame: pd.DataFrame) -> ContextText:
+        data = self._prepare(frame)
+        key = self._key_column(data)
+        columns = [c for c in self._value_columns(data) if c != key]
+        lines = ["Un bloque por administración; cada línea es una variable con sus valores en el orden de la primera línea."]
+        for header, rows in self._groups(data):
+            if header is not None:
+                lines.append(f"{SECTION_PREFIX}{header}")
+            if key is not None:
+                lines.append(f"{key}: " + " ".join(rows[key].astype(str)))
+            for col in columns:
+                lines.append(f"{col}: " + " ".join(self._format_value(v) for v in rows[col]))
+        return ContextText("\n".join(lines) + "\n", header_lines=1, section_lines=2 if key is not None else 1)
+
+    def encode(self, frame: pd.DataFrame, encoding: str = "grouped") -> ContextText:
+        encoders = {
+            "csv": self.encode_csv,
+            "grouped": self.encode_grouped,
+            "markdown": self.encode_markdown,
+            "blocks": self.encode_blocks,
+        }
+        if encoding not in encoders:
+            raise ValueError(f"Formato de contexto no soportado: {encoding}. Opciones: {', '.join(ENCODINGS)}")
+        return encoders[encoding](frame)
+
+    # ---------------------------
+    # Reporte de tokens
+    # ---------------------------
+    def token_report(self,
+                     frame: pd.DataFrame,
+                     raw_text: Optional[str] = None,
+                     encodings: Iterable[str] = ENCODINGS,
+                     model: Optional[str] = None) -> pd.DataFrame:
+        """
+        Caracteres y tokens de cada formato. Con `raw_text` (el CSV original)
+        se añade la fila "raw" y el ahorro relativo a ella.
+        """
+        texts: Dict[str, str] = {}
+        if raw_text is not None:
+            texts["raw"] = raw_text
+        for encoding in encodings:
+            texts[encoding] = self.encode(frame, encoding)
+
+        report = pd.DataFrame(
+            [{"encoding": name, "characters": len(text), "tokens": count_tokens(text, model)}
+             for name, text in texts.items()]
+        )
+        baseline = report["tokens"].iloc[0]
+        report["saving_pct"] = (100 * (1 - report["tokens"] / baseline)).round(1) if baseline else 0.0
+        return report
+
+
+def encoding_report(data_load_service, relative_paths: Dict[str, str], precision: int = 2) -> pd.DataFrame:
+    """Reporte de tokens por formato para cada dataset de contexto (raw = texto original)."""
+    encoder = ContextEncoder(precision=precision)
+    reports = []
+    for key, path in relative_paths.items():
+        report = encoder.token_report(data_load_service.load_frame(path), raw_text=data_load_service.load_data(path))
+        report.insert(0, "dataset", key)
+        reports.append(report)
+    return pd.concat(reports, ignore_index=True)
+
+
+def best_encoding(report: pd.DataFrame) -> str:
+    """Formato con menos tokens sumando todos los datasets del reporte (sin contar "raw")."""
+    totals = report[report["encoding"] != "raw"].groupby("encoding", sort=False)["tokens"].sum()
+    return str(totals.idxmin())
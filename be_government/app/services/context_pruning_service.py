@@ -0,0 +1,148 @@
+# be_government/app/services/context_pruning_service.py
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Set, Tuple
+
+import pandas as pd
+
+from app.services.response_cache_service import normalize_question
+
+# Columnas políticas que produce tag_politics (script.py)
+POLITICAL_COLUMNS = ("President", "Party", "Term", "Label")
+
+# Nombres largos de los partidos, normalizados, para reconocerlos en la pregunta
+PARTY_ALIASES = {
+    "liberacion nacional": "PLN",
+    "unidad social cristiana": "PUSC",
+    "accion ciudadana": "PAC",
+    "progreso social democratico": "PPSD",
+}
+
+_YEAR = r"(19[89]\d|20[0-4]\d)"
+_YEAR_RANGE_RE = re.compile(rf"\b{_YEAR}\s*(?:-|–|—|a|al|y|hasta)\s*{_YEAR}\b")
+_YEAR_RE = re.compile(rf"\b{_YEAR}\b")
+
+
+@dataclass
+class QuestionScope:
+    """Administraciones, partidos y rangos de fechas mencionados en una pregunta."""
+    labels: Set[str] = field(default_factory=set)
+    parties: Set[str] = field(default_factory=set)
+    date_ranges: List[Tuple[pd.Timestamp, pd.Timestamp]] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.labels or self.parties or self.date_ranges)
+
+    def describe(self) -> str:
+        parts = []
+        if self.labels:
+            parts.append(f"gobiernos={sorted(self.labels)}")
+        if self.parties:
+            parts.append(f"partidos={sorted(self.parties)}")
+        for start, end in self.date_ranges:
+            parts.append(f"fechas={start.date()}..{end.date()}")
+        return ", ".join(parts) if parts else "sin filtro"
+
+
+def _name_tokens(president: str) -> List[str]:
+    """Apellidos de un presidente: el último token o los dos últimos si el nombre es compuesto."""
+    tokens = normalize_question(president).split()
+    return tokens[-2:] if len(tokens) >= 3 else tokens[-1:]
+
+
+def detect_question_scope(question: str, frame: pd.DataFrame) -> QuestionScope:
+    """
+    Detecta en la pregunta los presidentes (apellidos o etiqueta), partidos,
+    períodos ("2014–2018") y años o rangos de años, usando los valores políticos
+    presentes en el propio dataset.
+    """
+    scope = QuestionScope()
+    if not question or not set(POLITICAL_COLUMNS).issubset(frame.columns):
+        return scope
+
+    text = normalize_question(question)
+    words = set(text.split())
+    admins = frame[list(POLITICAL_COLUMNS)].drop_duplicates()
+
+    for president, party, term, label in admins.itertuples(index=False):
+        if pd.isna(label):
+            continue
+        names = set(_name_tokens(str(president))) | {normalize_question(str(label))}
+        if names & words:
+            scope.labels.add(label)
+        if normalize_question(str(party)) in words:
+            scope.parties.add(party)
+
+    for alias, party in PARTY_ALIASES.items():
+        if re.search(rf"\b{alias}\b", text) and party in set(admins["Party"]):
+            scope.parties.add(party)
+
+    # Los rangos que coinciden con un período completo seleccionan esa administración
+    terms = {str(term).replace("–", "-"): label for term, label in admins[["Term", "Label"]].itertuples(index=False)}
+    # normalize_question convierte los guiones en espacios; se buscan sobre el texto original
+    raw = question.replace("–", "-").replace("—", "-")
+    consumed = []
+    for match in _YEAR_RANGE_RE.finditer(raw):
+        first, last = sorted((int(match.group(1)), int(match.group(2))))
+        label = terms.get(f"{first}-{last}")
+        if label is not None:
+            scope.labels.add(label)
+        else:
+            scope.date_ranges.append((pd.Timestamp(first, 1, 1), pd.Timestamp(last, 12, 31)))
+        consumed.append(match.span())
+
+    for match in _YEAR_RE.finditer(raw):
+        if any(start <= match.start() < end for start, end in consumed):
+            continue
+        year = int(match.group(1))
+        scope.date_ranges.append((pd.Timestamp(year, 1, 1), pd.Timestamp(year, 12, 31)))
+
+    return scope
+
+
+class ContextPruningService:
+    """
+    Reduce el contexto CSV de cada agente a las filas de las administraciones,
+    partidos o fechas que menciona la pregunta. Si no se detecta nada, o el
+    filtro no deja filas, se devuelve el contexto completo.
+    """
+
+    def row_mask(self, frame: pd.DataFrame, scope: QuestionScope) -> pd.Series:
+        mask = pd.Series(False, index=frame.index)
+        if scope.labels and "Label" in frame.columns:
+            mask |= frame["Label"].isin(scope.labels)
+        if scope.parties and "Party" in frame.columns:
+            mask |= frame["Party"].isin(scope.parties)
+        if scope.date_ranges and "fecha" in frame.columns:
+            for start, end in scope.date_ranges:
+                mask |= frame["fecha"].between(start, end)
+        return mask
+
+    def prune(self,
+              text: str,
+              frame: pd.DataFrame,
+              scope: Optional[QuestionScope] = None,
+              question: str = "") -> str:
+        """
+        Devuelve el CSV `text` reducido a las filas seleccionadas.
+        `frame` debe ser el mismo dataset ya parseado (DataLoadService.load_frame).
+        Las líneas se copian tal cual del texto original, sin re-serializar números.
+        """
+        if scope is None:
+            scope = detect_question_scope(question, frame)
+        if scope.is_empty:
+            return text
+
+        mask = self.row_mask(frame, scope)
+        if not mask.any() or mask.all():
+            return text
+
+        lines = text.splitlines()
+        rows = lines[1:]
+        if len(rows) != len(frame):
+            # El texto no corresponde 1:1 con el DataFrame; se re-serializa la selección
+            return frame.loc[mask.to_numpy()].to_csv(index=False, date_format="%Y-%m-%d")
+
+        positions = mask.to_numpy().nonzero()[0]
+        return "\n".join([lines[0]] + [rows[i] for i in positions]) + "\n"
@@ -1,9 +1,125 @@
 # be_government/app/services/data_load_service.py
+import glob
+import hashlib
+import io
 import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from app.utils.parquet_store import POLITICAL_COLUMNS, ParquetStore
+
+
+@dataclass
+class _CacheEntry:
+    mtime_ns: int
+    size: int
+    text: str
+    encoding: str
+    sha256: str
+    frame: Optional[pd.DataFrame] = field(default=None, repr=False)
+
+
+class DatasetCache:
+    """
+    Cache en memoria de los datasets de contexto, indexado por ruta resuelta.
+    Cada acceso revalida la entrada con un stat() (mtime + tamaño), de modo que
+    las peticiones calientes no leen disco y las ediciones de los archivos se
+    reflejan sin reiniciar el servidor.
+    """
 
-class DataLoadService:
     def __init__(self):
-        pass
+        self._entries: Dict[str, _CacheEntry] = {}
+        # Copias Parquet: ruta -> (mtime_ns, tamaño, DataFrame)
+        self._parquet: Dict[str, Tuple[int, int, pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _read(self, path: str, st: os.stat_result) -> _CacheEntry:
+        # Una sola lectura de disco; el fallback de encoding se hace sobre los bytes
+        with open(path, "rb") as f:
+            raw = f.read()
+        try:
+            text, encoding = raw.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            text, encoding = raw.decode("latin-1"), "latin-1"
+        return _CacheEntry(mtime_ns=st.st_mtime_ns, size=st.st_size, text=text, encoding=encoding,
+                           sha256=hashlib.sha256(raw).hexdigest())
+
+    def get_entry(self, path: str) -> _CacheEntry:
+        path = os.path.realpath(path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(path, None)
+            raise FileNotFoundError(f"Data file not found at: {path}")
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = self._read(path, st)
+        with self._lock:
+            self._entries[path] = entry
+        return entry
+
+    def get_text(self, path: str) -> str:
+        return self.get_entry(path).text
+
+    def get_frame(self, path: str) -> pd.DataFrame:
+        """Devuelve el dataset parseado; el DataFrame se construye una vez por versión del archivo."""
+        entry = self.get_entry(path)
+        if entry.frame is None:
+            frame = pd.read_csv(io.StringIO(entry.text), parse_dates=["fecha"])
+            # Etiquetas políticas como categorías ordenadas por cronología (primera aparición)
+            for col in POLITICAL_COLUMNS:
+                if col in frame.columns:
+                    frame[col] = pd.Categorical(frame[col], categories=pd.unique(frame[col].dropna()), ordered=True)
+            entry.frame = frame
+        return entry.frame
+
+    def get_parquet_frame(self, path: str) -> pd.DataFrame:
+        """Lee un Parquet completo una vez por versión del archivo (misma revalidación por stat())."""
+        path = os.path.realpath(path)
+        st = os.stat(path)
+        with self._lock:
+            cached = self._parquet.get(path)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                self.hits += 1
+                return cached[2]
+            self.misses += 1
+        frame = pd.read_parquet(path)
+        with self._lock:
+            self._parquet[path] = (st.st_mtime_ns, st.st_size, frame)
+        return frame
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._parquet.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries) + len(self._parquet)}
+
+
+# Cache compartido por todas las instancias de DataLoadService del proceso
+dataset_cache = DatasetCache()
+
+
+class DataLoadService:
+    def __init__(self, cache: Optional[DatasetCache] = None, parquet_store: Optional[ParquetStore] = None):
+        self.cache = cache if cache is not None else dataset_cache
+        self.parquet_store = parquet_store or ParquetStore()
 
     def _get_full_data_path(self, relative_path: str) -> str:
         base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -13,16 +129,57 @@ class DataLoadService:
         """
         Loads the content of a data file from the given relative path.
         Tries UTF-8 first, falls back to latin-1 if decode error occurs.
+        The decoded text is served from the in-memory cache while the file is unchanged.
         """
         full_file_path = self._get_full_data_path(relative_file_path)
-        if not os.path.exists(full_file_path):
-            raise FileNotFoundError(f"Data file not found at: {full_file_path}")
+        return self.cache.get_text(full_file_path)
 
-        try:
-            with open(full_file_path, 'r', encoding='utf-8') as f:
-                data = f.read()
-        except UnicodeDecodeError:
-            # Fallback: try latin-1
-            with open(full_file_path, 'r', encoding='latin-1') as f:
-                data = f.read()
-        return data
+    @staticmethod
+    def _dataset_name(full_file_path: str) -> str:
+        return os.path.splitext(os.path.basename(full_file_path))[0]
+
+    def load_frame(self, relative_file_path: str) -> pd.DataFrame:
+        """
+        Loads a dataset as a DataFrame (parsed once and cached).
+        Reads the Parquet copy from the ParquetStore when it is up to date with the
+        source file (typed columnar read, no text parsing); otherwise parses the CSV.
+        The returned frame is shared; callers must copy it before mutating.
+        """
+        full_file_path = self._get_full_data_path(relative_file_path)
+        name = self._dataset_name(full_file_path)
+        if self.parquet_store.is_fresh(name, full_file_path):
+            return self.cache.get_parquet_frame(self.parquet_store.path(name))
+        return self.cache.get_frame(full_file_path)
+
+    def sync_parquet(self, relative_file_paths: Iterable[str]) -> List[str]:
+        """
+        Writes a Parquet copy of every dataset whose copy is missing or older than
+        the source file, so later load_frame calls skip the CSV parsing.
+        Returns the dataset names that were (re)written.
+        """
+        written = []
+        for relative_file_path in relative_file_paths:
+            full_file_path = self._get_full_data_path(relative_file_path)
+            name = self._dataset_name(full_file_path)
+            if self.parquet_store.is_fresh(name, full_file_path):
+                continue
+            self.parquet_store.write(name, self.cache.get_frame(full_file_path))
+            written.append(name)
+        return written
+
+    def datasets_fingerprint(self, pattern: str = "data/datasets/pib_yoy*.txt") -> str:
+        """
+        Returns a content hash of every dataset matching the pattern.
+        It changes whenever any of the files is edited, so it can be used to
+        invalidate anything derived from the datasets (e.g. cached LLM answers).
+        """
+        digest = hashlib.sha256()
+        for path in sorted(glob.glob(self._get_full_data_path(pattern))):
+            entry = self.cache.get_entry(path)
+            digest.update(os.path.basename(path).encode("utf-8"))
+            digest.update(entry.sha256.encode("ascii"))
+        return digest.hexdigest()
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Returns the hit/miss counters of the dataset cache."""
+        return self.cache.stats()
@@ -0,0 +1,351 @@
+# be_government/app/services/numeric_query_service.py
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from app.services.context_pruning_service import (
+    PARTY_ALIASES,
+    POLITICAL_COLUMNS,
+    _YEAR_RANGE_RE,
+    _YEAR_RE,
+    _name_tokens,
+)
+from app.services.response_cache_service import normalize_question
+from app.services.stats_service import AdministrationStatsService
+
+# Frases normalizadas -> estadística de la tabla por administración (STAT_COLUMNS)
+STATISTIC_ALIASES: Dict[str, str] = {
+    "promedio": "mean",
+    "media": "mean",
+    "en promedio": "mean",
+    "mediana": "median",
+    "maximo": "max",
+    "minimo": "min",
+    "desviacion": "std",
+    "desviacion estandar": "std",
+    "volatilidad": "std",
+    "percentil 25": "p25",
+    "primer cuartil": "p25",
+    "percentil 75": "p75",
+    "tercer cuartil": "p75",
+    "cuantos trimestres": "count",
+}
+
+STATISTIC_NAMES: Dict[str, str] = {
+    "mean": "el promedio",
+    "median": "la mediana",
+    "max": "el máximo",
+    "min": "el mínimo",
+    "std": "la desviación estándar",
+    "p25": "el percentil 25",
+    "p75": "el percentil 75",
+    "count": "el número de trimestres",
+}
+
+# Sinónimos de las variables más consultadas (además de las palabras del nombre de columna)
+VARIABLE_SYNONYMS: Dict[str, Tuple[str, ...]] = {
+    "PIB_TC": ("pib", "producto interno bruto", "economia", "crecimiento economico"),
+    "PIB_Gasto_Consumo_Final_Hogares_TC": ("consumo de los hogares", "consumo de hogares", "consumo privado"),
+    "PIB_Gasto_Consumo_Final_Gobierno_General_TC": ("gasto del gobierno", "consumo del gobierno", "gasto publico"),
+    "PIB_Formacion_Bruta_Capital_Fijo_TC": ("inversion", "formacion bruta de capital"),
+    "PIB_Exportaciones_Bienes_Servicios_TC": ("exportaciones",),
+    "PIB_Importaciones_Bienes_Servicios_TC": ("importaciones",),
+    "PIB_RegEsp_TC": ("regimen especial", "zonas francas", "zona franca"),
+    "PIB_RegDef_TC": ("regimen definitivo",),
+    "PIB_Hoteles_Restaurantes_TC": ("turismo", "hoteles", "restaurantes"),
+    "PIB_Agricultura_Silvicultura_Pesca_TC": ("agricultura",),
+    "Agro_TC": ("agro", "sector agropecuario"),
+    "Servicios_TC": ("sector servicios", "servicios"),
+    "Industria_Ampliada_TC": ("industria ampliada",),
+}
+
+# Palabras que piden análisis narrativo: esas preguntas siguen por el pipeline de agentes
+NARRATIVE_KEYWORDS = (
+    "por que", "explica", "explique", "analiza", "analice", "analisis", "describe", "describa",
+    "evalua", "evalue", "impacto", "causas", "informe", "reporte", "contexto", "tendencia",
+)
+
+# Comparaciones entre gobiernos o superlativos ("¿quién tuvo mayor crecimiento?",
+# "el peor año"): la tabla da estadísticas trimestrales por administración, no un
+# ranking, así que esas preguntas siguen por el pipeline
+COMPARATIVE_KEYWORDS = (
+    "mayor", "menor", "mejor", "peor", "mas alto", "mas alta", "mas bajo", "mas baja", "pico",
+    "que gobierno", "cual gobierno", "que administracion", "cual administracion", "quien",
+    "compara", "comparar", "comparacion", "versus", "vs", "ranking",
+)
+
+# Granularidades distintas del trimestre: la tabla no tiene estadísticas anuales ni mensuales
+GRANULARITY_KEYWORDS = ("ano", "anos", "anual", "anuales", "anualmente", "mes", "meses", "mensual")
+
+_NAME_STOPWORDS = {"pib", "tc", "so", "sd", "bienes", "final", "general", "otras", "actividades"}
+
+# La respuesta local solo sirve si la pregunta no pide nada más: tras reconocer
+# estadística, variable y administraciones, las palabras restantes deben ser de relleno.
+# Cualquier otra ("sin contar la pandemia", "y qué sectores...") sigue por el pipeline.
+FILLER_WORDS = {
+    "el", "la", "los", "las", "lo", "un", "una", "su", "sus", "de", "del", "en", "con", "durante",
+    "bajo", "para", "al", "a", "entre", "fue", "fueron", "es", "era", "ha", "sido", "tuvo", "hubo",
+    "hay", "registro", "gobierno", "gobiernos", "administracion", "administraciones", "periodo",
+    "mandato", "presidente", "presidencia", "partido", "crecimiento", "interanual", "tasa",
+    "variacion", "trimestral", "valor", "dato",
+}
+# Interrogativos: solo al inicio de la pregunta; más adelante abren otra pregunta
+QUESTION_WORDS = {"cual", "cuales", "que", "como", "cuanto", "cuanta"}
+# Conjunciones: solo entre dos administraciones ("con Arias y Chinchilla")
+CONJUNCTIONS = {"y", "e", "o", "u"}
+
+
+@dataclass
+class NumericAnswer:
+    """Respuesta exacta a una pregunta numérica, sacada de la tabla por administración."""
+    statistic: str
+    variable: str
+    dataset: str
+    rows: List[Dict] = field(default_factory=list)
+
+    @property
+    def variable_name(self) -> str:
+        name = re.sub(r"^PIB_|_TC$", "", self.variable).replace("_", " ")
+        return "PIB total" if self.variable == "PIB_TC" else name
+
+    def to_text(self) -> str:
+        stat = STATISTIC_NAMES[self.statistic]
+        lines = []
+        for row in self.rows:
+            admin = f"Durante la administración de {row['President']} ({row['Party']}, {row['Term']})"
+            if self.statistic == "count":
+                lines.append(
+                    f"{admin} hay {int(row['value'])} trimestres observados del crecimiento "
+                    f"interanual de {self.variable_name}."
+                )
+            else:
+                lines.append(
+                    f"{admin}, {stat} trimestral del crecimiento interanual de {self.variable_name} "
+                    f"fue {row['value']:.2f}%, calculado sobre {row['count']} trimestres."
+                )
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict:
+        return {
+            "statistic": self.statistic,
+            "variable": self.variable,
+            "dataset": self.dataset,
+            "rows": self.rows,
+        }
+
+
+class NumericQueryService:
+    """
+    Camino determinístico para preguntas numéricas ("¿cuál fue el crecimiento
+    promedio del PIB con Arias?"): detecta administración, variable y
+    estadística y responde desde las tablas precalculadas de
+    AdministrationStatsService, sin LLM.
+
+    `answer` devuelve None cuando la pregunta necesita análisis narrativo,
+    compara gobiernos, pide otra granularidad (años, meses), no se puede
+    resolver sin ambigüedad o contiene algo más que la estadística pedida
+    (exclusiones, otras preguntas); entonces se usa el pipeline de agentes.
+    """
+
+    def __init__(self, stats_service: AdministrationStatsService, dataset_paths: List[str]):
+        self.stats_service = stats_service
+        self.dataset_paths = list(dataset_paths)
+        self._stat_patterns = sorted(
+            ((alias, re.compile(rf"\b{alias}\b"), stat) for alias, stat in STATISTIC_ALIASES.items()),
+            key=lambda item: -len(item[0]),
+        )
+        self._pipeline_patterns = [
+            re.compile(rf"\b{kw}\b")
+            for kw in NARRATIVE_KEYWORDS + COMPARATIVE_KEYWORDS + GRANULARITY_KEYWORDS
+        ]
+        self._variables: Optional[Dict[str, Tuple[str, List[Tuple[str, re.Pattern]]]]] = None
+        self._lookup: Dict[str, Tuple[Dict[Tuple[str, str], Dict], pd.DataFrame]] = {}
+        self._scope_index: Optional[Tuple[int, List[Tuple[str, set, str, str]]]] = None
+
+    # ---------------------------
+    # Vocabulario
+    # ---------------------------
+    def _variable_aliases(self) -> Dict[str, Tuple[str, List[Tuple[str, re.Pattern]]]]:
+        """variable -> (dataset, alias normalizados compilados), a partir de las tablas de estadísticas."""
+        if self._variables is None:
+            variables = {}
+            for path in self.dataset_paths:
+                table = self.stats_service.get_table(path)
+                for variable in table["variable"].unique():
+                    tokens = [t for t in normalize_question(variable.replace("_", " ")).split()
+                              if t not in _NAME_STOPWORDS]
+                    aliases = [" ".join(tokens)] if tokens else []
+                    aliases += list(VARIABLE_SYNONYMS.get(variable, ()))
+                    variables[variable] = (path, [(a, re.compile(rf"\b{re.escape(a)}\b")) for a in aliases if a])
+            self._variables = variables
+        return self._variables
+
+    def _row_lookup(self, path: str) -> Tuple[Dict[Tuple[str, str], Dict], pd.DataFrame]:
+        """
+        Filas de la tabla indexadas por (Label, variable) y la tabla de
+        administraciones (una fila por Label, en orden cronológico).
+        """
+        table = self.stats_service.get_table(path)
+        key = f"{path}:{id(table)}"
+        cached = self._lookup.get(key)
+        if cached is None:
+            rows = {(row["Label"], row["variable"]): row for row in table.to_dict("records")}
+            admins = table[list(POLITICAL_COLUMNS)].drop_duplicates("Label").reset_index(drop=True)
+            # Una tabla nueva (dataset modificado) reemplaza a la anterior
+            self._lookup = {k: v for k, v in self._lookup.items() if not k.startswith(f"{path}:")}
+            cached = self._lookup[key] = (rows, admins)
+        return cached
+
+    def warm_up(self) -> None:
+        """Prepara vocabulario, índices por (Label, variable) y administraciones."""
+        self._variable_aliases()
+        for path in self.dataset_paths:
+            self._row_lookup(path)
+        self._administrations()
+
+    # ---------------------------
+    # Parseo
+    # ---------------------------
+    def parse_statistic(self, text: str) -> Optional[str]:
+        for alias, pattern, stat in self._stat_patterns:
+            if pattern.search(text):
+                return stat
+        return None
+
+    def parse_variable(self, text: str) -> Optional[Tuple[str, str]]:
+        """Variable cuyo alias más largo aparece en la pregunta; None si hay empate entre variables."""
+        best, best_len, tied = None, 0, False
+        for variable, (path, aliases) in self._variable_aliases().items():
+            for alias, pattern in aliases:
+                if len(alias) >= best_len and pattern.search(text):
+                    if len(alias) > best_len:
+                        best, best_len, tied = (variable, path), len(alias), False
+                    elif best is not None and best[0] != variable:
+                        tied = True
+        return None if tied else best
+
+    def _administrations(self) -> List[Tuple[str, set, str, str]]:
+        """(Label, nombres reconocibles, partido normalizado, período "a-b") por administración."""
+        _, admins = self._row_lookup(self.dataset_paths[0])
+        if self._scope_index is None or self._scope_index[0] != id(admins):
+            index = [
+                (str(label),
+                 set(_name_tokens(str(president))) | {normalize_question(str(label))},
+                 normalize_question(str(party)),
+                 str(term).replace("–", "-"))
+                for president, party, term, label in admins[list(POLITICAL_COLUMNS)].itertuples(index=False)
+            ]
+            self._scope_index = (id(admins), index)
+        return self._scope_index[1]
+
+    def parse_labels(self, question: str) -> List[str]:
+        """
+        Administraciones de la pregunta, con las mismas reglas que
+        detect_question_scope pero sobre un índice precalculado (sin pandas).
+        Los años o rangos que no son un período completo devuelven [].
+        """
+        text = normalize_question(question)
+        words = set(text.split())
+        parties = {normalize_question(party) for alias, party in PARTY_ALIASES.items()
+                   if re.search(rf"\b{alias}\b", text)}
+        admins = self._administrations()
+        labels = {label for label, names, party, _ in admins if names & words or party in words or party in parties}
+
+        terms = {term: label for label, _, _, term in admins}
+        raw = question.replace("–", "-").replace("—", "-")
+        consumed = []
+        for match in _YEAR_RANGE_RE.finditer(raw):
+            first, last = sorted((int(match.group(1)), int(match.group(2))))
+            label = terms.get(f"{first}-{last}")
+            if label is None:
+                return []
+            labels.add(label)
+            consumed.append(match.span())
+        if any(not any(start <= m.start() < end for start, end in consumed) for m in _YEAR_RE.finditer(raw)):
+            return []
+        return list(labels)
+
+    def covers_question(self, text: str, statistic: str, variable: str, labels: List[str]) -> bool:
+        """
+        True si estadística, variable y administraciones reconocidas cubren
+        toda la pregunta normalizada (`text`), salvo palabras de relleno, un
+        interrogativo inicial y conjunciones entre administraciones.
+        """
+        parsed = [False] * len(text)
+        admin = [False] * len(text)
+
+        def mark(pattern: re.Pattern, flags: List[bool]) -> None:
+            for match in pattern.finditer(text):
+                flags[match.start():match.end()] = [True] * (match.end() - match.start())
+
+        for _, pattern, stat in self._stat_patterns:
+            if stat == statistic:
+                mark(pattern, parsed)
+        for _, pattern in self._variable_aliases()[variable][1]:
+            mark(pattern, parsed)
+
+        chosen = [entry for entry in self._administrations() if entry[0] in labels]
+        words = set()
+        for label, names, party, _ in chosen:
+            words |= names | {party}
+        for alias, party in PARTY_ALIASES.items():
+            if normalize_question(party) in words:
+                mark(re.compile(rf"\b{alias}\b"), admin)
+        if words:
+            mark(re.compile(r"\b(?:" + "|".join(re.escape(w) for w in sorted(words)) + r")\b"), admin)
+        # parse_labels ya rechazó los años que no son un período completo
+        mark(_YEAR_RANGE_RE, admin)
+        mark(_YEAR_RE, admin)
+
+        tokens = [(m.group(), any(parsed[m.start():m.end()]), any(admin[m.start():m.end()]))
+                  for m in re.finditer(r"\S+", text)]
+        for i, (token, is_parsed, is_admin) in enumerate(tokens):
+            if is_parsed or is_admin or token in FILLER_WORDS:
+                continue
+            if token in QUESTION_WORDS and i == 0:
+                continue
+            if (token in CONJUNCTIONS and 0 < i < len(tokens) - 1
+                    and tokens[i - 1][2] and tokens[i + 1][2]):
+                continue
+            return False
+        return True
+
+    # ---------------------------
+    # Respuesta
+    # ---------------------------
+    def answer(self, question: str) -> Optional[NumericAnswer]:
+        text = normalize_question(question or "")
+        if not text or any(pattern.search(text) for pattern in self._pipeline_patterns):
+            return None
+        statistic = self.parse_statistic(text)
+        if statistic is None:
+            return None
+        variable = self.parse_variable(text)
+        if variable is None:
+            return None
+        labels = self.parse_labels(question)
+        if not labels:
+            return None
+        if not self.covers_question(text, statistic, variable[0], labels):
+            return None
+
+        variable_name, path = variable
+        lookup, admins = self._row_lookup(path)
+        order = {label: i for i, label in enumerate(admins["Label"])}
+        rows = []
+        for label in labels:
+            row = lookup.get((label, variable_name))
+            if row is None:
+                return None
+            rows.append({
+                "Label": row["Label"],
+                "President": row["President"],
+                "Party": row["Party"],
+                "Term": row["Term"],
+                "value": float(row[statistic]),
+                "count": int(row["count"]),
+            })
+        rows.sort(key=lambda r: order.get(r["Label"], len(order)))
+        return NumericAnswer(statistic, variable_name, path, rows)
@@ -0,0 +1,208 @@
+# be_government/app/services/question_router_service.py
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from app.models.enums.ai_agent_enums import AgentType
+from app.services.context_pruning_service import POLITICAL_COLUMNS
+from app.services.response_cache_service import normalize_question
+
+# Agentes analistas del reporte, en el orden del informe final
+REPORT_AGENTS: List[str] = [
+    AgentType.SPENT.value,
+    AgentType.INDUSTRY.value,
+    AgentType.SECTORS.value,
+    AgentType.REGIMEN.value,
+    AgentType.GROWTH_INTERANUAL.value,
+]
+
+# Palabras clave normalizadas (sin tildes, minúsculas) por agente
+TOPIC_KEYWORDS: Dict[str, tuple] = {
+    AgentType.SPENT.value: (
+        "gasto", "consumo", "hogares", "gobierno general", "inversion", "formacion bruta",
+        "capital fijo", "exportaciones", "exportacion", "importaciones", "importacion",
+        "demanda", "componentes del gasto",
+    ),
+    AgentType.INDUSTRY.value: (
+        "industria", "industrias", "actividad economica", "actividades economicas", "manufactura",
+        "agricultura", "mineria", "minas", "electricidad", "construccion", "comercio", "transporte",
+        "hoteles", "restaurantes", "turismo", "informacion y comunicaciones", "financieras",
+        "seguros", "inmobiliario", "inmobiliarias", "profesionales", "administracion publica",
+        "educacion", "salud",
+    ),
+    AgentType.SECTORS.value: (
+        "sector", "sectores", "agro", "agropecuario", "servicios", "industria ampliada",
+        "estructura productiva",
+    ),
+    AgentType.REGIMEN.value: (
+        "regimen", "regimenes", "regimen especial", "regimen definitivo", "zona franca",
+        "zonas francas", "perfeccionamiento activo",
+    ),
+    AgentType.GROWTH_INTERANUAL.value: (
+        "pib", "crecimiento", "crecimiento interanual", "producto interno", "economia",
+        "desempeno economico", "recesion", "expansion",
+    ),
+}
+
+# Palabras que piden el informe completo
+FULL_REPORT_KEYWORDS = ("informe completo", "reporte completo", "analisis completo", "informe integral", "todos los analisis")
+
+# Fragmentos de nombres de columna que no identifican un tema
+_COLUMN_STOPWORDS = {
+    "pib", "tc", "so", "sd", "fecha", "bienes", "final", "general", "gobierno", "servicios",
+    "otras", "actividades",
+}
+
+# Términos genéricos del PIB total: no bastan para activar solo al analista de
+# crecimiento ("¿cómo le fue a la economía con Chaves?" pide el informe completo)
+_GENERIC_GROWTH_TERMS = {"pib", "economia", "crecimiento", "producto interno", "desempeno economico", "expansion"}
+
+ROUTER_PROMPT = """
+Clasifica la pregunta del usuario según los analistas que se necesitan para responderla.
+Analistas disponibles:
+- spent: componentes del gasto (consumo de hogares y gobierno, inversión, exportaciones, importaciones)
+- industry: actividades económicas / industrias
+- sectors: sectores agregados (agro, industria ampliada, servicios)
+- regimen: régimen definitivo y régimen especial (zonas francas)
+- growth_interanual: crecimiento interanual del PIB total
+Responde solo con las claves separadas por comas, sin explicación.
+"""
+
+
+@dataclass
+class RouteDecision:
+    """Analistas elegidos para una pregunta y el motivo de la elección."""
+    agents: List[str]
+    reason: str
+    matches: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def is_full(self) -> bool:
+        return set(self.agents) == set(REPORT_AGENTS)
+
+
+class QuestionRouter:
+    """
+    Enrutador local de preguntas hacia los agentes analistas del reporte.
+
+    1. Palabras clave por tema (TOPIC_KEYWORDS).
+    2. Coincidencia con los nombres de columna de cada dataset de contexto.
+    3. Opcionalmente, un modelo pequeño cuando lo anterior no decide.
+
+    Si la pregunta pide el informe completo o no se reconoce ningún tema
+    (los términos genéricos como "PIB" o "economía" no cuentan como tema),
+    se ejecutan todos los analistas.
+    """
+
+    def __init__(self,
+                 columns: Optional[Dict[str, Iterable[str]]] = None,
+                 llm_client=None):
+        self.llm_client = llm_client
+        self._patterns = {
+            agent: [(kw, re.compile(rf"\b{re.escape(kw)}\b")) for kw in keywords]
+            for agent, keywords in TOPIC_KEYWORDS.items()
+        }
+        self._column_terms = self._column_vocabulary(columns or {})
+
+    @staticmethod
+    def _column_vocabulary(columns: Dict[str, Iterable[str]]) -> Dict[str, set]:
+        """Términos de los nombres de columna de cada dataset (PIB_Construccion_TC -> construccion)."""
+        vocabulary = {}
+        for agent, names in columns.items():
+            terms = set()
+            for name in names:
+                if name in POLITICAL_COLUMNS:
+                    continue
+                for token in normalize_question(name.replace("_", " ")).split():
+                    if len(token) >= 4 and token not in _COLUMN_STOPWORDS:
+                        terms.add(token)
+            vocabulary[agent] = terms
+        return vocabulary
+
+    def _keyword_matches(self, text: str) -> Dict[str, List[str]]:
+        words = set(text.split())
+        matches = {}
+        for agent in REPORT_AGENTS:
+            found = [kw for kw, pattern in self._patterns.get(agent, []) if pattern.search(text)]
+            found += sorted(self._column_terms.get(agent, set()) & words - set(found))
+            if found:
+                matches[agent] = found
+        return matches
+
+    @staticmethod
+    def _resolve_overlaps(matches: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        # "industria ampliada" y "servicios" como sector no deben activar también al analista de industrias
+        sectors = matches.get(AgentType.SECTORS.value, [])
+        industry = matches.get(AgentType.INDUSTRY.value, [])
+        if "industria ampliada" in sectors and set(industry) <= {"industria", "industrias"}:
+            matches = {k: v for k, v in matches.items() if k != AgentType.INDUSTRY.value}
+        # "régimen especial de exportaciones" es una pregunta de régimen, no de gasto
+        spent = matches.get(AgentType.SPENT.value, [])
+        trade = {"exportaciones", "exportacion", "importaciones", "importacion"}
+        if AgentType.REGIMEN.value in matches and set(spent) <= trade:
+            matches = {k: v for k, v in matches.items() if k != AgentType.SPENT.value}
+        # "exportaciones de servicios" es comercio exterior, no el sector servicios
+        elif set(spent) & trade and set(sectors) <= {"servicios"}:
+            matches = {k: v for k, v in matches.items() if k != AgentType.SECTORS.value}
+        return matches
+
+    def _parse_llm_answer(self, answer: str) -> List[str]:
+        text = normalize_question(str(answer))
+        return [agent for agent in REPORT_AGENTS if agent in text]
+
+    def _local_decision(self, question: str) -> Optional[RouteDecision]:
+        """Decisión por palabras clave y vocabulario de columnas; None si no se reconoce ningún tema."""
+        text = normalize_question(question or "")
+        if not text or any(re.search(rf"\b{kw}\b", text) for kw in FULL_REPORT_KEYWORDS):
+            return RouteDecision(list(REPORT_AGENTS), "informe completo")
+
+        matches = self._resolve_overlaps(self._keyword_matches(text))
+        # El PIB total por sí solo no acota la pregunta si hay otro tema más específico
+        specific = {k: v for k, v in matches.items() if k != AgentType.GROWTH_INTERANUAL.value}
+        if set(matches.get(AgentType.GROWTH_INTERANUAL.value, [])) <= _GENERIC_GROWTH_TERMS:
+            # Sin otro tema, los términos genéricos no acotan la pregunta: decide el
+            # modelo (si está activo) o se ejecutan todos los analistas
+            matches = specific
+        if matches:
+            return RouteDecision([a for a in REPORT_AGENTS if a in matches], "palabras clave", matches)
+        return None
+
+    @staticmethod
+    def _llm_prompt(question: str) -> str:
+        return f"{ROUTER_PROMPT}\n\nPregunta del usuario: {question}"
+
+    def _llm_decision(self, answer: str) -> Optional[RouteDecision]:
+        agents = self._parse_llm_answer(answer)
+        return RouteDecision(agents, "modelo enrutador") if agents else None
+
+    @staticmethod
+    def _fallback() -> RouteDecision:
+        return RouteDecision(list(REPORT_AGENTS), "sin tema reconocido")
+
+    def route(self, question: str) -> RouteDecision:
+        decision = self._local_decision(question)
+        if decision is not None:
+            return decision
+        if self.llm_client is not None:
+            try:
+                decision = self._llm_decision(self.llm_client.generate_response(self._llm_prompt(question)))
+                if decision is not None:
+                    return decision
+            except Exception as e:
+                print(f"⚠️  Enrutador LLM no disponible: {e}")
+        return self._fallback()
+
+    async def aroute(self, question: str) -> RouteDecision:
+        """Versión asíncrona de route; la consulta al modelo no bloquea el event loop."""
+        decision = self._local_decision(question)
+        if decision is not None:
+            return decision
+        if self.llm_client is not None:
+            try:
+                answer = await self.llm_client.agenerate_response(self._llm_prompt(question))
+                decision = self._llm_decision(answer)
+                if decision is not None:
+                    return decision
+            except Exception as e:
+                print(f"⚠️  Enrutador LLM no disponible: {e}")
+        return self._fallback()
@@ -0,0 +1,95 @@
+# be_government/app/services/report_assembly_service.py
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from app.services.context_pruning_service import POLITICAL_COLUMNS, _name_tokens, detect_question_scope
+from app.services.response_cache_service import normalize_question
+
+# Secciones del informe final, en el orden de SYSTEM_JOIN_REPORT_PROMPT:
+# (clave del reporte, título, texto cuando el analista no entregó informe)
+REPORT_SECTIONS: List[Tuple[str, str, str]] = [
+    ("gasto", "Componente de gasto", "No se proporcionó informe de gasto."),
+    ("industria", "Análisis de industria", "No se proporcionó informe de industria."),
+    ("sectors", "Informe sectorial", "No se proporcionó informe sectorial."),
+    ("regimen", "Análisis de regimen", "No se proporcionó informe de régimen."),
+    ("growth_interanual", "Análisis de crecimiento interanual",
+     "No se proporcionó informe de crecimiento interanual."),
+]
+
+
+def administrations_table(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Tabla de administraciones (President, Party, Term, Label) en orden
+    cronológico, a partir de las columnas políticas de un dataset etiquetado.
+    """
+    admins = frame.dropna(subset=["Label"])
+    if "fecha" in admins.columns:
+        admins = admins.sort_values("fecha", kind="stable")
+    admins = admins[list(POLITICAL_COLUMNS)].drop_duplicates("Label")
+    return admins.astype(str).reset_index(drop=True)
+
+
+class ReportAssembler:
+    """
+    Ensambla el "## INFORME FINAL" localmente, sin LLM: pega los sub-reportes
+    en las secciones de la plantilla del editor y arma "Gobiernos Analizados"
+    con la tabla de períodos presidenciales.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        # `frame` es cualquier dataset pib_yoy_* (todos comparten las columnas políticas)
+        self.frame = frame
+        self.admins = administrations_table(frame)
+
+    def analyzed_administrations(self, question: str, reports: Dict[str, str]) -> pd.DataFrame:
+        """
+        Administraciones que cubre el informe: las que menciona la pregunta
+        (presidente, partido, período o años) y, si la pregunta no acota
+        ninguna, las que nombran los sub-reportes.
+        """
+        scope = detect_question_scope(question or "", self.frame)
+        labels = set(scope.labels)
+        if scope.parties:
+            labels |= set(self.admins.loc[self.admins["Party"].isin(scope.parties), "Label"])
+        if scope.date_ranges and "fecha" in self.frame.columns:
+            for start, end in scope.date_ranges:
+                in_range = self.frame.loc[self.frame["fecha"].between(start, end), "Label"]
+                labels |= set(in_range.dropna().astype(str))
+
+        if not labels:
+            words = set(normalize_question(" ".join(r for r in reports.values() if r)).split())
+            for president, label in self.admins[["President", "Label"]].itertuples(index=False):
+                if set(_name_tokens(president)) & words:
+                    labels.add(label)
+
+        return self.admins[self.admins["Label"].isin(labels)]
+
+    @staticmethod
+    def _governments_block(admins: pd.DataFrame) -> str:
+        if admins.empty:
+            return "* No se identificaron administraciones específicas en la consulta."
+        return "\n".join(
+            f"* {president} ({party}, {term})"
+            for president, party, term in admins[["President", "Party", "Term"]].itertuples(index=False)
+        )
+
+    def body(self, question: str, reports: Dict[str, str]) -> str:
+        """
+        Gobiernos Analizados más las secciones de los analistas, textuales.
+        Solo se incluyen las secciones de los analistas que recibió `reports`
+        (el enrutador puede omitir algunos); la numeración se ajusta.
+        """
+        admins = self.analyzed_administrations(question, reports)
+        parts = [f"### Gobiernos Analizados\n{self._governments_block(admins)}"]
+        sections = [section for section in REPORT_SECTIONS if section[0] in reports] or REPORT_SECTIONS
+        for number, (key, title, missing) in enumerate(sections, start=1):
+            content = (reports.get(key) or "").strip() or missing
+            parts.append(f"### {number}. {title}\n{content}")
+        return "\n\n".join(parts) + "\n"
+
+    def assemble(self, question: str, reports: Dict[str, str], summary: Optional[str] = None) -> str:
+        document = "## INFORME FINAL\n\n"
+        if summary:
+            document += f"### Resumen\n{summary.strip()}\n\n"
+        return document + self.body(question, reports)
@@ -0,0 +1,261 @@
+# be_government/app/services/response_cache_service.py
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import struct
+import threading
+import time
+import unicodedata
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+def normalize_question(text: str) -> str:
+    """
+    Normaliza una pregunta para el cache: minúsculas, sin tildes, sin signos
+    de puntuación y con los espacios colapsados.
+    "¿Compare Chaves vs Solís?" y "compare chaves vs solis" producen la misma clave.
+    """
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = re.sub(r"[^\w\s]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def hashed_ngram_embedding(text: str, dimensions: int = 256, n: int = 3) -> List[float]:
+    """
+    Embedding local sin dependencias: bolsa de n-gramas de caracteres proyectada
+    con hashing a un vector de tamaño fijo y normalizado (norma L2 = 1).
+    Suficiente para reconocer reformulaciones cercanas de una misma pregunta.
+    """
+    vector = [0.0] * dimensions
+    padded = f" {normalize_question(text)} "
+    for i in range(max(1, len(padded) - n + 1)):
+        gram = padded[i:i + n].encode("utf-8")
+        bucket = int.from_bytes(hashlib.blake2b(gram, digest_size=4).digest(), "little")
+        vector[bucket % dimensions] += 1.0
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def prompt_templates_version(prompts_dir: Optional[str] = None) -> str:
+    """
+    Huella de las plantillas de prompt (app/prompts/*.py). Entra en la clave del
+    cache para que un cambio en cualquier plantilla invalide las respuestas guardadas
+    sin esperar al TTL.
+    """
+    if prompts_dir is None:
+        prompts_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "prompts")
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(prompts_dir)):
+        if name.endswith(".py"):
+            digest.update(name.encode("utf-8"))
+            with open(os.path.join(prompts_dir, name), "rb") as handle:
+                digest.update(handle.read())
+    return digest.hexdigest()[:16]
+
+
+def _pack(vector: Sequence[float]) -> bytes:
+    return struct.pack(f"{len(vector)}f", *vector)
+
+
+def _unpack(blob: bytes) -> List[float]:
+    return list(struct.unpack(f"{len(blob) // 4}f", blob))
+
+
+class ResponseCache:
+    """
+    Cache persistente (SQLite) de respuestas de LLM.
+
+    - Nivel exacto: clave = hash(versión de los prompts, modelo, alcance del prompt,
+      pregunta normalizada, huella de los datasets).
+    - Nivel semántico (opcional): dentro de la misma versión, modelo, alcance y huella, devuelve
+      la respuesta de la pregunta más parecida si la similitud coseno supera el umbral.
+    - Expiración por TTL y desalojo LRU cuando se supera max_entries.
+    """
+
+    def __init__(self,
+                 path: str,
+                 ttl_seconds: int = 7 * 24 * 3600,
+                 max_entries: int = 1000,
+                 semantic_enabled: bool = False,
+                 semantic_threshold: float = 0.95,
+                 embed_fn: Optional[Callable[[str], List[float]]] = None,
+                 version: str = ""):
+        self.path = path
+        self.version = version
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.semantic_enabled = semantic_enabled
+        self.semantic_threshold = semantic_threshold
+        self.embed_fn = embed_fn or hashed_ngram_embedding
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                scope TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                question TEXT NOT NULL,
+                embedding BLOB,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_scope ON llm_responses (model, scope, fingerprint)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_access ON llm_responses (last_access)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, scope: str, question: str, fingerprint: str, version: str = "") -> str:
+        raw = "\x1f".join((version, model, scope, normalize_question(question), fingerprint))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _versioned(self, scope: str) -> str:
+        # La columna scope guarda la versión para que la búsqueda semántica tampoco cruce versiones
+        return f"{self.version}:{scope}" if self.version else scope
+
+    def get(self, model: str, scope: str, question: str, fingerprint: str, semantic: bool = True) -> Optional[str]:
+        now = time.time()
+        key = self.make_key(model, scope, question, fingerprint, self.version)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and not self._expired(row[1], now):
+                self._touch(key, now)
+                self.hits += 1
+                return row[0]
+
+            if self.semantic_enabled and semantic:
+                response = self._semantic_lookup(model, self._versioned(scope), question, fingerprint, now)
+                if response is not None:
+                    self.semantic_hits += 1
+                    return response
+
+            self.misses += 1
+            return None
+
+    def set(self, model: str, scope: str, question: str, fingerprint: str, response: str) -> None:
+        now = time.time()
+        key = self.make_key(model, scope, question, fingerprint, self.version)
+        embedding = _pack(self.embed_fn(question)) if self.semantic_enabled else None
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_responses
+                    (key, model, scope, fingerprint, question, embedding, response, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, model, self._versioned(scope), fingerprint, normalize_question(question), embedding, response, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def _touch(self, key: str, now: float) -> None:
+        self._conn.execute("UPDATE llm_responses SET last_access = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+
+    def _semantic_lookup(self, model, scope, question, fingerprint, now) -> Optional[str]:
+        target = self.embed_fn(question)
+        best_key, best_response, best_score = None, None, -1.0
+        rows = self._conn.execute(
+            """
+            SELECT key, embedding, response, created_at FROM llm_responses
+            WHERE model = ? AND scope = ? AND fingerprint = ? AND embedding IS NOT NULL
+            """,
+            (model, scope, fingerprint),
+        )
+        for key, blob, response, created_at in rows:
+            if self._expired(created_at, now):
+                continue
+            candidate = _unpack(blob)
+            if len(candidate) != len(target):
+                continue
+            score = sum(a * b for a, b in zip(target, candidate))
+            if score > best_score:
+                best_key, best_response, best_score = key, response, score
+        if best_key is not None and best_score >= self.semantic_threshold:
+            print(f"🧠 Cache semántico: similitud {best_score:.3f}")
+            self._touch(best_key, now)
+            return best_response
+        return None
+
+    def _evict(self, now: float) -> None:
+        if self.ttl_seconds > 0:
+            self._conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        if self.max_entries > 0:
+            self._conn.execute(
+                """
+                DELETE FROM llm_responses WHERE key IN (
+                    SELECT key FROM llm_responses ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+            self.hits = self.semantic_hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+            return {
+                "hits": self.hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "entries": entries,
+            }
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Devuelve el cache de respuestas compartido por el proceso (configurado desde app.core.config)."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                from app.core.config import (
+                    LLM_CACHE_MAX_ENTRIES,
+                    LLM_CACHE_PATH,
+                    LLM_CACHE_SEMANTIC_ENABLED,
+                    LLM_CACHE_SEMANTIC_THRESHOLD,
+                    LLM_CACHE_TTL_SECONDS,
+                    LLM_CACHE_VERSION,
+                )
+                path = LLM_CACHE_PATH
+                if not os.path.isabs(path):
+                    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+                    path = os.path.join(base_dir, path)
+                _response_cache = ResponseCache(
+                    path,
+                    ttl_seconds=LLM_CACHE_TTL_SECONDS,
+                    max_entries=LLM_CACHE_MAX_ENTRIES,
+                    semantic_enabled=LLM_CACHE_SEMANTIC_ENABLED,
+                    semantic_threshold=LLM_CACHE_SEMANTIC_THRESHOLD,
+                    version=f"{LLM_CACHE_VERSION}:{prompt_templates_version()}",
+                )
+    return _response_cache
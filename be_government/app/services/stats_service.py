@@ -0,0 +1,131 @@
+# be_government/app/services/stats_service.py
+import os
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from app.core.config import CONTEXT_PRECISION
+from app.services.context_encoding_service import ContextEncoder
+from app.services.context_pruning_service import POLITICAL_COLUMNS, QuestionScope
+from app.services.data_load_service import DataLoadService
+
+# Estadísticas por variable y administración, en el orden en que se presentan
+STAT_COLUMNS = ["count", "mean", "median", "std", "min", "p25", "p75", "max"]
+
+
+def compute_administration_stats(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calcula mean/median/std/min/p25/p75/max/count de cada variable numérica
+    por administración (`Label`) en una sola pasada de groupby.
+
+    Devuelve una tabla larga con columnas Label, President, Party, Term,
+    variable y STAT_COLUMNS, ordenada cronológicamente por administración.
+    """
+    value_cols = [c for c in frame.select_dtypes("number").columns if c not in POLITICAL_COLUMNS]
+    tagged = frame.dropna(subset=["Label"])
+    grouped = tagged.groupby("Label", sort=False, observed=True)[value_cols]
+
+    basic = grouped.agg(["count", "mean", "median", "std", "min", "max"])
+    quantiles = grouped.quantile([0.25, 0.75]).unstack()
+    quantiles.columns = quantiles.columns.set_levels(["p25", "p75"], level=1)
+
+    wide = pd.concat([basic, quantiles], axis=1)
+    long = wide.stack(level=0, future_stack=True).rename_axis(["Label", "variable"]).reset_index()
+
+    # Orden cronológico: primera fecha observada de cada administración
+    if "fecha" in tagged.columns:
+        first_seen = tagged.groupby("Label", sort=False, observed=True)["fecha"].min().sort_values()
+    else:
+        first_seen = pd.Series(range(tagged["Label"].nunique()), index=tagged["Label"].unique())
+    admins = tagged[list(POLITICAL_COLUMNS)].drop_duplicates("Label").set_index("Label")
+
+    long["_order"] = long["Label"].map({label: i for i, label in enumerate(first_seen.index)})
+    long["_var_order"] = long["variable"].map({col: i for i, col in enumerate(value_cols)})
+    long = long.sort_values(["_order", "_var_order"]).drop(columns=["_order", "_var_order"])
+    long = long.join(admins[["President", "Party", "Term"]], on="Label")
+    long["count"] = long["count"].astype(int)
+    return long[["Label", "President", "Party", "Term", "variable"] + STAT_COLUMNS].reset_index(drop=True)
+
+
+class AdministrationStatsService:
+    """
+    Tablas precalculadas de estadísticas por administración para los datasets
+    de contexto. Cada tabla se calcula una vez por versión del dataset (huella
+    sha256), se guarda en disco y se reutiliza entre peticiones y reinicios.
+    """
+
+    def __init__(self,
+                 data_load_service: Optional[DataLoadService] = None,
+                 cache_dir: str = "data/cache/stats",
+                 precision: int = CONTEXT_PRECISION):
+        self.data_load_service = data_load_service or DataLoadService()
+        self.cache_dir = self.data_load_service._get_full_data_path(cache_dir)
+        self.precision = precision
+        self._tables: Dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    def _cache_path(self, relative_path: str, sha256: str) -> str:
+        name = os.path.splitext(os.path.basename(relative_path))[0]
+        return os.path.join(self.cache_dir, f"{name}.{sha256[:16]}.csv")
+
+    def get_table(self, relative_path: str) -> pd.DataFrame:
+        """Devuelve la tabla de estadísticas del dataset (memoria -> disco -> cálculo)."""
+        entry = self.data_load_service.cache.get_entry(self.data_load_service._get_full_data_path(relative_path))
+        key = f"{relative_path}:{entry.sha256}"
+        with self._lock:
+            table = self._tables.get(key)
+        if table is not None:
+            return table
+
+        path = self._cache_path(relative_path, entry.sha256)
+        if os.path.exists(path):
+            table = pd.read_csv(path)
+        else:
+            print(f"📊 Calculando estadísticas por administración: {relative_path}")
+            table = compute_administration_stats(self.data_load_service.load_frame(relative_path))
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            table.to_csv(tmp_path, index=False)
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            # Se descartan versiones anteriores del mismo dataset
+            for old_key in [k for k in self._tables if k.startswith(f"{relative_path}:")]:
+                del self._tables[old_key]
+            self._tables[key] = table
+        return table
+
+    def warm_up(self, relative_paths: Iterable[str]) -> None:
+        for relative_path in relative_paths:
+            try:
+                self.get_table(relative_path)
+            except FileNotFoundError as e:
+                print(f"⚠️  No se pudieron precalcular estadísticas de {relative_path}: {e}")
+
+    def labels_in_scope(self, relative_path: str, scope: Optional[QuestionScope]) -> Optional[List[str]]:
+        """Administraciones que cubre el alcance de la pregunta (None = todas)."""
+        if scope is None or scope.is_empty:
+            return None
+        frame = self.data_load_service.load_frame(relative_path)
+        mask = frame["Label"].isin(scope.labels) | frame["Party"].isin(scope.parties)
+        for start, end in scope.date_ranges:
+            mask |= frame["fecha"].between(start, end)
+        labels = frame.loc[mask, "Label"].dropna().unique().tolist()
+        return labels or None
+
+    def render(self,
+               relative_path: str,
+               scope: Optional[QuestionScope] = None,
+               encoding: str = "csv") -> str:
+        """
+        Serializa la tabla para usarla como contexto del agente, limitada a las
+        administraciones del alcance de la pregunta. `encoding` es uno de los
+        formatos de ContextEncoder (p. ej. "grouped" escribe President/Party/Term
+        una sola vez por administración).
+        """
+        table = self.get_table(relative_path)
+        labels = self.labels_in_scope(relative_path, scope)
+        if labels is not None:
+            table = table[table["Label"].isin(labels)]
+        return ContextEncoder(precision=self.precision).encode(table, encoding)
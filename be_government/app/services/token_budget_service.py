@@ -0,0 +1,319 @@
+# be_government/app/services/token_budget_service.py
+import csv
+import io
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
+
+from app.core.config import (
+    TOKEN_BUDGET_ENABLED,
+    TOKEN_BUDGET_GENERAL_INFORMATION,
+    TOKEN_BUDGET_JOIN_REPORT,
+    TOKEN_BUDGET_MIN_CONTEXT,
+    TOKEN_BUDGET_REPORT_AGENT,
+)
+from app.services.context_encoding_service import SECTION_PREFIX, ContextText
+from app.utils.token_counter import count_tokens
+
+# Filas trimestrales: empiezan con una fecha "AAAA-MM" o "AAAA-MM-DD"
+_QUARTER_ROW_RE = re.compile(r"^(\d{4})-\d{2}(?:-\d{2})?,")
+
+ANNUAL_NOTE = "Nota: filas agregadas a frecuencia anual (promedio de los trimestres de cada año y administración)."
+
+
+@dataclass
+class BudgetDecision:
+    """Resultado de ajustar un prompt al presupuesto de tokens de un agente."""
+    agent: str
+    budget: int
+    prompt_tokens: int
+    final_tokens: int
+    actions: List[str] = field(default_factory=list)
+
+    @property
+    def within_budget(self) -> bool:
+        return self.final_tokens <= self.budget
+
+    def describe(self) -> str:
+        actions = ", ".join(self.actions) if self.actions else "sin cambios"
+        status = "✅" if self.within_budget else "⚠️  excede"
+        return (f"🧮 Presupuesto {self.agent}: {self.prompt_tokens} -> {self.final_tokens} tokens "
+                f"(límite {self.budget}) {status} [{actions}]")
+
+
+class TokenBudgetManager:
+    """
+    Cuenta los tokens del prompt antes de llamar al LLM (tokenizador local) y
+    ajusta el contexto al presupuesto del agente:
+
+    1. Agrega las filas trimestrales a promedios anuales.
+    2. Si aún no cabe, conserva el encabezado declarado por el encoder
+       (`ContextText.header_lines`) y los bloques/líneas más recientes.
+
+    Cada contexto conserva al menos `min_context_tokens`, aunque la plantilla
+    y la pregunta ya agoten el presupuesto (en ese caso se avisa en consola).
+
+    Cada decisión se registra en consola y en `recent_decisions`.
+    """
+
+    def __init__(self,
+                 budgets: Optional[Dict[str, int]] = None,
+                 default_budget: int = TOKEN_BUDGET_REPORT_AGENT,
+                 enabled: bool = TOKEN_BUDGET_ENABLED,
+                 min_context_tokens: int = TOKEN_BUDGET_MIN_CONTEXT,
+                 history: int = 100):
+        self.budgets = {
+            "general_information": TOKEN_BUDGET_GENERAL_INFORMATION,
+            "join_report": TOKEN_BUDGET_JOIN_REPORT,
+            "join_summary": TOKEN_BUDGET_JOIN_REPORT,
+        }
+        self.budgets.update(budgets or {})
+        self.default_budget = default_budget
+        self.enabled = enabled
+        self.min_context_tokens = min_context_tokens
+        self.recent_decisions: Deque[BudgetDecision] = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def budget_for(self, agent: str) -> int:
+        return self.budgets.get(agent, self.default_budget)
+
+    @staticmethod
+    def count(text: str, model: Optional[str] = None) -> int:
+        return count_tokens(text, model)
+
+    def context_allowance(self,
+                          agent: str,
+                          reserved_tokens: int = 0,
+                          parts: int = 1,
+                          budget: Optional[int] = None) -> int:
+        """
+        Tokens disponibles para cada una de `parts` partes de contexto una vez
+        descontada la plantilla. Nunca baja de `min_context_tokens`: si la
+        plantilla ya agota el presupuesto se avisa y se usa ese mínimo.
+        """
+        budget = budget if budget is not None else self.budget_for(agent)
+        share = max(budget - reserved_tokens, 0) // max(parts, 1)
+        if share < self.min_context_tokens:
+            print(f"⚠️  Presupuesto de {agent} agotado: la plantilla y la pregunta usan {reserved_tokens} de "
+                  f"{budget} tokens; cada contexto ({parts}) se recorta al mínimo de {self.min_context_tokens} tokens")
+            share = self.min_context_tokens
+        return share
+
+    def _record(self, decision: BudgetDecision) -> BudgetDecision:
+        with self._lock:
+            self.recent_decisions.append(decision)
+        print(decision.describe())
+        return decision
+
+    # ---------------------------
+    # Reducción de contexto
+    # ---------------------------
+    @staticmethod
+    def aggregate_annual(text: str, precision: int = 2) -> ContextText:
+        """
+        Agrega las filas trimestrales consecutivas a una fila por año (y por
+        combinación de columnas de texto, p. ej. la administración). Los
+        valores numéricos se promedian; el resto de líneas se conserva y la
+        nota de agregación pasa a formar parte del encabezado.
+        """
+        lines = text.splitlines()
+        out: List[str] = []
+        groups: Dict[tuple, list] = {}
+
+        def flush():
+            for (year, texts), sums in groups.items():
+                row = [year]
+                text_values = dict(texts)
+                for i, (total, n) in enumerate(sums):
+                    if i in text_values:
+                        row.append(text_values[i])
+                    else:
+                        row.append("" if n == 0 else round(total / n, precision))
+                buffer = io.StringIO()
+                csv.writer(buffer, lineterminator="").writerow(row)
+                out.append(buffer.getvalue())
+            groups.clear()
+
+        for line in lines:
+            match = _QUARTER_ROW_RE.match(line)
+            if match is None:
+                flush()
+                out.append(line)
+                continue
+            fields = next(csv.reader([line]))[1:]
+            texts, numbers = [], []
+            for i, value in enumerate(fields):
+                try:
+                    numbers.append((i, float(value)))
+                except ValueError:
+                    if value:
+                        texts.append((i, value))
+                    else:
+                        numbers.append((i, None))
+            key = (match.group(1), tuple(texts))
+            sums = groups.setdefault(key, [[0.0, 0] for _ in fields])
+            for i, value in numbers:
+                if value is not None and i < len(sums):
+                    sums[i][0] += value
+                    sums[i][1] += 1
+        flush()
+        return ContextText("\n".join([ANNUAL_NOTE] + out) + "\n",
+                           header_lines=getattr(text, "header_lines", 1) + 1,
+                           section_lines=getattr(text, "section_lines", 1))
+
+    @staticmethod
+    def _sections(lines: List[str]) -> List[List[str]]:
+        """Agrupa las líneas en bloques que empiezan por SECTION_PREFIX (o un único bloque sin cabecera)."""
+        sections: List[List[str]] = []
+        for line in lines:
+            if line.startswith(SECTION_PREFIX) or not sections:
+                sections.append([line])
+            else:
+                sections[-1].append(line)
+        return sections
+
+    def trim(self, text: str, max_tokens: int, model: Optional[str] = None) -> ContextText:
+        """
+        Conserva el encabezado (las `header_lines` que declara el encoder; una
+        línea de columnas para texto plano) y los bloques más recientes que
+        quepan en `max_tokens`. El bloque más antiguo que cabe solo en parte
+        conserva su cabecera (`section_lines`) y sus filas más recientes.
+        """
+        header_lines = getattr(text, "header_lines", 1)
+        section_lines = getattr(text, "section_lines", 1)
+        lines = text.splitlines()
+        preamble, body = lines[:header_lines], lines[header_lines:]
+        note = "[Contexto recortado por presupuesto de tokens: se omitieron {omitted} de {total} líneas de datos, empezando por las más antiguas.]"
+        used = sum(self.count(line + "\n", model) for line in preamble) + self.count(note + "\n", model)
+
+        kept: List[List[str]] = []
+        kept_rows = 0
+        for section in reversed(self._sections(body)):
+            cost = sum(self.count(line + "\n", model) for line in section)
+            if used + cost <= max_tokens:
+                kept.append(section)
+                kept_rows += len(section)
+                used += cost
+                continue
+            head = section[:section_lines] if section[0].startswith(SECTION_PREFIX) else []
+            used += sum(self.count(line + "\n", model) for line in head)
+            rows: List[str] = []
+            for line in reversed(section[len(head):]):
+                cost = self.count(line + "\n", model)
+                if used + cost > max_tokens:
+                    break
+                rows.append(line)
+                used += cost
+            if rows:
+                kept.append(head + rows[::-1])
+                kept_rows += len(head) + len(rows)
+            break
+
+        omitted = len(body) - kept_rows
+        if omitted == 0:
+            return text if isinstance(text, ContextText) else ContextText(text, header_lines, section_lines)
+        note = note.format(omitted=omitted, total=len(body))
+        out = preamble + [note] + [line for section in reversed(kept) for line in section]
+        return ContextText("\n".join(out) + "\n", header_lines=header_lines + 1, section_lines=section_lines)
+
+    def fit_context(self,
+                    agent: str,
+                    context: str,
+                    reserved_tokens: int = 0,
+                    model: Optional[str] = None,
+                    budget: Optional[int] = None) -> str:
+        """
+        Ajusta `context` para que `reserved_tokens` (plantilla + pregunta) más
+        el contexto no superen el presupuesto del agente.
+        """
+        budget = budget if budget is not None else self.budget_for(agent)
+        context_tokens = self.count(context, model)
+        prompt_tokens = reserved_tokens + context_tokens
+        decision = BudgetDecision(agent, budget, prompt_tokens, prompt_tokens)
+        if not self.enabled or prompt_tokens <= budget or not context:
+            self._record(decision)
+            return context
+
+        available = self.context_allowance(agent, reserved_tokens, budget=budget)
+        if budget - reserved_tokens < self.min_context_tokens:
+            decision.actions.append(f"presupuesto agotado: mínimo {available}")
+        if any(_QUARTER_ROW_RE.match(line) for line in context.splitlines()):
+            annual = self.aggregate_annual(context)
+            annual_tokens = self.count(annual, model)
+            decision.actions.append(f"trimestral->anual {context_tokens}->{annual_tokens}")
+            context, context_tokens = annual, annual_tokens
+
+        if context_tokens > available:
+            trimmed = self.trim(context, available, model)
+            trimmed_tokens = self.count(trimmed, model)
+            decision.actions.append(f"recorte {context_tokens}->{trimmed_tokens}")
+            context, context_tokens = trimmed, trimmed_tokens
+
+        decision.final_tokens = reserved_tokens + context_tokens
+        self._record(decision)
+        return context
+
+    def fit_sections(self,
+                     agent: str,
+                     sections: Dict[str, str],
+                     reserved_tokens: int = 0,
+                     model: Optional[str] = None) -> Dict[str, str]:
+        """
+        Reparte el presupuesto entre varios textos (p. ej. los sub-reportes del
+        editor): si no caben, los más largos se recortan hasta igualar su cuota.
+        """
+        budget = self.budget_for(agent)
+        tokens = {key: self.count(text, model) for key, text in sections.items()}
+        prompt_tokens = reserved_tokens + sum(tokens.values())
+        decision = BudgetDecision(agent, budget, prompt_tokens, prompt_tokens)
+        if not self.enabled or prompt_tokens <= budget or not sections:
+            self._record(decision)
+            return sections
+
+        # Cuota equitativa; lo que no usan los textos cortos pasa a los largos
+        available = max(budget - reserved_tokens, 0)
+        remaining = dict(tokens)
+        quotas: Dict[str, int] = {}
+        while remaining:
+            share = available // len(remaining)
+            short = {k: v for k, v in remaining.items() if v <= share}
+            if not short:
+                quotas.update({k: share for k in remaining})
+                break
+            for key, value in short.items():
+                quotas[key] = value
+                available -= value
+                del remaining[key]
+
+        fitted = {}
+        for key, text in sections.items():
+            if tokens[key] > quotas[key]:
+                fitted[key] = self.trim_tail(text, quotas[key], model)
+                decision.actions.append(f"{key} {tokens[key]}->{self.count(fitted[key], model)}")
+            else:
+                fitted[key] = text
+        decision.final_tokens = reserved_tokens + sum(self.count(t, model) for t in fitted.values())
+        self._record(decision)
+        return fitted
+
+    def trim_tail(self, text: str, max_tokens: int, model: Optional[str] = None) -> str:
+        """Conserva el inicio de un texto narrativo (párrafos completos) hasta `max_tokens`."""
+        note = "\n[... texto recortado por presupuesto de tokens]"
+        limit = max(max_tokens - self.count(note, model), 0)
+        kept, used = [], 0
+        for line in text.splitlines():
+            cost = self.count(line + "\n", model)
+            if used + cost > limit:
+                break
+            kept.append(line)
+            used += cost
+        if not kept and text:
+            # Una sola línea más larga que la cuota: se corta por proporción de caracteres
+            ratio = limit / max(self.count(text, model), 1)
+            kept = [text[: int(len(text) * ratio)]]
+        return "\n".join(kept) + note
+
+
+token_budget_manager = TokenBudgetManager()
@@ -2,6 +2,9 @@
 import pandas as pd
 import os
 import glob
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
 # import sys # Removed unnecessary sys import
 
 # Add the project root to   Qu sys.path to enable imports from config
@@ -12,27 +15,198 @@ import glob
 
 from app.core import config # Updated import path
 
-def load_all_excel_data(directory="data/raw"):
-    all_files = glob.glob(os.path.join(directory, "*.xlsx"))
-    df_list = []
-    for file_path in all_files:
-        try:
-            df = pd.read_excel(file_path)
-            df_list.append(df)
-        except Exception as e:
-            print(f"Error loading Excel file {file_path}: {e}")
+def _default_excel_engine():
+    """calamine (Rust) si está instalado; si no, el motor por defecto de pandas (openpyxl)."""
+    if config.EXCEL_ENGINE:
+        return None if config.EXCEL_ENGINE == "default" else config.EXCEL_ENGINE
+    try:
+        import python_calamine  # noqa: F401
+        return "calamine"
+    except ImportError:
+        return None
+
+
+def _read_workbook(file_path, engine=None):
+    """
+    Lee un workbook. Se ejecuta en un proceso del pool, así que no lanza
+    excepciones: devuelve (ruta, DataFrame o None, mensaje de error o None).
+    """
+    try:
+        return file_path, pd.read_excel(file_path, engine=engine), None
+    except Exception as e:
+        return file_path, None, f"{type(e).__name__}: {e}"
+
+
+def _read_workbooks(files, parallel=True, max_workers=None, engine=None):
+    """Lee los workbooks (en paralelo si hay más de uno) y devuelve los resultados en el orden de `files`."""
+    workers = max_workers or config.EXCEL_INGEST_WORKERS or os.cpu_count() or 1
+    workers = min(workers, len(files))
+    if not parallel or workers <= 1:
+        return [_read_workbook(file_path, engine) for file_path in files]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_read_workbook, files, [engine] * len(files)))
+
+
+def _file_sha256(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _sort_by_fecha(df):
+    if 'fecha' in df.columns:
+        df['fecha'] = pd.to_datetime(df['fecha'])
+        df = df.sort_values(by='fecha', kind='stable').reset_index(drop=True)
+    return df
+
+
+class IngestManifest:
+    """
+    Manifiesto de la ingesta incremental de `data/raw`.
+
+    Por cada workbook guarda mtime, tamaño y sha256, y la ruta de su fragmento
+    Parquet ya parseado y ordenado por `fecha`. Un archivo solo se vuelve a
+    parsear si cambió su contenido; si solo cambió el mtime se actualiza la
+    entrada y se reutiliza el fragmento.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.path = os.path.join(cache_dir, "manifest.json")
+        self.entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == self.VERSION:
+                    self.entries = data.get("files", {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Manifiesto de ingesta ilegible, se reconstruye: {e}")
+
+    def lookup(self, file_path):
+        """Devuelve la ruta del fragmento vigente para `file_path`, o None si hay que parsearlo."""
+        entry = self.entries.get(os.path.basename(file_path))
+        if entry is None or not os.path.exists(os.path.join(self.cache_dir, entry["fragment"])):
             return None
-    
-    if df_list:
-        combined_df = pd.concat(df_list, ignore_index=True)
-        if 'fecha' in combined_df.columns:
-            combined_df['fecha'] = pd.to_datetime(combined_df['fecha'])
-            combined_df = combined_df.sort_values(by='fecha').reset_index(drop=True)
-        return combined_df
-    else:
+        st = os.stat(file_path)
+        if entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return os.path.join(self.cache_dir, entry["fragment"])
+        sha256 = _file_sha256(file_path)
+        if entry["sha256"] != sha256:
+            return None
+        # Mismo contenido con otro mtime (p. ej. tras un checkout): se reutiliza el fragmento
+        entry.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+        return os.path.join(self.cache_dir, entry["fragment"])
+
+    def store(self, file_path, df):
+        """Guarda el fragmento ordenado de `file_path` y actualiza su entrada."""
+        st = os.stat(file_path)
+        sha256 = _file_sha256(file_path)
+        name = os.path.basename(file_path)
+        fragment = f"{os.path.splitext(name)[0]}.{sha256[:16]}.parquet"
+        os.makedirs(self.cache_dir, exist_ok=True)
+        df.to_parquet(os.path.join(self.cache_dir, fragment), index=False, compression="zstd")
+
+        previous = self.entries.get(name)
+        if previous and previous["fragment"] != fragment:
+            self._remove_fragment(previous["fragment"])
+        self.entries[name] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": sha256, "fragment": fragment}
+
+    def prune(self, file_paths):
+        """Elimina las entradas (y fragmentos) de workbooks que ya no existen."""
+        present = {os.path.basename(p) for p in file_paths}
+        for name in [n for n in self.entries if n not in present]:
+            self._remove_fragment(self.entries.pop(name)["fragment"])
+
+    def _remove_fragment(self, fragment):
+        try:
+            os.remove(os.path.join(self.cache_dir, fragment))
+        except FileNotFoundError:
+            pass
+
+    def save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "files": self.entries}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def _resolve_cache_dir(cache_dir):
+    cache_dir = cache_dir or config.EXCEL_INGEST_CACHE_DIR
+    if os.path.isabs(cache_dir):
+        return cache_dir
+    app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(app_dir, cache_dir)
+
+
+def load_all_excel_data(directory="data/raw", parallel=True, max_workers=None, engine=None, errors=None,
+                        incremental=True, cache_dir=None):
+    """
+    Carga y concatena todos los *.xlsx de `directory`.
+
+    Los workbooks se parsean en un pool de procesos (`parallel`, `max_workers`)
+    con el motor más rápido disponible (`engine`, por defecto calamine si está
+    instalado). Un archivo con error no aborta la carga: se informa y se omite,
+    y si se pasa una lista en `errors` se le añaden las tuplas (ruta, mensaje).
+
+    Con `incremental`, un manifiesto en `cache_dir` (EXCEL_INGEST_CACHE_DIR)
+    asocia cada workbook a un fragmento Parquet ya ordenado por `fecha`; solo
+    los archivos nuevos o modificados se vuelven a parsear.
+    """
+    all_files = sorted(glob.glob(os.path.join(directory, "*.xlsx")))
+    if not all_files:
+        print("No Excel files found or loaded.")
+        return None
+
+    manifest = IngestManifest(_resolve_cache_dir(cache_dir)) if incremental else None
+    fragments = {}
+    to_parse = []
+    for file_path in all_files:
+        fragment = manifest.lookup(file_path) if manifest is not None else None
+        if fragment is not None:
+            fragments[file_path] = fragment
+        else:
+            to_parse.append(file_path)
+    if manifest is not None:
+        print(f"Ingesta incremental: {len(fragments)} workbooks sin cambios, {len(to_parse)} por parsear")
+
+    engine = engine if engine is not None else _default_excel_engine()
+    parsed = {}
+    for file_path, df, error in _read_workbooks(to_parse, parallel, max_workers, engine) if to_parse else []:
+        if error is not None:
+            print(f"Error loading Excel file {file_path}: {error}")
+            if errors is not None:
+                errors.append((file_path, error))
+            continue
+        # Cada fragmento se guarda ya ordenado; la mezcla final solo intercala tramos ordenados
+        df = _sort_by_fecha(df)
+        parsed[file_path] = df
+        if manifest is not None:
+            try:
+                manifest.store(file_path, df)
+            except Exception as e:
+                print(f"⚠️  No se pudo cachear el fragmento de {file_path}: {e}")
+
+    if manifest is not None:
+        manifest.prune(all_files)
+        manifest.save()
+
+    df_list = [parsed[p] if p in parsed else pd.read_parquet(fragments[p])
+               for p in all_files if p in parsed or p in fragments]
+    if not df_list:
         print("No Excel files found or loaded.")
         return None
 
+    # Una sola concatenación con todos los fragmentos
+    combined_df = pd.concat(df_list, ignore_index=True, copy=False)
+    return _sort_by_fecha(combined_df)
+
 def assign_administration_period(df):
     if df is None or df.empty or 'fecha' not in df.columns:
         return pd.DataFrame()
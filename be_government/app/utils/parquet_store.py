@@ -0,0 +1,104 @@
+import os
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+from app.core import config
+
+# Columnas políticas precalculadas (ver tag_politics en script.py)
+POLITICAL_COLUMNS = ["President", "Party", "Term", "Label"]
+DATE_COLUMN = "fecha"
+COMPRESSION = "zstd"
+
+
+def _app_dir() -> str:
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ParquetStore:
+    """
+    Almacén columnar de las series del PIB.
+
+    Cada serie (TC/SO/SD, componentes, sectores, régimen...) se guarda como un
+    Parquet comprimido con tipos fijos: `fecha` datetime64, valores float64 y
+    las columnas políticas como category. Las lecturas piden solo las columnas
+    necesarias, así que no hace falta parsear el xlsx ni el CSV completo.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        root = root or config.PARQUET_STORE_DIR
+        self.root = root if os.path.isabs(root) else os.path.join(_app_dir(), root)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.root, f"{name}.parquet")
+
+    def exists(self, name: str) -> bool:
+        return os.path.exists(self.path(name))
+
+    def names(self) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(f[: -len(".parquet")] for f in os.listdir(self.root) if f.endswith(".parquet"))
+
+    def is_fresh(self, name: str, source_path: str) -> bool:
+        """True si el Parquet existe y no es más antiguo que su archivo de origen."""
+        target = self.path(name)
+        return os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source_path)
+
+    @staticmethod
+    def normalize(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Aplica los tipos del almacén; acepta `fecha` como índice o como columna.
+        Las columnas políticas quedan como categorías ordenadas por cronología
+        (orden de primera aparición por fecha) si no lo eran ya.
+        """
+        out = df.reset_index() if DATE_COLUMN not in df.columns and df.index.name == DATE_COLUMN else df.copy()
+        out[DATE_COLUMN] = pd.to_datetime(out[DATE_COLUMN])
+        out = out.sort_values(DATE_COLUMN, kind="stable").reset_index(drop=True)
+        for col in out.columns:
+            if col in POLITICAL_COLUMNS:
+                if not (isinstance(out[col].dtype, pd.CategoricalDtype) and out[col].cat.ordered):
+                    out[col] = pd.Categorical(out[col], categories=pd.unique(out[col].dropna()), ordered=True)
+            elif col != DATE_COLUMN:
+                out[col] = pd.to_numeric(out[col], errors="coerce").astype("float64")
+        return out
+
+    def write(self, name: str, df: pd.DataFrame) -> str:
+        path = self.path(name)
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        self.normalize(df).to_parquet(tmp_path, index=False, compression=COMPRESSION)
+        os.replace(tmp_path, path)
+        return path
+
+    def columns(self, name: str) -> List[str]:
+        """Nombres de columna leídos solo del footer del Parquet."""
+        import pyarrow.parquet as pq
+        return pq.read_schema(self.path(name)).names
+
+    def read(self,
+             name: str,
+             columns: Optional[Iterable[str]] = None,
+             include_politics: bool = True,
+             index: bool = False) -> pd.DataFrame:
+        """
+        Lee una serie del almacén.
+
+        `columns` limita la lectura a esas variables (más `fecha` y, si
+        `include_politics`, las columnas políticas). Con `index=True` la
+        fecha pasa a ser el índice, como en los DataFrames de script.py.
+        """
+        selected = None
+        if columns is not None:
+            available = set(self.columns(name))
+            selected = [DATE_COLUMN] + [c for c in columns if c != DATE_COLUMN]
+            if include_politics:
+                selected += [c for c in POLITICAL_COLUMNS if c in available and c not in selected]
+            missing = [c for c in selected if c not in available]
+            if missing:
+                raise KeyError(f"Columnas no encontradas en {name}: {missing}")
+        elif not include_politics:
+            selected = [c for c in self.columns(name) if c not in POLITICAL_COLUMNS]
+
+        df = pd.read_parquet(self.path(name), columns=selected)
+        return df.set_index(DATE_COLUMN) if index else df
@@ -0,0 +1,56 @@
+from functools import lru_cache
+from typing import Optional
+
+# Modelo por defecto para elegir la codificación de tiktoken (o200k_base)
+DEFAULT_TOKENIZER_MODEL = "gpt-4.1"
+# Aproximación cuando tiktoken no está disponible (conservadora: el texto numérico
+# de los CSV rinde ~3 caracteres por token)
+_CHARS_PER_TOKEN = 3
+
+
+_fallback_warned = False
+
+
+def _warn_fallback(reason: str):
+    """Avisa una sola vez por proceso de que los presupuestos de tokens son estimaciones."""
+    global _fallback_warned
+    if not _fallback_warned:
+        _fallback_warned = True
+        print(f"⚠️  ATENCIÓN: {reason}. Los tokens se estiman con ~{_CHARS_PER_TOKEN} caracteres por token "
+              f"y los presupuestos de TokenBudgetManager son aproximados (instalar requirements.txt).")
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    try:
+        import tiktoken
+    except ImportError:
+        _warn_fallback("tiktoken no está instalado")
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # tiktoken descarga las tablas BPE la primera vez; sin red se estima
+        _warn_fallback(f"tokenizador de tiktoken no disponible para {model} ({e.__class__.__name__})")
+        return None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Cuenta tokens localmente con el tokenizador del modelo (tiktoken).
+    Sin tiktoken se estima con ~3 caracteres por token.
+    """
+    if not text:
+        return 0
+    encoding = _encoding(model or DEFAULT_TOKENIZER_MODEL)
+    if encoding is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def has_exact_tokenizer(model: Optional[str] = None) -> bool:
+    """True si el conteo es exacto (tiktoken disponible) y no una estimación."""
+    return _encoding(model or DEFAULT_TOKENIZER_MODEL) is not None
@@ -1,90 +1,69 @@
+import glob
+import os
+import sys
+
 import pandas as pd
 import numpy as np
 
 # ====================================================================
-# PARTE 1: Módulo 'political_terms.py' (Funciones para el Contexto Político)
-#          (Sin cambios)
+# PARTE 1: Contexto Político
+#          Motor de etiquetado compartido con informed_economist
+#          (backend/political_terms.py): posiciones calculadas una vez por
+#          índice y todas las columnas rellenadas con un solo take.
 # ====================================================================
 
-SURNAME_LABEL = {
-    "Rafael Ángel Calderón Fournier": "Calderón",
-    "José María Figueres Olsen": "Olsen",
-    "Miguel Ángel Rodríguez Echeverría": "Rodríguez",
-    "Abel Pacheco": "Pacheco",
-    "Óscar Arias Sánchez": "Arias",
-    "Laura Chinchilla Miranda": "Chinchilla",
-    "Luis Guillermo Solís Rivera": "Solís",
-    "Carlos Alvarado Quesada": "Alvarado",
-    "Rodrigo Chaves Robles": "Chaves",
-}
-
-def _short_label(name: str) -> str:
-    """Retorna la etiqueta del apellido simplificada para un presidente."""
-    if name in SURNAME_LABEL:
-        return SURNAME_LABEL[name]
-    return name.split()[-1] if name else ""
-
-def build_cr_terms() -> pd.DataFrame:
-    """Construye un DataFrame de los períodos presidenciales de Costa Rica (1990 en adelante)."""
-    terms = [
-        ("1990-05-08", "1994-05-08", "Rafael Ángel Calderón Fournier", "PUSC"),
-        ("1994-05-08", "1998-05-08", "José María Figueres Olsen", "PLN"),
-        ("1998-05-08", "2002-05-08", "Miguel Ángel Rodríguez Echeverría", "PUSC"),
-        ("2002-05-08", "2006-05-08", "Abel Pacheco", "PUSC"),
-        ("2006-05-08", "2010-05-08", "Óscar Arias Sánchez", "PLN"),
-        ("2010-05-08", "2014-05-08", "Laura Chinchilla Miranda", "PLN"),
-        ("2014-05-08", "2018-05-08", "Luis Guillermo Solís Rivera", "PAC"),
-        ("2018-05-08", "2022-05-08", "Carlos Alvarado Quesada", "PAC"),
-        ("2022-05-08", "2026-05-08", "Rodrigo Chaves Robles", "PPSD"),
-    ]
-    df = pd.DataFrame(terms, columns=["start","end","President","Party"])
-    df["start"] = pd.to_datetime(df["start"])
-    df["end"]   = pd.to_datetime(df["end"])
-
-    df["Term"] = df["start"].dt.strftime("%Y") + "–" + df["end"].dt.strftime("%Y")
-    df["Label"] = df["President"].map(_short_label)
-    return df
-
-def assign_by_terms(index: pd.DatetimeIndex, terms_df: pd.DataFrame, column: str) -> pd.Series:
-    """Asigna atributos políticos a cada marca de tiempo en un DatetimeIndex."""
-    intervals = pd.IntervalIndex.from_arrays(terms_df["start"], terms_df["end"], closed="both")
-    locs, _ = intervals.get_indexer_non_unique(index)
-
-    out = pd.Series(pd.NA, index=index, dtype="object")
-    mask = locs >= 0
-    if mask.any():
-        values = terms_df[column].to_numpy()
-        out[mask] = values[locs[mask]]
-    return out
-
-def tag_politics(df: pd.DataFrame,
-                 terms_df: pd.DataFrame | None = None,
-                 add_cols: tuple[str, ...] = ("President","Party","Term","Label")) -> pd.DataFrame:
-    """Añade columnas de contexto político a un DataFrame basado en su DatetimeIndex."""
-    if terms_df is None:
-        terms_df = build_cr_terms()
-    out = df.copy()
-    for c in add_cols:
-        out[c] = assign_by_terms(out.index, terms_df, c)
-    return out
+# informed_economist se instala como dependencia (requirements.txt: -e ../informed_economist)
+from backend.political_terms import SURNAME_LABEL, assign_by_terms, build_cr_terms, political_tags, tag_politics
 
 # ====================================================================
 # PARTE 2: Lógica principal para la carga, etiquetado y agregación
 # ====================================================================
 
-def generar_estadisticas_por_gobierno(file_name: str, output_suffix: str) -> list[str]:
+STAT_NAMES = ['mean', 'median', 'std', 'min', 'p25', 'p75', 'max', 'count']
+
+def calcular_estadisticas_por_gobierno(df_tagged: pd.DataFrame,
+                                       exclude_cols: tuple[str, ...] = ("President", "Party", "Term", "Label")) -> pd.DataFrame:
     """
-    Carga un archivo CSV, lo etiqueta con la variable 'Label' del presidente,
-    calcula estadísticas descriptivas para CADA variable por 'Label' y guarda
-    el resultado en un nuevo CSV para CADA variable.
+    Calcula, en una sola pasada de groupby, mean/median/std/min/p25/p75/max/count
+    de TODAS las variables por 'Label'.
+
+    Los percentiles usan el kernel nativo ``quantile([0.25, 0.75])`` en lugar de
+    lambdas por grupo.
+
+    Returns
+    -------
+    pd.DataFrame
+        Tabla ancha: una fila por gobierno ('Presidente') y una columna
+        ``{variable}_{estadistica}`` por combinación, agrupadas por variable.
+    """
+    data_cols = [col for col in df_tagged.columns if col not in exclude_cols]
+    grouped = df_tagged.groupby('Label', observed=True)[data_cols]
+
+    basic = grouped.agg(['mean', 'median', 'std', 'min', 'max', 'count'])
+    quantiles = grouped.quantile([0.25, 0.75]).unstack()
+    quantiles.columns = quantiles.columns.set_levels(['p25', 'p75'], level=1)
+
+    wide = pd.concat([basic, quantiles], axis=1)
+    wide = wide.reindex(columns=pd.MultiIndex.from_product([data_cols, STAT_NAMES]))
+    wide.columns = [f"{variable}_{name}" for variable, name in wide.columns]
+    return wide.rename_axis('Presidente').reset_index()
+
+def generar_estadisticas_por_gobierno(file_name: str, output_suffix: str, split_csv: bool = False) -> list[str]:
+    """
+    Carga un archivo, lo etiqueta con la variable 'Label' del presidente,
+    calcula estadísticas descriptivas de TODAS las variables por 'Label' y
+    guarda el resultado en una única tabla Parquet.
 
     Parameters
     ----------
     file_name : str
-        Nombre del archivo CSV a cargar.
+        Nombre del archivo XLSX a cargar.
     output_suffix : str
         Sufijo para los archivos de salida (e.g., 'MENSUAL' o 'TRIMESTRAL').
-        
+    split_csv : bool
+        Si es True, además escribe un CSV por variable con el formato anterior
+        (``PIB_Estadisticas_por_Gobierno_{variable}_{sufijo}.csv``).
+
     Returns
     -------
     list[str]
@@ -95,8 +74,7 @@ def generar_estadisticas_por_gobierno(file_name: str, output_suffix: str) -> lis
 
     try:
         # 1. Cargar datos y configurar el índice
-        # Usamos read_csv ya que los archivos adjuntos son CSV.
-        df = pd.read_excel(file_name, index_col='fecha', parse_dates=True)
+        df = leer_serie(file_name)
     except FileNotFoundError:
         print(f"ERROR: Archivo no encontrado: {file_name}. Asegúrate de que el nombre y la ruta sean correctos.")
         return []
@@ -104,52 +82,24 @@ def generar_estadisticas_por_gobierno(file_name: str, output_suffix: str) -> lis
     # 2. Etiquetar el DataFrame con el contexto político
     df_tagged = tag_politics(df)
 
-    # 3. Definir las funciones de agregación
-    agg_functions = [
-        'mean',
-        'median',
-        'std',
-        'min',
-        ('p25', lambda x: x.quantile(0.25)),
-        ('p75', lambda x: x.quantile(0.75)),
-        'max',
-        'count'
-    ]
+    # 3. Calcular todas las estadísticas de todas las variables en una sola pasada
+    results = calcular_estadisticas_por_gobierno(df_tagged)
+    print(f"   -> Estadísticas calculadas para {(results.shape[1] - 1) // len(STAT_NAMES)} variables")
 
-    # Columnas a excluir del análisis de estadísticas (columnas políticas añadidas)
-    exclude_cols = ["President", "Party", "Term", "Label"]
-    
-    # Extraer las columnas de datos
-    data_cols = [col for col in df.columns if col not in exclude_cols]
-    
-    # 4. Iterar sobre CADA variable y calcular las estadísticas
-    for variable in data_cols:
-        print(f"   -> Calculando estadísticas para la variable: {variable}")
-        
-        # Agrupar por 'Label' y calcular las estadísticas SÓLO para la variable actual
-        # Usamos [variable] para obtener un DataFrame o Series con solo esa columna/variable
-        results = df_tagged.groupby('Label')[variable].agg(agg_functions).reset_index()
-
-        # 5. Formatear el DataFrame de resultados
-        # Cambiamos los nombres de las columnas de métricas para incluir la variable (aunque ya la sabemos)
-        # y añadimos la columna de Presidente
-        metric_names = [f"{variable}_{name}" if name not in ['p25', 'p75'] else f"{variable}_{name}" 
-                        for name in ['mean', 'median', 'std', 'min', 'p25', 'p75', 'max', 'count']]
-        
-        # Asegurar que el nombre de la columna 'Label' sea 'Presidente'
-        results.columns = ['Presidente'] + [col[1] if isinstance(col, tuple) else col for col in results.columns][1:]
-        
-        # Renombrar las columnas de métricas de forma más limpia
-        results.columns = ['Presidente'] + [f"{variable}_{name}" for name in ['mean', 'median', 'std', 'min', 'p25', 'p75', 'max', 'count']]
-
-        # 6. Guardar el resultado en un nuevo CSV por variable
-        # Limpiamos el nombre de la variable para el nombre de archivo (reemplazar _TC con _TC_ si es necesario, aunque en este caso la variable ya es limpia)
-        file_variable_name = variable.replace(' ', '_').replace('.', '') 
-        output_file = f"PIB_Estadisticas_por_Gobierno_{file_variable_name}_{output_suffix}.csv"
-        results.to_csv(output_file, index=False)
-        
-        generated_files.append(output_file)
-        # print(f"   -> Archivo generado: {output_file}") # Descomentar si quieres ver cada archivo generado
+    # 4. Guardar la tabla completa en Parquet
+    output_file = f"PIB_Estadisticas_por_Gobierno_{output_suffix}.parquet"
+    results.to_parquet(output_file, index=False, compression="zstd")
+    generated_files.append(output_file)
+
+    # 5. (Opcional) Un CSV por variable, como en la versión anterior
+    if split_csv:
+        for start in range(1, results.shape[1], len(STAT_NAMES)):
+            columns = results.columns[start:start + len(STAT_NAMES)]
+            variable = columns[0][: -len("_mean")]
+            file_variable_name = variable.replace(' ', '_').replace('.', '')
+            csv_file = f"PIB_Estadisticas_por_Gobierno_{file_variable_name}_{output_suffix}.csv"
+            results[['Presidente', *columns]].to_csv(csv_file, index=False)
+            generated_files.append(csv_file)
 
     return generated_files
 
@@ -164,7 +114,7 @@ def create_pib_tc_v2_with_president(file_name: str, output_file_name: str):
     """
     print(f"-> Creando {output_file_name} con contexto político...")
     try:
-        df = pd.read_excel(file_name, index_col='fecha', parse_dates=True)
+        df = leer_serie(file_name)
     except FileNotFoundError:
         print(f"ERROR: Archivo no encontrado: {file_name}. Asegúrate de que el nombre y la ruta sean correctos.")
         return
@@ -173,11 +123,141 @@ def create_pib_tc_v2_with_president(file_name: str, output_file_name: str):
     df_tagged.to_excel(output_file_name, index=True)
     print(f"-> Archivo generado: {output_file_name}")
 
+# ====================================================================
+# PARTE 4: Conversión de las series del PIB a Parquet
+# ====================================================================
+
+PARQUET_SCHEMA_PATH = "datasets/costa-rica/pib-gobiernos/schema.yaml"
+
+def leer_serie(file_name: str) -> pd.DataFrame:
+    """
+    Lee una serie con 'fecha' como índice. Acepta el Parquet del almacén
+    (lectura columnar, sin parseo) o el XLSX original.
+    """
+    if file_name.endswith(".parquet"):
+        df = pd.read_parquet(file_name)
+        political = [c for c in ("President", "Party", "Term", "Label") if c in df.columns]
+        return df.drop(columns=political).set_index('fecha')
+    return pd.read_excel(file_name, index_col='fecha', parse_dates=True)
+
+def _exportar_dataset_schema(df_tagged: pd.DataFrame, schema_path: str) -> str | None:
+    """Escribe el 'data.parquet' que declara el schema.yaml del dataset pib-gobiernos."""
+    import yaml
+
+    with open(schema_path, encoding="utf-8") as f:
+        schema = yaml.safe_load(f)
+    source = schema.get("source", {})
+    if source.get("type") != "parquet":
+        return None
+    declared = [col["name"] for col in schema.get("columns", [])]
+    frame = df_tagged.reset_index()
+    present = [c for c in declared if c in frame.columns]
+    missing = [c for c in declared if c not in frame.columns]
+    if missing:
+        print(f"   -> Columnas del schema sin datos (se omiten): {missing}")
+    output_file = os.path.join(os.path.dirname(schema_path), source.get("path", "data.parquet"))
+    frame[present].to_parquet(output_file, index=False, compression="zstd")
+    return output_file
+
+def convertir_a_parquet(raw_dir: str = "app/data/raw",
+                        datasets_dir: str = "app/data/datasets",
+                        schema_path: str | None = PARQUET_SCHEMA_PATH,
+                        force: bool = False) -> list[str]:
+    """
+    Materializa todas las series del PIB en el almacén Parquet de la app
+    (app.utils.parquet_store.ParquetStore) con las etiquetas políticas ya calculadas.
+
+    - ``Variables_PIB_{TC,SO,SD}.xlsx`` -> ``pib_tc``, ``pib_so``, ``pib_sd``
+    - ``pib_yoy*.txt`` (componentes, sectores, régimen, ...) -> mismo nombre
+
+    Solo se reconvierten los archivos más nuevos que su Parquet, salvo ``force``.
+
+    Returns
+    -------
+    list[str]
+        Lista de archivos Parquet generados.
+    """
+    from app.utils.parquet_store import ParquetStore
+
+    store = ParquetStore()
+    generated_files = []
+
+    for file_name in sorted(glob.glob(os.path.join(raw_dir, "Variables_PIB_*.xlsx"))):
+        series = os.path.splitext(os.path.basename(file_name))[0].replace("Variables_PIB_", "")
+        if series not in ("TC", "SO", "SD"):
+            continue
+        name = f"pib_{series.lower()}"
+        if not force and store.is_fresh(name, file_name):
+            print(f"-> {name} al día, se omite")
+            continue
+        print(f"-> Convirtiendo {file_name} -> {store.path(name)}")
+        df_tagged = tag_politics(leer_serie(file_name))
+        generated_files.append(store.write(name, df_tagged))
+        if series == "TC" and schema_path and os.path.exists(schema_path):
+            exported = _exportar_dataset_schema(df_tagged, schema_path)
+            if exported:
+                generated_files.append(exported)
+
+    for file_name in sorted(glob.glob(os.path.join(datasets_dir, "pib_yoy*.txt"))):
+        name = os.path.splitext(os.path.basename(file_name))[0]
+        if not force and store.is_fresh(name, file_name):
+            print(f"-> {name} al día, se omite")
+            continue
+        print(f"-> Convirtiendo {file_name} -> {store.path(name)}")
+        # Los datasets de los analistas ya traen las columnas políticas
+        generated_files.append(store.write(name, pd.read_csv(file_name, parse_dates=['fecha'])))
+
+    return generated_files
+
+def reporte_codificaciones(precision: int | None = None) -> pd.DataFrame:
+    """
+    Tokens de cada formato de contexto (app.services.context_encoding_service)
+    para los cinco datasets de los analistas, comparados con el texto original.
+    Sirve para elegir CONTEXT_ENCODING en app/core/config.py.
+    """
+    from app.core.config import (
+        CONTEXT_ENCODING, CONTEXT_PRECISION, INDUSTRY_DATA_RELATIVE_PATH, INTERANUAL_GROWTH_DATA_RELATIVE_PATH,
+        REGIMEN_DATA_RELATIVE_PATH, SECTORS_DATA_RELATIVE_PATH, SPENT_DATA_RELATIVE_PATH,
+    )
+    from app.services.context_encoding_service import best_encoding, encoding_report
+    from app.services.data_load_service import DataLoadService
+    from app.utils.token_counter import has_exact_tokenizer
+
+    paths = {
+        "spent": SPENT_DATA_RELATIVE_PATH,
+        "industry": INDUSTRY_DATA_RELATIVE_PATH,
+        "regimen": REGIMEN_DATA_RELATIVE_PATH,
+        "sectors": SECTORS_DATA_RELATIVE_PATH,
+        "growth_interanual": INTERANUAL_GROWTH_DATA_RELATIVE_PATH,
+    }
+    report = encoding_report(DataLoadService(), paths,
+                             precision=CONTEXT_PRECISION if precision is None else precision)
+    print(report.to_string(index=False))
+    totals = report.groupby("encoding", sort=False)["tokens"].sum()
+    print("\nTokens totales por formato" + ("" if has_exact_tokenizer() else " (estimados, sin tiktoken)") + ":")
+    print(totals.to_string())
+    best = best_encoding(report)
+    print(f"\n-> Formato con menos tokens: {best} (configurado: CONTEXT_ENCODING={CONTEXT_ENCODING})")
+    return report
+
 # ====================================================================
 # EJECUCIÓN PRINCIPAL
 # ====================================================================
 if __name__ == "__main__":
-    
+
+    # === python script.py parquet [--force]: solo conversión al almacén Parquet ===
+    if len(sys.argv) > 1 and sys.argv[1] == "parquet":
+        archivos = convertir_a_parquet(force="--force" in sys.argv[2:])
+        print("\nProceso completado. Archivos Parquet generados:")
+        for f in archivos:
+            print(f"- {f}")
+        sys.exit(0)
+
+    # === python script.py encodings: tokens por formato de contexto ===
+    if len(sys.argv) > 1 and sys.argv[1] == "encodings":
+        reporte_codificaciones()
+        sys.exit(0)
+
     # === ATENCIÓN: Nombres de archivos corregidos para coincidir con los CSV adjuntos ===
     # Uso los nombres de los archivos CSV que subiste para asegurar que el script funcione.
     archivos_pib = [
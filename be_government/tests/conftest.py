@@ -0,0 +1,42 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Los clientes de OpenAI exigen una clave al construirse; en las pruebas nunca se llama a la API
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+# Las copias Parquet de las pruebas no se escriben en app/data/parquet
+os.environ.setdefault("PARQUET_STORE_DIR", tempfile.mkdtemp(prefix="parquet-store-"))
+
+from app.core.config import (  # noqa: E402
+    INDUSTRY_DATA_RELATIVE_PATH,
+    INTERANUAL_GROWTH_DATA_RELATIVE_PATH,
+    REGIMEN_DATA_RELATIVE_PATH,
+    SECTORS_DATA_RELATIVE_PATH,
+    SPENT_DATA_RELATIVE_PATH,
+)
+
+REPORT_PATHS = {
+    "spent": SPENT_DATA_RELATIVE_PATH,
+    "industry": INDUSTRY_DATA_RELATIVE_PATH,
+    "regimen": REGIMEN_DATA_RELATIVE_PATH,
+    "sectors": SECTORS_DATA_RELATIVE_PATH,
+    "growth_interanual": INTERANUAL_GROWTH_DATA_RELATIVE_PATH,
+}
+
+
+@pytest.fixture(scope="session")
+def data_load_service():
+    from app.services.data_load_service import DataLoadService
+    return DataLoadService()
+
+
+@pytest.fixture(scope="session")
+def stats_service(data_load_service, tmp_path_factory):
+    from app.services.stats_service import AdministrationStatsService
+    return AdministrationStatsService(data_load_service, cache_dir=str(tmp_path_factory.mktemp("stats")))
@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.question_router_service import REPORT_AGENTS, QuestionRouter
+
+
+class AsyncOnlyRouterClient:
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls = 0
+
+    def generate_response(self, prompt):
+        raise AssertionError("el camino async no debe usar la llamada bloqueante")
+
+    async def agenerate_response(self, prompt):
+        self.calls += 1
+        return self.answer
+
+
+def test_router_async_path_uses_agenerate_response():
+    client = AsyncOnlyRouterClient("regimen, sectors")
+    router = QuestionRouter(llm_client=client)
+    decision = asyncio.run(router.aroute("¿Cómo evolucionó el país en esos años?"))
+    assert decision.agents == ["sectors", "regimen"]
+    assert client.calls == 1
+
+
+def test_router_async_path_skips_the_model_when_keywords_decide():
+    client = AsyncOnlyRouterClient("spent")
+    decision = asyncio.run(QuestionRouter(llm_client=client).aroute("crecimiento de la construcción"))
+    assert decision.agents == ["industry"]
+    assert client.calls == 0
+
+
+def test_router_async_path_falls_back_to_all_agents():
+    decision = asyncio.run(QuestionRouter(llm_client=AsyncOnlyRouterClient("no sé")).aroute("hola"))
+    assert decision.agents == REPORT_AGENTS
+
+
+class FakePipeline:
+    async def arun(self, question, context=None, agents=None):
+        return f"informe:{sorted(context)}"
+
+
+@pytest.fixture
+def chat_service(monkeypatch):
+    from app.services.chat_service import ChatService
+
+    service = ChatService()
+    service.report_pipeline = FakePipeline()
+    service.general_information_pipeline = FakePipeline()
+    monkeypatch.setattr(service, "answer_numeric", lambda question: None)
+    return service
+
+
+def test_report_context_is_built_off_the_event_loop(chat_service, monkeypatch):
+    loop_thread = threading.get_ident()
+    seen = {}
+
+    def slow_context(question=None, stats=False, agents=None):
+        seen["thread"] = threading.get_ident()
+        time.sleep(0.2)
+        return {"industry": "ctx"}
+
+    monkeypatch.setattr(chat_service, "_load_report_context", slow_context)
+
+    async def run():
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        response = await chat_service.areport_generation("crecimiento de la construcción con Arias")
+        beat.cancel()
+        return response, ticks
+
+    response, ticks = asyncio.run(run())
+    assert response == "informe:['industry']\n"
+    assert seen["thread"] != loop_thread
+    # El event loop siguió atendiendo otras tareas mientras se cargaba el contexto
+    assert ticks >= 5
+
+
+def test_general_information_context_is_built_off_the_event_loop(chat_service, monkeypatch):
+    loop_thread = threading.get_ident()
+    seen = {}
+
+    def context(*args, **kwargs):
+        seen["thread"] = threading.get_ident()
+        return {"growth_interanual": "ctx"}
+
+    monkeypatch.setattr(chat_service, "_load_general_context", context)
+    assert asyncio.run(chat_service.ageneral_information("hola")) == "informe:['growth_interanual']\n"
+    assert seen["thread"] != loop_thread
+
+
+class AsyncOnlyLLMClient:
+    _model_name = "gpt-4.1"
+
+    def generate_response(self, prompt):
+        raise AssertionError("el camino async no debe usar la llamada bloqueante")
+
+    async def agenerate_response(self, prompt):
+        return "respuesta"
+
+
+@pytest.mark.parametrize("agent_path", [
+    "app.agents.report_agents.ReportIndustryAgent",
+    "app.agents.general_information_agents.GeneralInformationAgent",
+])
+def test_agent_prompt_budget_runs_off_the_event_loop(agent_path, monkeypatch):
+    import importlib
+
+    module_name, class_name = agent_path.rsplit(".", 1)
+    agent = getattr(importlib.import_module(module_name), class_name)()
+    agent.llm_client = AsyncOnlyLLMClient()
+    loop_thread = threading.get_ident()
+    seen = {}
+    build_prompt = agent._build_prompt
+
+    def spy(question, context=""):
+        seen["thread"] = threading.get_ident()
+        return build_prompt(question, context)
+
+    monkeypatch.setattr(agent, "_build_prompt", spy)
+    assert asyncio.run(agent.arun("¿Cómo le fue a Arias?", "fecha,PIB_TC\n2008-03,1.0\n")) == "respuesta"
+    assert seen["thread"] != loop_thread
@@ -0,0 +1,113 @@
+import asyncio
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from app.clients.cached_llm_client import CachedLLMClient
+from app.services.response_cache_service import ResponseCache
+
+
+class FakeClient:
+    _model_name = "fake-model"
+
+    def __init__(self, chunks=None, response="respuesta"):
+        self.chunks = chunks or ["Hola", " mundo"]
+        self.response = response
+        self.calls = 0
+
+    def generate_response(self, prompt):
+        self.calls += 1
+        return self.response
+
+    async def agenerate_response(self, prompt):
+        self.calls += 1
+        return self.response
+
+    async def astream_chat_response(self, messages):
+        self.calls += 1
+        for chunk in self.chunks:
+            yield chunk
+
+
+MESSAGES = [SystemMessage(content="sistema"), HumanMessage(content="pregunta")]
+
+
+def _client(inner):
+    return CachedLLMClient(inner, cache=ResponseCache(":memory:"), fingerprint_fn=lambda: "fp")
+
+
+def _consume(client):
+    async def run():
+        return [chunk async for chunk in client.astream_chat_response(MESSAGES)]
+    return asyncio.run(run())
+
+
+def test_completed_stream_is_cached_and_replayed():
+    inner = FakeClient()
+    client = _client(inner)
+    assert _consume(client) == ["Hola", " mundo"]
+    assert _consume(client) == ["Hola mundo"]
+    assert inner.calls == 1
+
+
+def test_stream_that_fails_midway_is_not_cached():
+    inner = FakeClient(chunks=["Informe parcial", "Error durante la llamada a LangChain: timeout"])
+    client = _client(inner)
+    _consume(client)
+    _consume(client)
+    assert inner.calls == 2
+    assert client.cache.stats()["entries"] == 0
+
+
+def test_stream_closed_by_the_consumer_is_not_cached():
+    inner = FakeClient(chunks=["uno", "dos", "tres"])
+    client = _client(inner)
+
+    async def run():
+        stream = client.astream_chat_response(MESSAGES)
+        first = await stream.__anext__()
+        await stream.aclose()
+        return first
+
+    assert asyncio.run(run()) == "uno"
+    assert client.cache.stats()["entries"] == 0
+
+
+def test_async_responses_use_the_exact_cache():
+    inner = FakeClient()
+    client = _client(inner)
+    prompt = "contexto\n\nPregunta del usuario: ¿Cuál fue el crecimiento?"
+    assert asyncio.run(client.agenerate_response(prompt)) == "respuesta"
+    assert asyncio.run(client.agenerate_response(prompt)) == "respuesta"
+    assert inner.calls == 1
+
+
+def test_error_responses_are_not_cached():
+    inner = FakeClient(response="Error: Falta la API key de OpenAI.")
+    client = _client(inner)
+    client.generate_response("Pregunta del usuario: hola")
+    client.generate_response("Pregunta del usuario: hola")
+    assert inner.calls == 2
+
+
+def test_prompt_version_change_misses_the_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    inner = FakeClient()
+    old = CachedLLMClient(inner, cache=ResponseCache(path, version="v1"), fingerprint_fn=lambda: "fp")
+    _consume(old)
+    _consume(old)
+    assert inner.calls == 1
+
+    new = CachedLLMClient(inner, cache=ResponseCache(path, version="v2", semantic_enabled=True),
+                          fingerprint_fn=lambda: "fp")
+    assert _consume(new) == ["Hola", " mundo"]
+    assert inner.calls == 2
+
+
+def test_prompt_templates_version_tracks_template_edits(tmp_path):
+    from app.services.response_cache_service import prompt_templates_version
+
+    (tmp_path / "spent_prompt.py").write_text('SPENT_PROMPT = "Analiza el gasto"\n')
+    before = prompt_templates_version(str(tmp_path))
+    assert prompt_templates_version(str(tmp_path)) == before
+    (tmp_path / "spent_prompt.py").write_text('SPENT_PROMPT = "Analiza el gasto por componente"\n')
+    assert prompt_templates_version(str(tmp_path)) != before
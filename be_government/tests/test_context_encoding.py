@@ -0,0 +1,85 @@
+import pandas as pd
+import pytest
+
+import script
+from app.core.config import CONTEXT_ENCODING, CONTEXT_PRECISION, INDUSTRY_DATA_RELATIVE_PATH
+from app.services.context_encoding_service import ENCODINGS, ContextEncoder, best_encoding, encoding_report
+from app.services.context_pruning_service import QuestionScope
+from tests.conftest import REPORT_PATHS
+
+FRAME = pd.DataFrame({
+    "fecha": pd.to_datetime(["2018-03-01", "2018-06-01", "2022-06-01"]),
+    "valor": [1.23456, 2.5, -0.004],
+    "President": ["Carlos Alvarado Quesada"] * 2 + ["Rodrigo Chaves Robles"],
+    "Party": ["PAC", "PAC", "PPSD"],
+    "Term": ["2018-2022", "2018-2022", "2022-2026"],
+    "Label": ["Alvarado", "Alvarado", "Chaves"],
+})
+
+
+def test_grouped_writes_political_columns_once_per_administration():
+    text = ContextEncoder(precision=2).encode(FRAME, "grouped")
+    lines = text.splitlines()
+    assert lines[1] == "Columnas: fecha,valor"
+    assert lines[2] == "### Alvarado: Carlos Alvarado Quesada (PAC, 2018-2022)"
+    assert lines[3:5] == ["2018-03,1.23", "2018-06,2.5"]
+    assert text.count("PAC") == 1
+
+
+def test_every_encoding_rounds_to_the_configured_precision():
+    encoder = ContextEncoder(precision=1)
+    for encoding in ("csv", "grouped", "markdown", "blocks"):
+        text = encoder.encode(FRAME, encoding)
+        assert "1.2" in text and "1.23" not in text, encoding
+
+
+def test_unknown_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        ContextEncoder().encode(FRAME, "yaml")
+
+
+@pytest.fixture(scope="module")
+def chat_service():
+    from app.services.chat_service import ChatService
+    return ChatService()
+
+
+def test_general_information_keeps_the_original_dataset_text(chat_service):
+    context = chat_service._load_general_context()
+    assert context["industry"] == chat_service.data_load_service.load_data(INDUSTRY_DATA_RELATIVE_PATH)
+
+
+def test_stats_context_skips_row_encoding_without_date_ranges(chat_service, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("sin rango de fechas no se serializan las filas trimestrales")
+
+    monkeypatch.setattr(chat_service, "_rows_context", fail)
+    context = chat_service._stats_report_context(QuestionScope(labels={"Arias"}), {"industry": INDUSTRY_DATA_RELATIVE_PATH})
+    assert "Observaciones trimestrales" not in context["industry"]
+
+
+def test_stats_context_adds_rows_for_date_ranges(chat_service):
+    scope = QuestionScope(date_ranges=[(pd.Timestamp("2020-01-01"), pd.Timestamp("2020-12-31"))])
+    context = chat_service._stats_report_context(scope, {"industry": INDUSTRY_DATA_RELATIVE_PATH})
+    assert "Observaciones trimestrales del período consultado" in context["industry"]
+    assert "2020-06" in context["industry"]
+
+
+def test_stats_and_rows_share_one_precision(chat_service):
+    assert chat_service.stats_service.precision == CONTEXT_PRECISION == chat_service.context_encoder.precision
+
+
+def test_encoding_report_backs_the_configured_default(data_load_service):
+    report = encoding_report(data_load_service, REPORT_PATHS)
+    assert list(report.columns) == ["dataset", "encoding", "characters", "tokens", "saving_pct"]
+    assert len(report) == len(REPORT_PATHS) * (len(ENCODINGS) + 1)
+    assert (report.loc[report["encoding"] == "raw", "saving_pct"] == 0).all()
+    assert (report.loc[report["encoding"] != "raw", "saving_pct"] > 0).all()
+    assert best_encoding(report) == CONTEXT_ENCODING
+
+
+def test_script_encodings_subcommand_prints_the_report(capsys):
+    report = script.reporte_codificaciones()
+    output = capsys.readouterr().out
+    assert set(report["encoding"]) == {"raw", "csv", "grouped", "markdown", "blocks"}
+    assert "Formato con menos tokens: grouped" in output
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from app.core.config import INTERANUAL_GROWTH_DATA_RELATIVE_PATH
+from app.services.context_pruning_service import ContextPruningService, detect_question_scope
+
+
+@pytest.fixture(scope="module")
+def frame(data_load_service):
+    return data_load_service.load_frame(INTERANUAL_GROWTH_DATA_RELATIVE_PATH)
+
+
+@pytest.fixture(scope="module")
+def text(data_load_service):
+    return data_load_service.load_data(INTERANUAL_GROWTH_DATA_RELATIVE_PATH)
+
+
+def test_detects_presidents_parties_and_terms(frame):
+    scope = detect_question_scope("Compara a Óscar Arias con el gobierno 2018–2022 y el PUSC", frame)
+    assert scope.labels == {"Arias", "Alvarado"}
+    assert scope.parties == {"PUSC"}
+    assert not scope.date_ranges
+
+
+def test_detects_years_and_ranges(frame):
+    scope = detect_question_scope("¿Qué pasó entre 2008 y 2009? ¿Y en 2020-2021? ¿Y en 1995?", frame)
+    assert scope.date_ranges == [
+        (pd.Timestamp(2008, 1, 1), pd.Timestamp(2009, 12, 31)),
+        (pd.Timestamp(2020, 1, 1), pd.Timestamp(2021, 12, 31)),
+        (pd.Timestamp(1995, 1, 1), pd.Timestamp(1995, 12, 31)),
+    ]
+
+
+def test_prune_keeps_the_header_and_only_matching_rows(frame, text):
+    pruned = ContextPruningService().prune(text, frame, question="¿Cómo le fue a Chinchilla?")
+    lines = pruned.splitlines()
+    assert lines[0] == text.splitlines()[0]
+    assert len(lines) - 1 == int((frame["Label"] == "Chinchilla").sum())
+    assert all(line.endswith("Chinchilla") for line in lines[1:])
+
+
+def test_question_without_scope_keeps_the_full_context(frame, text):
+    assert ContextPruningService().prune(text, frame, question="¿Qué es el PIB?") is text
+
+
+def test_report_context_is_pruned_per_analyst(data_load_service):
+    from app.services.chat_service import ChatService
+
+    service = ChatService()
+    context = service._load_report_context("¿Cómo creció la industria con Solís?", agents=["industry"])
+    assert list(context) == ["industry"]
+    assert "### Solís" in context["industry"] and "### Arias" not in context["industry"]
@@ -0,0 +1,93 @@
+import multiprocessing
+import os
+
+import pandas as pd
+import pytest
+
+from app.utils import data_loader
+
+
+def _fake_read_excel(path, engine=None):
+    # Los "workbooks" de prueba son CSV: no hace falta openpyxl ni calamine
+    with open(path, encoding="utf-8") as f:
+        if f.read(2) == "<<":
+            raise ValueError("workbook corrupto")
+    return pd.read_csv(path)
+
+
+@pytest.fixture
+def raw_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader.pd, "read_excel", _fake_read_excel)
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "a.xlsx").write_text("fecha,valor\n2020-06-30,2\n2020-03-31,1\n", encoding="utf-8")
+    (raw / "b.xlsx").write_text("fecha,valor\n2019-12-31,0\n", encoding="utf-8")
+    return raw
+
+
+def test_bad_workbook_is_reported_and_skipped(raw_dir):
+    (raw_dir / "c.xlsx").write_text("<<no es un workbook", encoding="utf-8")
+    errors = []
+    df = data_loader.load_all_excel_data(str(raw_dir), parallel=False, incremental=False, errors=errors)
+    assert df["valor"].tolist() == [0, 1, 2]
+    assert [os.path.basename(path) for path, _ in errors] == ["c.xlsx"]
+    assert "workbook corrupto" in errors[0][1]
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="el lector falso solo llega a los procesos del pool con fork")
+def test_parallel_ingest_matches_sequential(raw_dir):
+    parallel = data_loader.load_all_excel_data(str(raw_dir), parallel=True, max_workers=2, incremental=False)
+    sequential = data_loader.load_all_excel_data(str(raw_dir), parallel=False, incremental=False)
+    pd.testing.assert_frame_equal(parallel, sequential)
+    assert parallel["fecha"].is_monotonic_increasing
+
+
+def test_empty_directory_returns_none(tmp_path):
+    assert data_loader.load_all_excel_data(str(tmp_path), incremental=False) is None
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """Registra qué workbooks se vuelven a parsear."""
+    calls = []
+    real = data_loader._read_workbooks
+
+    def spy(files, *args, **kwargs):
+        calls.append(sorted(os.path.basename(f) for f in files))
+        return real(files, *args, **kwargs)
+
+    monkeypatch.setattr(data_loader, "_read_workbooks", spy)
+    return calls
+
+
+def test_incremental_ingest_only_parses_changed_workbooks(raw_dir, tmp_path, parsed):
+    cache = str(tmp_path / "cache")
+    first = data_loader.load_all_excel_data(str(raw_dir), parallel=False, cache_dir=cache)
+    second = data_loader.load_all_excel_data(str(raw_dir), parallel=False, cache_dir=cache)
+    assert parsed == [["a.xlsx", "b.xlsx"]]
+    pd.testing.assert_frame_equal(first, second, check_dtype=False)
+
+    (raw_dir / "b.xlsx").write_text("fecha,valor\n2019-12-31,0\n2020-09-30,3\n", encoding="utf-8")
+    third = data_loader.load_all_excel_data(str(raw_dir), parallel=False, cache_dir=cache)
+    assert parsed[-1] == ["b.xlsx"]
+    assert third["valor"].tolist() == [0, 1, 2, 3]
+
+
+def test_touched_but_unchanged_workbook_reuses_its_fragment(raw_dir, tmp_path, parsed):
+    cache = str(tmp_path / "cache")
+    data_loader.load_all_excel_data(str(raw_dir), parallel=False, cache_dir=cache)
+    os.utime(raw_dir / "a.xlsx", (0, 0))
+    data_loader.load_all_excel_data(str(raw_dir), parallel=False, cache_dir=cache)
+    assert len(parsed) == 1
+
+
+def test_removed_workbook_is_pruned_from_the_manifest(raw_dir, tmp_path):
+    cache = tmp_path / "cache"
+    data_loader.load_all_excel_data(str(raw_dir), parallel=False, cache_dir=str(cache))
+    (raw_dir / "b.xlsx").unlink()
+    df = data_loader.load_all_excel_data(str(raw_dir), parallel=False, cache_dir=str(cache))
+    assert df["valor"].tolist() == [1, 2]
+    manifest = data_loader.IngestManifest(str(cache))
+    assert list(manifest.entries) == ["a.xlsx"]
+    assert sorted(os.listdir(cache)) == sorted(["manifest.json", manifest.entries["a.xlsx"]["fragment"]])
@@ -0,0 +1,77 @@
+import os
+
+import pandas as pd
+import pytest
+
+from app.services.data_load_service import DatasetCache
+
+CSV = "fecha,valor,Label\n2018-03-01,1.5,Solís\n2018-06-01,2.0,Alvarado\n"
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    path = tmp_path / "pib_yoy_test.txt"
+    path.write_text(CSV, encoding="utf-8")
+    return path
+
+
+def test_unchanged_file_is_served_from_memory(dataset):
+    cache = DatasetCache()
+    first = cache.get_text(str(dataset))
+    assert cache.get_text(str(dataset)) is first
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_edited_file_is_reloaded(dataset):
+    cache = DatasetCache()
+    before = cache.get_entry(str(dataset))
+    dataset.write_text(CSV + "2018-09-01,3.0,Alvarado\n", encoding="utf-8")
+    os.utime(dataset, ns=(before.mtime_ns + 10**9, before.mtime_ns + 10**9))
+    after = cache.get_entry(str(dataset))
+    assert after.sha256 != before.sha256
+    assert len(cache.get_frame(str(dataset))) == 3
+
+
+def test_frame_is_parsed_once_with_ordered_political_categories(dataset):
+    cache = DatasetCache()
+    frame = cache.get_frame(str(dataset))
+    assert cache.get_frame(str(dataset)) is frame
+    assert pd.api.types.is_datetime64_any_dtype(frame["fecha"])
+    assert frame["Label"].cat.ordered and list(frame["Label"].cat.categories) == ["Solís", "Alvarado"]
+
+
+def test_latin1_files_are_decoded(tmp_path):
+    path = tmp_path / "latin.txt"
+    path.write_bytes("fecha,Label\n2018-03-01,Solís\n".encode("latin-1"))
+    entry = DatasetCache().get_entry(str(path))
+    assert entry.encoding == "latin-1" and "Solís" in entry.text
+
+
+def test_deleted_file_is_evicted(dataset):
+    cache = DatasetCache()
+    cache.get_entry(str(dataset))
+    dataset.unlink()
+    with pytest.raises(FileNotFoundError):
+        cache.get_entry(str(dataset))
+    assert cache.stats()["entries"] == 0
+
+
+def test_warm_up_primes_the_shared_cache_for_the_first_request(monkeypatch):
+    from app.services import chat_service as chat_module
+    from app.services.data_load_service import DataLoadService
+    monkeypatch.setattr(chat_module, "NUMERIC_FAST_PATH_ENABLED", False)
+    monkeypatch.setattr(chat_module, "QUESTION_ROUTER_ENABLED", False)
+    monkeypatch.setattr(chat_module, "REPORT_CONTEXT_MODE", "raw")
+    monkeypatch.setattr(chat_module, "PARQUET_SYNC_ON_STARTUP", False)
+    cache = DatasetCache()
+    service = chat_module.ChatService()
+    service.data_load_service = DataLoadService(cache=cache)
+    service.warm_up()
+    warmed = cache.stats()
+    assert warmed["entries"] > 0
+
+    # La primera petición, con otro DataLoadService sobre el mismo cache, no vuelve a leer disco
+    request_loader = DataLoadService(cache=cache)
+    for path in service._report_paths().values():
+        request_loader.load_data(path)
+    assert cache.stats()["misses"] == warmed["misses"]
@@ -0,0 +1,46 @@
+import threading
+
+from app import dependencies
+from app.dependencies import ServiceContainer
+
+
+class CountingChatService:
+    built = 0
+
+    def __init__(self):
+        type(self).built += 1
+        self.warmed = False
+
+    def warm_up(self):
+        self.warmed = True
+
+
+def test_chat_service_is_built_once_across_threads(monkeypatch):
+    monkeypatch.setattr(dependencies, "ChatService", CountingChatService)
+    CountingChatService.built = 0
+    container = ServiceContainer()
+    seen = []
+    barrier = threading.Barrier(8)
+
+    def request():
+        barrier.wait()
+        seen.append(container.get_chat_service())
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert CountingChatService.built == 1
+    assert all(service is seen[0] for service in seen)
+
+
+def test_startup_warms_up_and_shutdown_releases(monkeypatch):
+    monkeypatch.setattr(dependencies, "ChatService", CountingChatService)
+    container = ServiceContainer()
+    container.startup(warm_up=True)
+    assert container.is_ready and container.get_chat_service().warmed
+    first = container.get_chat_service()
+    container.shutdown()
+    assert not container.is_ready
+    assert container.get_chat_service() is not first
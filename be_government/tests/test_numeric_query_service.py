@@ -0,0 +1,79 @@
+import pytest
+
+from app.services.numeric_query_service import NumericQueryService
+from tests.conftest import REPORT_PATHS
+
+
+@pytest.fixture(scope="module")
+def service(stats_service):
+    paths = [REPORT_PATHS["growth_interanual"]] + [
+        p for k, p in REPORT_PATHS.items() if k != "growth_interanual"
+    ]
+    return NumericQueryService(stats_service, paths)
+
+
+def _stat(stats_service, label, variable, statistic):
+    table = stats_service.get_table(REPORT_PATHS["growth_interanual"])
+    row = table[(table["Label"] == label) & (table["variable"] == variable)].iloc[0]
+    return row[statistic]
+
+
+def test_answers_mean_from_stats_table(service, stats_service):
+    answer = service.answer("¿Cuál fue el crecimiento promedio del PIB con Arias?")
+    assert answer is not None
+    assert (answer.statistic, answer.variable) == ("mean", "PIB_TC")
+    assert [r["Label"] for r in answer.rows] == ["Arias"]
+    assert answer.rows[0]["value"] == pytest.approx(_stat(stats_service, "Arias", "PIB_TC", "mean"))
+
+
+def test_party_expands_to_its_administrations_in_order(service):
+    answer = service.answer("mediana del consumo de los hogares en el gobierno del PLN")
+    assert answer is not None
+    assert answer.variable == "PIB_Gasto_Consumo_Final_Hogares_TC"
+    assert [r["Label"] for r in answer.rows] == ["Olsen", "Arias", "Chinchilla"]
+
+
+@pytest.mark.parametrize("question", [
+    # Comparaciones: la tabla no ordena gobiernos
+    "¿Qué gobierno tuvo mayor crecimiento del PIB, Arias o Chaves?",
+    "¿Con quién fue menor el crecimiento del PIB, Solís o Alvarado?",
+    # Otra granularidad: la tabla es trimestral
+    "¿Cuál fue el peor año del PIB con Alvarado?",
+    "crecimiento anual promedio del PIB con Arias",
+    # Narrativas o sin administración
+    "¿Por qué cayó el PIB con Alvarado?",
+    "promedio del PIB en 2020",
+    "promedio de manufactura",
+])
+def test_questions_outside_the_table_go_to_the_pipeline(service, question):
+    assert service.answer(question) is None
+
+
+def test_text_states_the_quarter_count_once(service):
+    text = service.answer("máximo de las exportaciones con Solís").to_text()
+    assert "el máximo trimestral" in text
+    assert text.count("trimestres") == 1
+
+    count_text = service.answer("¿cuántos trimestres de PIB con Arias?").to_text()
+    assert count_text.count("trimestres") == 1
+
+
+@pytest.mark.parametrize("question", [
+    # Una segunda pregunta tras la estadística
+    "¿Cuál fue el promedio del PIB con Chaves y qué sectores impulsaron ese resultado?",
+    "¿Cuál fue el promedio del PIB con Chaves? ¿Cuáles sectores crecieron?",
+    # Exclusiones que la tabla por administración no puede aplicar
+    "promedio del pib sin contar la pandemia con Alvarado",
+    "promedio del PIB excluyendo 2020 con Alvarado",
+    # Dos estadísticas o palabras que el parser no reconoce
+    "promedio y mediana del PIB con Arias",
+    "promedio del PIB con Arias según el Banco Central",
+])
+def test_questions_with_extra_clauses_go_to_the_pipeline(service, question):
+    assert service.answer(question) is None
+
+
+def test_conjunctions_between_administrations_are_answered(service):
+    answer = service.answer("promedio del PIB con Arias y Chinchilla")
+    assert [r["Label"] for r in answer.rows] == ["Arias", "Chinchilla"]
+    assert [r["Label"] for r in service.answer("promedio del PIB en el período 2018-2022").rows] == ["Alvarado"]
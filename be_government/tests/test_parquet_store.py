@@ -0,0 +1,112 @@
+import os
+
+import pandas as pd
+import pytest
+
+from app.utils.parquet_store import ParquetStore
+from tests.conftest import REPORT_PATHS
+
+FRAME = pd.DataFrame({
+    "fecha": ["2018-06-01", "2018-03-01", "2022-06-01"],
+    "PIB_TC": ["1.5", "2", "x"],
+    "PIB_Manufactura_TC": [0.5, 1.0, 2.0],
+    "President": ["Carlos Alvarado Quesada", "Carlos Alvarado Quesada", "Rodrigo Chaves Robles"],
+    "Label": ["Alvarado", "Alvarado", "Chaves"],
+})
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ParquetStore(root=str(tmp_path))
+    store.write("pib_tc", FRAME)
+    return store
+
+
+def test_write_applies_the_store_types(store):
+    df = store.read("pib_tc")
+    assert pd.api.types.is_datetime64_any_dtype(df["fecha"])
+    assert df["fecha"].is_monotonic_increasing
+    assert df["PIB_TC"].dtype == "float64" and df["PIB_TC"].isna().iloc[-1]
+    assert df["Label"].cat.ordered and list(df["Label"].cat.categories) == ["Alvarado", "Chaves"]
+    assert store.names() == ["pib_tc"]
+
+
+def test_read_selects_columns_and_politics(store):
+    df = store.read("pib_tc", columns=["PIB_Manufactura_TC"], index=True)
+    assert df.index.name == "fecha"
+    assert list(df.columns) == ["PIB_Manufactura_TC", "President", "Label"]
+    assert list(store.read("pib_tc", include_politics=False).columns) == ["fecha", "PIB_TC", "PIB_Manufactura_TC"]
+    with pytest.raises(KeyError):
+        store.read("pib_tc", columns=["PIB_Inexistente"])
+
+
+def test_is_fresh_compares_with_the_source(store, tmp_path):
+    source = tmp_path / "Variables_PIB_TC.xlsx"
+    source.write_text("")
+    os.utime(source, (0, 0))
+    assert store.is_fresh("pib_tc", str(source))
+    os.utime(source, None)
+    os.utime(store.path("pib_tc"), (0, 0))
+    assert not store.is_fresh("pib_tc", str(source))
+
+
+def test_schema_export_writes_the_declared_columns(tmp_path):
+    from script import _exportar_dataset_schema
+
+    schema = tmp_path / "schema.yaml"
+    schema.write_text("source:\n  type: parquet\n  path: data.parquet\n"
+                      "columns:\n- name: fecha\n- name: PIB_TC\n- name: PIB_Inexistente\n", encoding="utf-8")
+    output = _exportar_dataset_schema(ParquetStore.normalize(FRAME).set_index("fecha"), str(schema))
+    assert output == str(tmp_path / "data.parquet")
+    assert list(pd.read_parquet(output).columns) == ["fecha", "PIB_TC"]
+
+
+@pytest.fixture
+def parquet_loader(tmp_path):
+    from app.services.data_load_service import DataLoadService, DatasetCache
+    return DataLoadService(cache=DatasetCache(), parquet_store=ParquetStore(root=str(tmp_path / "store")))
+
+
+def _no_csv(*args, **kwargs):
+    raise AssertionError("con la copia Parquet al día no se parsea el CSV")
+
+
+def test_load_frame_reads_the_fresh_parquet_copy(parquet_loader, monkeypatch):
+    path = REPORT_PATHS["sectors"]
+    from_csv = parquet_loader.load_frame(path)
+    assert parquet_loader.sync_parquet([path]) == ["pib_yoy_sectores"]
+    assert parquet_loader.sync_parquet([path]) == []
+
+    monkeypatch.setattr(pd, "read_csv", _no_csv)
+    from_parquet = parquet_loader.load_frame(path)
+    pd.testing.assert_frame_equal(from_parquet, from_csv, check_categorical=False)
+    assert from_parquet["Label"].cat.ordered
+    assert parquet_loader.load_frame(path) is from_parquet
+
+
+def test_stale_parquet_falls_back_to_the_csv(parquet_loader):
+    path = REPORT_PATHS["regimen"]
+    parquet_loader.sync_parquet([path])
+    os.utime(parquet_loader.parquet_store.path("pib_yoy_regimen"), (0, 0))
+    assert not parquet_loader.parquet_store.is_fresh("pib_yoy_regimen", parquet_loader._get_full_data_path(path))
+    assert parquet_loader.load_frame(path) is parquet_loader.cache.get_frame(parquet_loader._get_full_data_path(path))
+
+
+def test_warm_up_syncs_parquet_and_stats_read_it(parquet_loader, tmp_path, monkeypatch):
+    from app.services import chat_service as chat_module
+    from app.services.stats_service import AdministrationStatsService
+    monkeypatch.setattr(chat_module, "NUMERIC_FAST_PATH_ENABLED", False)
+    monkeypatch.setattr(chat_module, "QUESTION_ROUTER_ENABLED", False)
+    monkeypatch.setattr(chat_module, "REPORT_CONTEXT_MODE", "raw")
+    service = chat_module.ChatService()
+    service.data_load_service = parquet_loader
+    service.warm_up()
+    assert parquet_loader.parquet_store.names() == sorted(
+        os.path.splitext(os.path.basename(p))[0] for p in REPORT_PATHS.values()
+    )
+
+    # El recálculo de estadísticas lee la copia Parquet, no el texto
+    monkeypatch.setattr(pd, "read_csv", _no_csv)
+    stats = AdministrationStatsService(parquet_loader, cache_dir=str(tmp_path / "stats"))
+    table = stats.get_table(REPORT_PATHS["growth_interanual"])
+    assert set(table["variable"]) == {"PIB_TC"}
@@ -0,0 +1,53 @@
+import pytest
+
+from app.services.question_router_service import REPORT_AGENTS, QuestionRouter
+
+
+class FakeClient:
+    def __init__(self, answer):
+        self.answer = answer
+        self.prompts = []
+
+    def generate_response(self, prompt):
+        self.prompts.append(prompt)
+        return self.answer
+
+
+def test_keywords_route_without_the_model():
+    client = FakeClient("spent")
+    decision = QuestionRouter(llm_client=client).route("¿Cómo le fue a la manufactura y la construcción?")
+    assert decision.agents == ["industry"]
+    assert client.prompts == []
+
+
+def test_model_answer_is_parsed_into_known_agents():
+    decision = QuestionRouter(llm_client=FakeClient("sectors, regimen, otro")).route("¿Cómo evolucionó el país en esos años?")
+    assert decision.agents == ["sectors", "regimen"]
+
+
+def test_without_a_decision_every_agent_runs():
+    assert QuestionRouter(llm_client=FakeClient("no sé")).route("hola").agents == REPORT_AGENTS
+
+
+@pytest.mark.parametrize("question", [
+    "¿Cómo le fue a la economía con Chaves?",
+    "¿Qué gobierno tuvo mejor desempeño económico?",
+    "¿Cómo evolucionó el PIB durante la administración Solís?",
+])
+def test_broad_questions_run_every_analyst(question):
+    decision = QuestionRouter().route(question)
+    assert decision.agents == REPORT_AGENTS
+    assert decision.reason == "sin tema reconocido"
+
+
+def test_broad_questions_ask_the_model_when_enabled():
+    client = FakeClient("spent, growth_interanual")
+    decision = QuestionRouter(llm_client=client).route("¿Cómo le fue a la economía con Chaves?")
+    assert decision.agents == ["spent", "growth_interanual"]
+    assert len(client.prompts) == 1
+
+
+def test_specific_growth_terms_still_route_to_growth():
+    assert QuestionRouter().route("¿Hubo recesión con Alvarado?").agents == ["growth_interanual"]
+    assert QuestionRouter().route("crecimiento interanual del PIB con Arias").agents == ["growth_interanual"]
+    assert QuestionRouter().route("crecimiento del consumo de los hogares").agents == ["spent"]
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from app.agents.report_agents import ReportCompletedAgent
+from app.core.config import INTERANUAL_GROWTH_DATA_RELATIVE_PATH
+from app.services.report_assembly_service import REPORT_SECTIONS, ReportAssembler
+
+REPORTS = {
+    "gasto": "El consumo de los hogares explicó la mayor parte del crecimiento.",
+    "industria": "La manufactura se desaceleró.",
+    "sectors": "",
+    "regimen": "Las zonas francas crecieron más que el régimen definitivo.",
+    "growth_interanual": "El PIB creció 4,2% en promedio.",
+}
+
+
+class FakeSummaryClient:
+    """Cliente de resumen que nunca llama a la API."""
+    _model_name = "gpt-4.1-mini"
+
+    async def astream_chat_response(self, messages):
+        for chunk in ("Resumen ", "breve."):
+            yield chunk
+
+
+@pytest.fixture(scope="module")
+def assembler(data_load_service):
+    return ReportAssembler(data_load_service.load_frame(INTERANUAL_GROWTH_DATA_RELATIVE_PATH))
+
+
+def test_assemble_pastes_every_report_verbatim(assembler):
+    report = assembler.assemble("¿Cómo le fue a Chinchilla?", REPORTS)
+    assert report.startswith("## INFORME FINAL\n\n### Gobiernos Analizados\n")
+    assert "* Laura Chinchilla Miranda (PLN, 2010–2014)" in report
+    for number, (key, title, missing) in enumerate(REPORT_SECTIONS, start=1):
+        assert f"### {number}. {title}\n{REPORTS[key] or missing}" in report
+
+
+def test_administrations_from_party_years_or_reports(assembler):
+    by_party = assembler.analyzed_administrations("Gobiernos del PAC", {})
+    assert list(by_party["Label"]) == ["Solís", "Alvarado"]
+    by_years = assembler.analyzed_administrations("¿Qué pasó en 2009?", {})
+    assert list(by_years["Label"]) == ["Arias"]
+    by_reports = assembler.analyzed_administrations("¿Cómo creció la economía?", {"gasto": "Con Abel Pacheco el gasto subió."})
+    assert list(by_reports["Label"]) == ["Pacheco"]
+    assert "No se identificaron administraciones" in assembler.body("¿Cómo creció la economía?", {"gasto": "Sin nombres."})
+
+
+def test_only_routed_sections_are_numbered(assembler):
+    body = assembler.body("¿Cómo le fue a Arias?", {"regimen": "Texto de régimen."})
+    assert "### 1. Análisis de regimen\nTexto de régimen." in body
+    assert "Componente de gasto" not in body
+
+
+def test_local_agent_assembles_without_llm(assembler):
+    agent = ReportCompletedAgent(mode="local", summary=False)
+    agent._assembler = assembler
+    report = agent.run("¿Cómo le fue a Chinchilla?", None, REPORTS)
+    assert report == assembler.assemble("¿Cómo le fue a Chinchilla?", REPORTS)
+    assert agent._llm_client is None and agent._summary_client is None
+
+
+def test_local_stream_emits_summary_then_body(assembler):
+    agent = ReportCompletedAgent(mode="local", summary=True)
+    agent._assembler = assembler
+    agent._summary_client = FakeSummaryClient()
+
+    async def collect():
+        return [chunk async for chunk in agent.astream("¿Cómo le fue a Chinchilla?", None, REPORTS)]
+
+    report = "".join(asyncio.run(collect()))
+    assert report == assembler.assemble("¿Cómo le fue a Chinchilla?", REPORTS, summary="Resumen breve.")
+    assert agent._llm_client is None
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.pipelines.report_pipeline import ReportPipeline
+
+
+class FakeAnalyst:
+    """Analista que tarda `delay` segundos y registra cuántos corren a la vez."""
+
+    def __init__(self, name, tracker, delay=0.05):
+        self.name = name
+        self.tracker = tracker
+        self.delay = delay
+
+    def _enter(self, context):
+        with self.tracker["lock"]:
+            self.tracker["running"] += 1
+            self.tracker["peak"] = max(self.tracker["peak"], self.tracker["running"])
+            self.tracker["calls"].append(self.name)
+            self.tracker["contexts"][self.name] = context
+
+    def _exit(self):
+        with self.tracker["lock"]:
+            self.tracker["running"] -= 1
+
+    def run(self, question, context=""):
+        self._enter(context)
+        time.sleep(self.delay)
+        self._exit()
+        return f"informe {self.name}"
+
+    async def arun(self, question, context=""):
+        self._enter(context)
+        await asyncio.sleep(self.delay)
+        self._exit()
+        return f"informe {self.name}"
+
+
+def _pipeline(max_concurrency):
+    tracker = {"lock": threading.Lock(), "running": 0, "peak": 0, "calls": [], "contexts": {}}
+    pipeline = ReportPipeline(max_concurrency=max_concurrency)
+    for attr in ("report_spent_agent", "report_industry_agent", "report_regimen_agent",
+                 "report_sectors_agent", "report_growth_interanual_agent"):
+        setattr(pipeline, attr, FakeAnalyst(attr.replace("report_", "").replace("_agent", ""), tracker))
+    return pipeline, tracker
+
+
+CONTEXT = {key: f"ctx {key}" for key in ("spent", "industry", "regimen", "sectors", "growth_interanual")}
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 2, 5])
+def test_async_fan_out_is_bounded(max_concurrency):
+    pipeline, tracker = _pipeline(max_concurrency)
+    asyncio.run(pipeline.arun("informe de Arias", context=CONTEXT))
+    assert len(tracker["calls"]) == 5
+    assert tracker["peak"] == max_concurrency
+
+
+def test_sync_fan_out_runs_analysts_concurrently():
+    pipeline, tracker = _pipeline(5)
+    start = time.perf_counter()
+    response = pipeline.run("informe de Arias", context=CONTEXT)
+    assert time.perf_counter() - start < 5 * 0.05
+    assert tracker["peak"] > 1
+    assert "## INFORME FINAL" in response
+
+
+def test_each_analyst_gets_its_own_context_and_a_timing(capsys):
+    pipeline, tracker = _pipeline(5)
+    asyncio.run(pipeline.arun("informe de Arias", context=CONTEXT))
+    assert tracker["contexts"]["industry"] == "ctx industry"
+    out = capsys.readouterr().out
+    assert "Tiempos por agente analista" in out and "concurrencia máx.: 5" in out
+
+
+def test_only_routed_analysts_run():
+    pipeline, tracker = _pipeline(5)
+    response = asyncio.run(pipeline.arun("crecimiento de la construcción", context=CONTEXT, agents=["industry"]))
+    assert tracker["calls"] == ["industry"]
+    assert "informe industry" in response
+    assert "Componente de gasto" not in response
+
+
+def test_unknown_or_empty_route_runs_every_analyst():
+    for agents in ([], ["inexistente"]):
+        pipeline, tracker = _pipeline(5)
+        pipeline.run("informe", context=CONTEXT, agents=agents)
+        assert sorted(tracker["calls"]) == sorted(["spent", "industry", "regimen", "sectors", "growth_interanual"])
+
+
+def test_stream_emits_routed_sections_then_done():
+    pipeline, _ = _pipeline(5)
+
+    async def collect():
+        return [event async for event in pipeline.astream("informe", context=CONTEXT, agents=["spent", "sectors"])]
+
+    events = asyncio.run(collect())
+    sections = [e["section"] for e in events if e["event"] == "section"]
+    assert sorted(sections) == ["sectors", "spent"]
+    assert events[-1]["event"] == "done"
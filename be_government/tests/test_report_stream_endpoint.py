@@ -0,0 +1,62 @@
+import asyncio
+
+from app.api.v1.endpoints.chat_endpoints import chat_report_stream
+from app.models.chat_models import ChatRequest
+
+
+class FakeRequest:
+    def __init__(self, disconnect_after):
+        self.checks = 0
+        self.disconnect_after = disconnect_after
+
+    async def is_disconnected(self):
+        self.checks += 1
+        return self.checks > self.disconnect_after
+
+
+class FakeChatService:
+    def __init__(self, fail=False):
+        self.closed = False
+        self.fail = fail
+
+    async def astream_report_generation(self, question):
+        try:
+            yield {"event": "section", "section": "industry", "content": "uno"}
+            if self.fail:
+                raise RuntimeError("agente caído")
+            yield {"event": "section", "section": "sectors", "content": "dos"}
+            yield {"event": "done", "response": "final"}
+        finally:
+            self.closed = True
+
+
+def _collect(request, service):
+    """Eventos emitidos y si el generador del servicio ya estaba cerrado al terminar la respuesta."""
+    async def run():
+        response = await chat_report_stream(request, ChatRequest(question="informe"), service)
+        chunks = [chunk async for chunk in response.body_iterator]
+        # Antes de que asyncio.run finalice los generadores pendientes
+        return chunks, service.closed
+    return asyncio.run(run())
+
+
+def test_stream_sends_sections_and_done():
+    service = FakeChatService()
+    chunks, closed = _collect(FakeRequest(disconnect_after=10), service)
+    assert [c.split("\n")[0] for c in chunks] == ["event: section", "event: section", "event: done"]
+    assert closed
+
+
+def test_disconnect_closes_the_report_generator():
+    service = FakeChatService()
+    chunks, closed = _collect(FakeRequest(disconnect_after=1), service)
+    assert len(chunks) == 1
+    assert closed
+
+
+def test_pipeline_error_becomes_an_error_event():
+    service = FakeChatService(fail=True)
+    chunks, closed = _collect(FakeRequest(disconnect_after=10), service)
+    assert chunks[-1].startswith("event: error")
+    assert "agente caído" in chunks[-1]
+    assert closed
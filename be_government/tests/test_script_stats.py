@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+import script
+from script import STAT_NAMES, calcular_estadisticas_por_gobierno
+
+
+def _tagged():
+    rng = np.random.default_rng(7)
+    index = pd.date_range("2014-03-31", periods=24, freq="QE", name="fecha")
+    frame = pd.DataFrame(rng.normal(size=(24, 3)), index=index, columns=["PIB_TC", "PIB_Agro_TC", "PIB_Manuf_TC"])
+    frame.iloc[3, 1] = np.nan
+    frame["Label"] = ["Solís"] * 16 + ["Alvarado"] * 8
+    frame["President"] = frame["Label"]
+    return frame
+
+
+def test_single_pass_matches_per_variable_aggregation():
+    tagged = _tagged()
+    wide = calcular_estadisticas_por_gobierno(tagged).set_index("Presidente")
+    for label, group in tagged.groupby("Label"):
+        for variable in ("PIB_TC", "PIB_Agro_TC", "PIB_Manuf_TC"):
+            values = group[variable]
+            expected = {
+                "mean": values.mean(), "median": values.median(), "std": values.std(),
+                "min": values.min(), "max": values.max(), "count": values.count(),
+                "p25": values.quantile(0.25), "p75": values.quantile(0.75),
+            }
+            for name, value in expected.items():
+                assert np.isclose(wide.loc[label, f"{variable}_{name}"], value), (label, variable, name)
+
+
+def test_columns_are_grouped_by_variable_in_stat_order():
+    wide = calcular_estadisticas_por_gobierno(_tagged())
+    assert list(wide.columns[:1 + len(STAT_NAMES)]) == ["Presidente"] + [f"PIB_TC_{n}" for n in STAT_NAMES]
+    assert "President_mean" not in wide.columns
+
+
+def test_political_terms_come_from_the_installed_informed_economist():
+    from importlib.metadata import version
+
+    import backend.political_terms
+
+    assert version("informed_economist")
+    assert script.tag_politics is backend.political_terms.tag_politics
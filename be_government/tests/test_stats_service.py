@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from app.core.config import INDUSTRY_DATA_RELATIVE_PATH
+from app.services import stats_service as stats_module
+from app.services.context_pruning_service import QuestionScope
+from app.services.stats_service import STAT_COLUMNS, AdministrationStatsService
+
+
+def test_table_matches_a_direct_pandas_computation(stats_service, data_load_service):
+    table = stats_service.get_table(INDUSTRY_DATA_RELATIVE_PATH)
+    frame = data_load_service.load_frame(INDUSTRY_DATA_RELATIVE_PATH)
+    variable = "PIB_Manufactura_TC"
+    values = frame.loc[frame["Label"] == "Solís", variable]
+    row = table[(table["Label"] == "Solís") & (table["variable"] == variable)].iloc[0]
+    assert row["count"] == values.count()
+    assert row["mean"] == pytest.approx(values.mean())
+    assert row["p25"] == pytest.approx(values.quantile(0.25))
+    assert row["max"] == pytest.approx(values.max())
+    assert list(table.columns[-len(STAT_COLUMNS):]) == STAT_COLUMNS
+
+
+def test_administrations_are_in_chronological_order(stats_service):
+    labels = stats_service.get_table(INDUSTRY_DATA_RELATIVE_PATH)["Label"].drop_duplicates().tolist()
+    assert labels[:2] == ["Calderón", "Olsen"] and labels[-1] == "Chaves"
+
+
+def test_table_is_reused_from_disk(stats_service, data_load_service, monkeypatch):
+    stats_service.get_table(INDUSTRY_DATA_RELATIVE_PATH)
+    assert any(f.startswith("pib_yoy") for f in os.listdir(stats_service.cache_dir))
+
+    def fail(frame):
+        raise AssertionError("la tabla debía leerse del disco")
+
+    monkeypatch.setattr(stats_module, "compute_administration_stats", fail)
+    fresh = AdministrationStatsService(data_load_service, cache_dir=stats_service.cache_dir)
+    assert len(fresh.get_table(INDUSTRY_DATA_RELATIVE_PATH)) > 0
+
+
+def test_render_is_limited_to_the_question_scope(stats_service):
+    text = stats_service.render(INDUSTRY_DATA_RELATIVE_PATH, QuestionScope(labels={"Arias"}), encoding="grouped")
+    assert "### Arias" in text and "### Solís" not in text
+    assert stats_service.render(INDUSTRY_DATA_RELATIVE_PATH).count("Chaves") > 1
@@ -0,0 +1,105 @@
+import pandas as pd
+import pytest
+
+from app.core.config import INDUSTRY_DATA_RELATIVE_PATH
+from app.services.context_encoding_service import ContextText
+from app.services.context_pruning_service import QuestionScope
+from app.services.token_budget_service import ANNUAL_NOTE, TokenBudgetManager
+
+LEGEND = "Estadísticas precalculadas por administración (Label) de cada variable"
+
+
+@pytest.fixture
+def manager():
+    return TokenBudgetManager(budgets={"analyst": 400}, enabled=True, min_context_tokens=100)
+
+
+@pytest.fixture(scope="module")
+def chat_service():
+    from app.services.chat_service import ChatService
+    return ChatService()
+
+
+def _assert_rows_keep_their_section(lines):
+    body = lines[lines.index(next(l for l in lines if l.startswith("[Contexto recortado"))) + 1:]
+    assert body and body[0].startswith("### ")
+
+
+def test_stats_context_keeps_legend_and_columns_when_trimmed(manager, chat_service):
+    context = chat_service._stats_report_context(None, {"industry": INDUSTRY_DATA_RELATIVE_PATH})["industry"]
+    assert manager.count(context) > 400
+
+    fitted = manager.fit_context("analyst", context)
+    lines = fitted.splitlines()
+    # La leyenda contiene dígitos ("p25/p75 ... 25 y 75") y aun así es encabezado
+    assert lines[0].startswith(LEGEND) and "p25/p75" in lines[0]
+    assert lines[1].startswith("Filas agrupadas por administración")
+    assert lines[2].startswith("Columnas: variable,")
+    assert lines[3].startswith("[Contexto recortado")
+    _assert_rows_keep_their_section(lines)
+    assert manager.count(fitted) <= 400
+    # Se conservan las administraciones más recientes
+    assert context.splitlines()[-1] in lines
+
+
+def test_period_observations_stay_under_their_column_header(manager, chat_service):
+    scope = QuestionScope(date_ranges=[(pd.Timestamp("2022-06-01"), pd.Timestamp("2023-12-31"))])
+    context = chat_service._stats_report_context(scope, {"industry": INDUSTRY_DATA_RELATIVE_PATH})["industry"]
+    fitted = manager.trim(context, manager.count(context) // 2)
+    lines = fitted.splitlines()
+    assert lines[0].startswith(LEGEND)
+    observations = [l for l in lines if l.startswith("### Observaciones trimestrales")]
+    assert len(observations) == 1 and "(columnas: fecha," in observations[0]
+    assert lines[-1] == context.splitlines()[-1]
+
+
+def test_plain_csv_keeps_the_column_line(manager):
+    rows = [f"2020-{m:02d},{m}.5,Arias" for m in range(1, 13)] * 20
+    text = "fecha,valor,Label\n" + "\n".join(rows) + "\n"
+    trimmed = manager.trim(text, 60)
+    lines = trimmed.splitlines()
+    assert lines[0] == "fecha,valor,Label"
+    assert lines[1].startswith("[Contexto recortado")
+    assert lines[-1] == rows[-1]
+
+
+def test_declared_header_is_kept_even_without_sections(manager):
+    text = ContextText("leyenda 1\nleyenda 2\n" + "\n".join(f"fila {i}" for i in range(200)) + "\n", header_lines=2)
+    lines = manager.trim(text, 80).splitlines()
+    assert lines[:2] == ["leyenda 1", "leyenda 2"]
+    assert lines[-1] == "fila 199"
+
+
+def test_annual_aggregation_keeps_structure():
+    text = ContextText("Leyenda\nColumnas: fecha,valor\n### Arias: Óscar Arias (PLN, 2006-2010)\n"
+                       "2007-03,1\n2007-06,3\n2008-03,5\n", header_lines=2, section_lines=1)
+    annual = TokenBudgetManager.aggregate_annual(text)
+    assert annual.splitlines() == [ANNUAL_NOTE, "Leyenda", "Columnas: fecha,valor",
+                                   "### Arias: Óscar Arias (PLN, 2006-2010)", "2007,2.0", "2008,5.0"]
+    assert annual.header_lines == 3
+
+
+def test_exhausted_budget_still_leaves_the_minimum_context(capsys):
+    manager = TokenBudgetManager(budgets={"analyst": 1000}, enabled=True, min_context_tokens=100)
+    text = "fecha,valor\n" + "\n".join(f"dato {i},{i}" for i in range(500)) + "\n"
+    fitted = manager.fit_context("analyst", text, reserved_tokens=1200)
+    assert "agotado" in capsys.readouterr().out
+    assert 0 < manager.count(fitted) <= 100
+    assert fitted.splitlines()[-1] == "dato 499,499"
+    assert "presupuesto agotado: mínimo 100" in manager.recent_decisions[-1].actions
+
+
+def test_general_information_gives_every_dataset_a_floor(monkeypatch, capsys):
+    from app.agents.general_information_agents import GeneralInformationAgent
+    from app.services.token_budget_service import token_budget_manager
+
+    agent = GeneralInformationAgent()
+    monkeypatch.setitem(token_budget_manager.budgets, agent.agent_name, 10)
+    monkeypatch.setattr(token_budget_manager, "enabled", True)
+    context = {key: "fecha,valor\n" + "\n".join(f"2020-01,{i}" for i in range(2000)) + "\n"
+               for key in ("spent", "industry")}
+    fitted = agent._fit_context("¿Qué pasó?", context)
+    assert capsys.readouterr().out.count("agotado") == 1
+    for key, text in fitted.items():
+        assert "fecha,valor" in text.splitlines()[:2], key
+        assert 0 < token_budget_manager.count(text) <= token_budget_manager.min_context_tokens
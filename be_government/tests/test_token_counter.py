@@ -0,0 +1,27 @@
+import builtins
+
+from app.utils import token_counter
+
+
+def test_missing_tiktoken_falls_back_with_a_single_warning(monkeypatch, capsys):
+    real_import = builtins.__import__
+
+    def no_tiktoken(name, *args, **kwargs):
+        if name == "tiktoken":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_tiktoken)
+    monkeypatch.setattr(token_counter, "_fallback_warned", False)
+    token_counter._encoding.cache_clear()
+    try:
+        assert token_counter.count_tokens("abcdefg", "modelo-a") == 3
+        assert token_counter.count_tokens("abc", "modelo-b") == 1
+        assert not token_counter.has_exact_tokenizer("modelo-a")
+    finally:
+        token_counter._encoding.cache_clear()
+    assert capsys.readouterr().out.count("ATENCIÓN: tiktoken no está instalado") == 1
+
+
+def test_empty_text_has_no_tokens():
+    assert token_counter.count_tokens("") == 0
@@ -25,6 +25,7 @@ import { Plus, Check } from "lucide-react"
 
 import {
   sendQuestion,
+  streamQuestion,
   apiBase,
   REPORT_ENDPOINT,
   GENERAL_INFO_ENDPOINT,
@@ -83,11 +84,47 @@ export default function InformedEconomistChat() {
       return
     }
 
-    // MODO API: escoger endpoint según el modo
-    const endpoint =
-      mode === "report" ? REPORT_ENDPOINT : GENERAL_INFO_ENDPOINT
+    // MODO REPORTE: streaming, se muestra cada sección en cuanto llega
+    if (mode === "report") {
+      let sections = ""
+      let finalReport = ""
+      const render = () => (finalReport ? finalReport : sections)
+      setMessages(prev => [...prev, { role: "assistant", content: "" }])
+      const updateLast = (text: string) =>
+        setMessages(prev => [...prev.slice(0, -1), { role: "assistant", content: text }])
 
-    const result = await sendQuestion(content, endpoint)
+      const result = await streamQuestion(content, {
+        onSection: (section, text) => {
+          sections += `### ${section}\n${text}\n\n`
+          updateLast(render())
+        },
+        onToken: token => {
+          finalReport += token
+          updateLast(render())
+        },
+      })
+
+      if (result.ok) {
+        updateLast(result.data)
+        setBusy(false)
+        return
+      }
+
+      setMessages(prev => prev.slice(0, -1))
+      setError(result.error)
+      setMessages(prev => [
+        ...prev,
+        {
+          role: "assistant",
+          content: `⚠️ Error al consultar el backend:\n\n${result.error}`,
+        },
+      ])
+      setBusy(false)
+      return
+    }
+
+    // MODO API: información general
+    const result = await sendQuestion(content, GENERAL_INFO_ENDPOINT)
 
     if (result.ok) {
       setMessages(prev => [...prev, { role: "assistant", content: result.data }])
@@ -46,3 +46,79 @@ export async function sendQuestion(question: string, endpoint: string = REPORT_E
     }
   }
 }
+
+export const REPORT_STREAM_ENDPOINT = "/api/v1/pib-chat/report/stream"
+
+export type ReportStreamHandlers = {
+  // Sub-reporte de un analista (spent, industry, regimen, sectors, growth_interanual)
+  onSection?: (section: string, content: string) => void
+  // Fragmento del informe final del editor
+  onToken?: (token: string) => void
+}
+
+export async function streamQuestion(
+  question: string,
+  handlers: ReportStreamHandlers = {},
+  endpoint: string = REPORT_STREAM_ENDPOINT,
+): Promise<BackendResult> {
+  try {
+    const res = await fetch(`${apiBase}${endpoint}`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json", Accept: "text/event-stream" },
+      body: JSON.stringify({ question }),
+    })
+
+    if (!res.ok || !res.body) {
+      return { ok: false, error: `HTTP ${res.status}` }
+    }
+
+    const reader = res.body.getReader()
+    const decoder = new TextDecoder()
+    let buffer = ""
+    let finalText = ""
+    let completed = false
+
+    while (true) {
+      const { value, done } = await reader.read()
+      if (done) break
+      buffer += decoder.decode(value, { stream: true })
+
+      // Los eventos SSE se separan con una línea en blanco
+      let sep = buffer.indexOf("\n\n")
+      while (sep !== -1) {
+        const raw = buffer.slice(0, sep)
+        buffer = buffer.slice(sep + 2)
+        sep = buffer.indexOf("\n\n")
+
+        let event = "message"
+        let data = ""
+        for (const line of raw.split("\n")) {
+          if (line.startsWith("event:")) event = line.slice(6).trim()
+          else if (line.startsWith("data:")) data += line.slice(5).trim()
+        }
+        if (!data) continue
+
+        const payload = JSON.parse(data)
+        if (event === "section") handlers.onSection?.(payload.section, payload.content)
+        else if (event === "token") {
+          finalText += payload.content
+          handlers.onToken?.(payload.content)
+        } else if (event === "done") {
+          finalText = payload.response
+          completed = true
+        } else if (event === "error") return { ok: false, error: payload.detail }
+      }
+    }
+
+    // Sin evento `done` el servidor cortó el stream a mitad del informe
+    if (!completed) {
+      return { ok: false, error: "El informe se interrumpió antes de completarse." }
+    }
+    return { ok: true, data: finalText }
+  } catch {
+    return {
+      ok: false,
+      error: "No fue posible contactar el backend.",
+    }
+  }
+}
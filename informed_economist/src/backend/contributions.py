@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Literal, Optional, Tuple
+from typing import Dict, List, Literal, Mapping, Optional, Sequence, Tuple, Union
 import numpy as np
 import pandas as pd
 
-Method = Literal["Laspeyres", "Paasche", "Fisher"]
+Method = Literal["Laspeyres", "Paasche", "Fisher", "Fisher_chained"]
+Mode = Literal["point", "rolling", "cumulative_admin"]
 Scale = Literal["percent", "unit"]
 NaNPolicy = Literal["drop", "ffill", "zeros", "raise"]
 JoinHow = Literal["inner", "left", "right"]
@@ -94,10 +95,10 @@ def align_inputs(
     # Shift weights for Laspeyres
     if method == "Laspeyres":
         w = w.shift(lag_periods)
-    elif method in ("Paasche", "Fisher"):
+    elif method in ("Paasche", "Fisher", "Fisher_chained"):
         pass
     else:
-        raise ValueError("method must be 'Laspeyres', 'Paasche', or 'Fisher'.")
+        raise ValueError("method must be 'Laspeyres', 'Paasche', 'Fisher' or 'Fisher_chained'.")
 
     # Align indices
     g, w = g.align(w, join=how, axis=0)
@@ -145,6 +146,97 @@ def _compute_contrib_simple(
     return contrib
 
 
+def fisher_chained_contributions_array(
+    growth_unit: np.ndarray,
+    weights_lagged_unit: np.ndarray,
+    weights_unit: np.ndarray,
+    group_starts: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact additive contributions to the Fisher growth of each chain link (unit scale).
+
+    Each row is one link of a chained Fisher index, comparing the period with
+    the one ``lag_periods`` before. With ``L = sum(w_lag * g)`` (Laspeyres leg),
+    ``P = sum(w * g)`` (Paasche leg) and ``F = sqrt((1 + L) * (1 + P)) - 1``,
+    the identity ``(1 + F)**2 - 1 = L + P + L * P`` gives the additive
+    (Kohli / Van IJzeren) decomposition
+
+        c_i = g_i * (w_lag_i * (2 + P) + w_i * (2 + L)) / (2 * (2 + F))
+
+    whose components add up exactly to ``F`` with no residual. Contributions
+    over several links are chained with ``chain_link_contributions_array``.
+
+    ``group_starts`` (sorted column offsets, first one 0) splits the columns
+    into independent decompositions stacked side by side; each group gets
+    its own L, P and F.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Contributions of shape (T, K) and the Fisher growth of shape (T, G)
+        (shape (T,) when ``group_starts`` is None). Group-rows with any NaN
+        input, or with ``(1 + L) * (1 + P) <= 0``, are NaN.
+    """
+    g = np.asarray(growth_unit, dtype=np.float64)
+    w_lag = np.asarray(weights_lagged_unit, dtype=np.float64)
+    w = np.asarray(weights_unit, dtype=np.float64)
+    if not (g.shape == w_lag.shape == w.shape) or g.ndim != 2:
+        raise ValueError("growth and both weight arrays must be 2-D arrays with the same shape.")
+
+    # Single working buffer: both legs, then the contributions
+    buf = np.empty((2,) + g.shape, dtype=np.float64)
+    np.multiply(w_lag, g, out=buf[0])
+    np.multiply(w, g, out=buf[1])
+    starts = np.zeros(1, dtype=np.intp) if group_starts is None else np.asarray(group_starts, dtype=np.intp)
+    widths = np.diff(np.r_[starts, g.shape[1]])
+
+    legs = np.add.reduceat(buf, starts, axis=2)    # (2, T, G): L and P per group
+    product = (1.0 + legs[0]) * (1.0 + legs[1])
+    with np.errstate(invalid="ignore"):
+        total = np.where(product > 0, np.sqrt(np.where(product > 0, product, 0.0)) - 1.0, np.nan)
+
+    laspeyres = np.repeat(legs[0], widths, axis=1)
+    paasche = np.repeat(legs[1], widths, axis=1)
+    contrib = buf[0]
+    contrib *= 2.0 + paasche
+    contrib += buf[1] * (2.0 + laspeyres)
+    contrib /= 2.0 * (2.0 + np.repeat(total, widths, axis=1))
+    contrib[np.repeat(np.isnan(total), widths, axis=1)] = np.nan
+    return contrib, (total[:, 0] if group_starts is None else total)
+
+
+def chain_link_contributions_array(
+    contrib: np.ndarray,
+    link_growth: np.ndarray,
+    group_starts: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Ribe contributions to the cumulative growth of a chained index (unit scale).
+
+    ``contrib`` (T, K) are per-link contributions (e.g. from
+    ``fisher_chained_contributions_array`` with consecutive links,
+    ``lag_periods=1``) and ``link_growth`` the growth of each link, shape (T,)
+    or (T, G) per group. Each link is rescaled by the chained index level
+    before it, ``I[t-1] = prod(1 + F[:t])``, so row t adds up exactly to the
+    cumulative growth ``I[t] - 1`` since the start of the sample.
+    NaN links propagate to all later rows.
+    """
+    c = np.asarray(contrib, dtype=np.float64)
+    f = np.asarray(link_growth, dtype=np.float64)
+    if f.ndim == 1:
+        f = f[:, None]
+    if f.shape[0] != c.shape[0]:
+        raise ValueError("link_growth must have one entry per row of contrib.")
+    starts = np.zeros(1, dtype=np.intp) if group_starts is None else np.asarray(group_starts, dtype=np.intp)
+    if f.shape[1] != len(starts):
+        raise ValueError("link_growth must have one column per group.")
+    widths = np.diff(np.r_[starts, c.shape[1]])
+
+    level = np.cumprod(1.0 + f, axis=0)
+    before = np.vstack([np.ones((1, f.shape[1])), level[:-1]])
+    return np.cumsum(c * np.repeat(before, widths, axis=1), axis=0)
+
+
 def compute_contributions(
     df_growth_unit: pd.DataFrame,
     df_weights_unit: pd.DataFrame,
@@ -155,7 +247,13 @@ def compute_contributions(
     nan_policy_weights: NaNPolicy = "drop",
     scale_output: OutputScale = "pp",
 ) -> pd.DataFrame:
-    """Compute contributions per component and time."""
+    """
+    Compute contributions per component and time.
+
+    "Fisher" keeps its historical definition, the arithmetic mean of the
+    Laspeyres and Paasche contributions. "Fisher_chained" is the exact additive
+    decomposition of each Fisher chain link (``fisher_chained_contributions_array``).
+    """
     if method == "Fisher":
         # Laspeyres path
         gL, wL = align_inputs(df_growth_unit, df_weights_unit, method="Laspeyres", lag_periods=lag_periods, how=how)
@@ -181,6 +279,26 @@ def compute_contributions(
             raise ValueError("Empty contributions after alignment in Fisher method.")
         return 0.5 * (cL + cP)
 
+    if method == "Fisher_chained":
+        # One alignment: Paasche weights plus the lagged (Laspeyres) weights of the same rows
+        g, w = align_inputs(df_growth_unit, df_weights_unit, method="Paasche", lag_periods=lag_periods, how=how)
+        w_lag = df_weights_unit[list(g.columns)].shift(lag_periods).reindex(w.index)
+        g = handle_nans(g, nan_policy_growth)
+        weights = handle_nans(pd.concat({"L": w_lag, "P": w}, axis=1), nan_policy_weights)
+        g, weights = g.align(weights, join="inner", axis=0)
+        if g.empty or weights.empty:
+            raise ValueError("No overlapping rows remain after lagging and NaN handling (Fisher_chained).")
+        contrib, _ = fisher_chained_contributions_array(
+            g.to_numpy(dtype=np.float64),
+            weights["L"].to_numpy(dtype=np.float64),
+            weights["P"].to_numpy(dtype=np.float64),
+        )
+        if scale_output == "pp":
+            contrib *= 100.0
+        elif scale_output != "unit":
+            raise ValueError("scale_output must be 'pp' or 'unit'.")
+        return pd.DataFrame(contrib, index=g.index, columns=g.columns)
+
     # Single-path methods
     g, w = align_inputs(df_growth_unit, df_weights_unit, method=method, lag_periods=lag_periods, how=how)
     g = handle_nans(g, nan_policy_growth)
@@ -191,6 +309,390 @@ def compute_contributions(
     return _compute_contrib_simple(g, w, scale_output=scale_output)
 
 
+# ======================
+# NumPy Engine
+# ======================
+
+_METHOD_ORDER: Tuple[Method, ...] = ("Laspeyres", "Paasche", "Fisher", "Fisher_chained")
+# Methods that need the weights lagged by ``lag_periods``
+_LAGGED_METHODS: Tuple[Method, ...] = ("Laspeyres", "Fisher", "Fisher_chained")
+
+
+def contributions_array(
+    growth_unit: np.ndarray,
+    weights_unit: np.ndarray,
+    lag_periods: int = 12,
+    methods: Sequence[Method] = _METHOD_ORDER,
+    scale_output: OutputScale = "pp",
+    weights_lagged: Optional[np.ndarray] = None,
+    group_starts: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Contributions for several index methods in one pass over pre-aligned arrays.
+
+    Parameters
+    ----------
+    growth_unit, weights_unit : np.ndarray
+        Float arrays of shape (T, K), already aligned (same periods in the same
+        row order, same components in the same column order), in unit scale.
+    lag_periods : int, default 12
+        Lag of the Laspeyres weights (rows).
+    methods : sequence of {"Laspeyres", "Paasche", "Fisher", "Fisher_chained"}
+        Methods to compute; the output follows this order.
+    scale_output : {"pp", "unit"}, default "pp"
+    weights_lagged : np.ndarray, optional
+        Laspeyres weights already lagged and aligned with ``growth_unit``
+        (e.g. shifted on their own calendar). When given, ``lag_periods`` is ignored.
+    group_starts : np.ndarray, optional
+        Column offsets of independent decompositions stacked side by side
+        (only affects Fisher_chained, whose totals are per decomposition).
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (len(methods), T, K). Rows without lagged weights
+        (the first ``lag_periods``) are NaN for Laspeyres and both Fisher methods.
+    """
+    g = np.asarray(growth_unit, dtype=np.float64)
+    w = np.asarray(weights_unit, dtype=np.float64)
+    if g.shape != w.shape or g.ndim != 2:
+        raise ValueError("growth and weights must be 2-D arrays with the same shape.")
+    if scale_output not in ("pp", "unit"):
+        raise ValueError("scale_output must be 'pp' or 'unit'.")
+    unknown = [m for m in methods if m not in _METHOD_ORDER]
+    if unknown:
+        raise ValueError("method must be 'Laspeyres', 'Paasche', 'Fisher' or 'Fisher_chained'.")
+
+    factor = 100.0 if scale_output == "pp" else 1.0
+    n_rows = g.shape[0]
+    lag = max(0, int(lag_periods))
+    out = np.empty((len(methods),) + g.shape, dtype=np.float64)
+
+    # Lagged weights aligned row by row with growth (NaN where no lag is available)
+    if weights_lagged is not None:
+        w_lag = np.asarray(weights_lagged, dtype=np.float64)
+        if w_lag.shape != g.shape:
+            raise ValueError("weights_lagged must have the same shape as growth.")
+    else:
+        w_lag = np.full_like(g, np.nan)
+        if lag < n_rows:
+            w_lag[lag:] = w[: n_rows - lag]
+
+    if "Laspeyres" in methods:
+        c_l = out[methods.index("Laspeyres")]
+        np.multiply(w_lag, g, out=c_l)
+        c_l *= factor
+    if "Paasche" in methods:
+        c_p = out[methods.index("Paasche")]
+        np.multiply(w, g, out=c_p)
+        c_p *= factor
+    if "Fisher" in methods:
+        # Arithmetic mean of both legs (historical "Fisher" definition)
+        c_f = out[methods.index("Fisher")]
+        np.multiply(w_lag, g, out=c_f)
+        c_f += w * g
+        c_f *= 0.5 * factor
+    if "Fisher_chained" in methods:
+        c_c = out[methods.index("Fisher_chained")]
+        c_c[:], _ = fisher_chained_contributions_array(g, w_lag, w, group_starts=group_starts)
+        c_c *= factor
+    return out
+
+
+def rolling_contributions_array(contrib: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing mean of contributions over ``window`` periods along axis 0.
+
+    Computed from cumulative sums (O(T*K)); a window containing any NaN, or
+    fewer than ``window`` periods, yields NaN.
+    """
+    if window < 1:
+        raise ValueError("window must be >= 1.")
+    c = np.asarray(contrib, dtype=np.float64)
+    nan = np.isnan(c)
+    csum = np.cumsum(np.where(nan, 0.0, c), axis=0)
+    cnan = np.cumsum(nan, axis=0)
+
+    out = np.full_like(c, np.nan)
+    if window > c.shape[0]:
+        return out
+    sums = csum[window - 1:].copy()
+    sums[1:] -= csum[:-window]
+    nans = cnan[window - 1:].copy()
+    nans[1:] -= cnan[:-window]
+    out[window - 1:] = np.where(nans == 0, sums / window, np.nan)
+    return out
+
+
+def cumulative_by_group_array(contrib: np.ndarray, group_codes: np.ndarray) -> np.ndarray:
+    """
+    Cumulative sum of contributions along axis 0, restarting at each group.
+
+    ``group_codes`` holds one integer per row (e.g. the term positions from
+    ``political_terms.term_positions``); each contiguous run of equal codes is
+    one group. Rows with code -1 are NaN. NaN contributions count as zero.
+    """
+    c = np.asarray(contrib, dtype=np.float64)
+    codes = np.asarray(group_codes)
+    if codes.shape[0] != c.shape[0]:
+        raise ValueError("group_codes must have one entry per row of contrib.")
+
+    csum = np.cumsum(np.where(np.isnan(c), 0.0, c), axis=0)
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    lengths = np.diff(np.r_[starts, codes.shape[0]])
+    base = np.zeros((len(starts),) + c.shape[1:], dtype=np.float64)
+    base[1:] = csum[starts[1:] - 1]
+    out = csum - np.repeat(base, lengths, axis=0)
+    out[codes < 0] = np.nan
+    return out
+
+
+def _join_index(growth_index: pd.Index, weights_index: pd.Index, how: JoinHow) -> pd.Index:
+    if how == "inner":
+        return growth_index.intersection(weights_index, sort=True)
+    if how == "left":
+        return growth_index
+    if how == "right":
+        return weights_index
+    raise ValueError("how must be 'inner', 'left' or 'right'.")
+
+
+def compute_contributions_fast(
+    df_growth_unit: pd.DataFrame,
+    df_weights_unit: pd.DataFrame,
+    method: Method = "Laspeyres",
+    lag_periods: int = 12,
+    how: JoinHow = "inner",
+    scale_output: OutputScale = "pp",
+    mode: Mode = "point",
+    window: Optional[int] = None,
+    groups: Optional[np.ndarray] = None,
+) -> pd.DataFrame:
+    """
+    Array-based equivalent of ``compute_contributions`` (with ``nan_policy="drop"``).
+
+    Inputs are aligned once and converted to a single float64 buffer each;
+    all the arithmetic then runs on NumPy arrays.
+
+    Parameters
+    ----------
+    mode : {"point", "rolling", "cumulative_admin"}, default "point"
+        - "point": contribution of each period (same as compute_contributions)
+        - "rolling": trailing mean over ``window`` periods
+        - "cumulative_admin": contributions accumulated within each administration
+    window : int, optional
+        Window length for ``mode="rolling"``.
+    groups : np.ndarray, optional
+        Group code per aligned input row (the ``how`` join of both indexes, before
+        rows with NaN contributions are dropped) for ``mode="cumulative_admin"``.
+        Any other length raises ValueError. Defaults to the presidential term of
+        each date (political_terms.term_positions).
+
+    Returns
+    -------
+    pd.DataFrame
+        Contributions per component and time.
+    """
+    common_cols = sorted(set(df_growth_unit.columns).intersection(df_weights_unit.columns))
+    if not common_cols:
+        raise ValueError("No common component columns between growth and weights.")
+    index = _join_index(df_growth_unit.index, df_weights_unit.index, how)
+
+    g = df_growth_unit.reindex(index=index, columns=common_cols).to_numpy(dtype=np.float64)
+    # Weights keep their own history so the Laspeyres lag is taken on the weights'
+    # index (as align_inputs does with shift) before restricting to `index`
+    w_full = df_weights_unit.reindex(columns=common_cols)
+    w = w_full.reindex(index=index).to_numpy(dtype=np.float64)
+    if method not in _METHOD_ORDER:
+        raise ValueError("method must be 'Laspeyres', 'Paasche', 'Fisher' or 'Fisher_chained'.")
+    w_lag = None
+    if method in _LAGGED_METHODS:
+        w_lag = w_full.shift(lag_periods).reindex(index=index).to_numpy(dtype=np.float64)
+    contrib = contributions_array(g, w, lag_periods, (method,), scale_output, weights_lagged=w_lag)[0]
+
+    keep = ~np.isnan(contrib).any(axis=1)
+    contrib = contrib[keep]
+    index = index[keep]
+    if contrib.shape[0] == 0:
+        raise ValueError("After alignment and NaN handling, no overlapping rows remain.")
+
+    if mode == "rolling":
+        if not window:
+            raise ValueError("mode='rolling' requires a window.")
+        contrib = rolling_contributions_array(contrib, window)
+    elif mode == "cumulative_admin":
+        if groups is None:
+            from .political_terms import term_positions
+            groups = term_positions(pd.DatetimeIndex(index))
+        else:
+            groups = np.asarray(groups)
+            if groups.ndim != 1 or groups.shape[0] != keep.shape[0]:
+                raise ValueError(
+                    f"groups must have one entry per aligned input row ({keep.shape[0]}), got {groups.shape}."
+                )
+            groups = groups[keep]
+        contrib = cumulative_by_group_array(contrib, groups)
+    elif mode != "point":
+        raise ValueError("mode must be 'point', 'rolling' or 'cumulative_admin'.")
+
+    return pd.DataFrame(contrib, index=index, columns=common_cols)
+
+
+BatchInputs = Union[
+    Mapping[str, Tuple[pd.DataFrame, pd.DataFrame]],
+    Tuple[pd.DataFrame, pd.DataFrame],
+]
+
+
+def _split_panel(panel: pd.DataFrame, name: str) -> Dict[str, pd.DataFrame]:
+    """Split a (decomposition, component) MultiIndex-column panel by its first level."""
+    if not isinstance(panel.columns, pd.MultiIndex) or panel.columns.nlevels != 2:
+        raise ValueError(f"{name} must have two-level MultiIndex columns (decomposition, component).")
+    return {key: panel.xs(key, axis=1, level=0) for key in panel.columns.unique(level=0)}
+
+
+def compute_contributions_batch(
+    inputs: BatchInputs,
+    *,
+    method: Method = "Laspeyres",
+    lag_periods: int = 12,
+    how: JoinHow = "inner",
+    growth_scale: Scale = "percent",
+    weight_scale: Scale = "percent",
+    scale_output: OutputScale = "pp",
+    mode: Mode = "point",
+    window: Optional[int] = None,
+    return_long: bool = True,
+) -> pd.DataFrame:
+    """
+    Compute many decompositions (e.g. demand/supply/consumption/investment on
+    TC/SO/SD) in one vectorized pass.
+
+    Every (growth, weights) pair is aligned as in ``compute_contributions_fast``
+    (common components, ``how`` join, Laspeyres weights lagged on their own
+    calendar). The pairs are then stacked side by side into one (T, sum K)
+    buffer on the union calendar and all the arithmetic runs once; Fisher_chained
+    totals are still computed per decomposition.
+
+    Parameters
+    ----------
+    inputs : Mapping[str, (pd.DataFrame, pd.DataFrame)] or (pd.DataFrame, pd.DataFrame)
+        Either ``{name: (df_growth, df_weights)}`` or a ``(growth_panel, weights_panel)``
+        tuple whose columns are a MultiIndex (decomposition, component).
+        Decompositions missing from the weights panel are ignored.
+    method, lag_periods, how, growth_scale, weight_scale, scale_output
+        Same meaning as in ``compute_contributions_pipeline``.
+    mode : {"point", "rolling", "cumulative_admin"}, default "point"
+        Same meaning as in ``compute_contributions_fast``; rolling windows and
+        administration groups are taken on the shared calendar.
+    window : int, optional
+        Window length for ``mode="rolling"``.
+    return_long : bool, default True
+        If True, returns a tidy DataFrame with columns
+        ["date", "decomposition", "component", "growth_pp", "weight_unit", "contribution_pp"],
+        ``decomposition`` and ``component`` as ordered categoricals.
+        Otherwise a wide DataFrame of contributions with (decomposition, component) columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        Combined contributions. As with ``nan_policy="drop"``, periods where any
+        input of a decomposition is missing are left out for that decomposition.
+
+    Examples
+    --------
+    >>> tidy = compute_contributions_batch({
+    ...     "demanda_TC": (growth_dem_tc, weights_dem_tc),
+    ...     "oferta_TC": (growth_of_tc, weights_of_tc),
+    ... }, method="Fisher_chained")
+    >>> tidy.groupby(["decomposition", "date"], observed=True)["contribution_pp"].sum()
+    """
+    if method not in _METHOD_ORDER:
+        raise ValueError("method must be 'Laspeyres', 'Paasche', 'Fisher' or 'Fisher_chained'.")
+    if mode not in ("point", "rolling", "cumulative_admin"):
+        raise ValueError("mode must be 'point', 'rolling' or 'cumulative_admin'.")
+    if mode == "rolling" and not window:
+        raise ValueError("mode='rolling' requires a window.")
+
+    if isinstance(inputs, tuple):
+        growth_map = _split_panel(inputs[0], "growth panel")
+        weights_map = _split_panel(inputs[1], "weights panel")
+        pairs = {key: (growth_map[key], weights_map[key]) for key in growth_map if key in weights_map}
+    else:
+        pairs = dict(inputs)
+    if not pairs:
+        raise ValueError("No (growth, weights) pairs to decompose.")
+
+    # Per-pair alignment; the buffers are then stacked on the union calendar
+    blocks_g: Dict[str, pd.DataFrame] = {}
+    blocks_w: Dict[str, pd.DataFrame] = {}
+    blocks_l: Dict[str, pd.DataFrame] = {}
+    for name, (df_growth, df_weights) in pairs.items():
+        g_unit, w_unit = normalize_scales(df_growth, df_weights, growth_scale, weight_scale)
+        cols = sorted(set(g_unit.columns).intersection(w_unit.columns))
+        if not cols:
+            raise ValueError(f"No common component columns between growth and weights for '{name}'.")
+        index = _join_index(g_unit.index, w_unit.index, how)
+        w_full = w_unit.reindex(columns=cols)
+        blocks_g[name] = g_unit.reindex(index=index, columns=cols)
+        blocks_w[name] = w_full.reindex(index=index)
+        if method in _LAGGED_METHODS:
+            blocks_l[name] = w_full.shift(lag_periods).reindex(index=index)
+
+    names = list(blocks_g)
+    g_wide = pd.concat(blocks_g, axis=1, names=["decomposition", "component"]).sort_index()
+    calendar, columns = g_wide.index, g_wide.columns
+    w_wide = pd.concat(blocks_w, axis=1).reindex(index=calendar)
+    g = g_wide.to_numpy(dtype=np.float64)
+    w = w_wide.to_numpy(dtype=np.float64)
+    w_lag = None
+    if blocks_l:
+        w_lag = pd.concat(blocks_l, axis=1).reindex(index=calendar).to_numpy(dtype=np.float64)
+
+    widths = np.array([blocks_g[name].shape[1] for name in names], dtype=np.intp)
+    starts = np.r_[0, np.cumsum(widths)[:-1]]
+    contrib = contributions_array(
+        g, w, lag_periods, (method,), scale_output, weights_lagged=w_lag, group_starts=starts,
+    )[0]
+
+    # "drop" policy per decomposition: a period with any NaN input is removed for that block
+    missing = np.add.reduceat(np.isnan(contrib), starts, axis=1) > 0
+    missing = np.repeat(missing, widths, axis=1)
+    contrib[missing] = np.nan
+
+    if mode == "rolling":
+        contrib = rolling_contributions_array(contrib, window)
+    elif mode == "cumulative_admin":
+        from .political_terms import term_positions
+        contrib = cumulative_by_group_array(contrib, term_positions(pd.DatetimeIndex(calendar)))
+    contrib[missing] = np.nan
+
+    if not return_long:
+        wide = pd.DataFrame(contrib, index=calendar, columns=columns)
+        return wide.loc[~missing.all(axis=1)]
+
+    n_rows, n_cols = contrib.shape
+    keep = ~np.isnan(contrib).ravel()
+    components = columns.get_level_values("component")
+    tidy = pd.DataFrame({
+        "date": np.repeat(calendar.to_numpy(), n_cols)[keep],
+        "decomposition": pd.Categorical.from_codes(
+            np.tile(np.repeat(np.arange(len(names)), widths), n_rows)[keep],
+            categories=names, ordered=True,
+        ),
+        "component": pd.Categorical(
+            np.tile(components.to_numpy(), n_rows)[keep],
+            categories=pd.unique(components), ordered=True,
+        ),
+        "growth_pp": (g * 100.0).ravel()[keep],
+        "weight_unit": w.ravel()[keep],
+        "contribution_pp": contrib.ravel()[keep],
+    })
+    if tidy.empty:
+        raise ValueError("After alignment and NaN handling, no overlapping rows remain.")
+    return tidy.sort_values(["decomposition", "date"], kind="stable").reset_index(drop=True)
+
+
 # ======================
 # Post Checks & Summaries
 # ======================
@@ -224,6 +726,7 @@ def to_long_format(
 ) -> pd.DataFrame:
     """
     Return a tidy panel with columns: date, component, growth_pp, weight_unit, contribution_pp.
+    ``component`` is an ordered categorical (categories = component columns).
     """
     g, w = df_growth_pp.align(df_weights_unit, join="inner", axis=0)
     g, c = g.align(df_contrib_pp, join="inner", axis=0)
@@ -258,6 +761,8 @@ def to_long_format(
         .reset_index()
         .rename(columns={"level_0": "date", "level_1": "component"})
     )
+    component_col = "component" if "component" in tidy.columns else tidy.columns[1]
+    tidy[component_col] = pd.Categorical(tidy[component_col], categories=common_cols, ordered=True)
     return tidy
 
 
@@ -341,10 +846,13 @@ def compute_contributions_pipeline(
             2022-02-28        30.5         49.5         20.0
             2022-03-31        31.0         49.0         20.0
 
-    method : {"Laspeyres", "Paasche", "Fisher"}, default "Laspeyres"
-        - "Laspeyres": uses weights from the previous period (t - lag_periods)
-        - "Paasche"  : uses current period weights (t)
-        - "Fisher"   : geometric mean of Laspeyres and Paasche contributions
+    method : {"Laspeyres", "Paasche", "Fisher", "Fisher_chained"}, default "Laspeyres"
+        - "Laspeyres"     : uses weights from the previous period (t - lag_periods)
+        - "Paasche"       : uses current period weights (t)
+        - "Fisher"        : arithmetic mean of the Laspeyres and Paasche contributions
+                            (historical definition, kept for existing callers)
+        - "Fisher_chained": exact additive decomposition of each Fisher chain link;
+                            contributions add up to sqrt((1 + L)(1 + P)) - 1
 
     lag_periods : int, default 12
         Number of periods to lag weights for Laspeyres calculation.
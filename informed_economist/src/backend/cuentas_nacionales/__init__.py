@@ -1,2 +1,2 @@
-from .pib import PIBViews, Oferta, Demanda
-__all__ = ["PIBViews", "Oferta", "Demanda"]
+from .pib import PIBViews, Oferta, Demanda, PIBPanel
+__all__ = ["PIBViews", "Oferta", "Demanda", "PIBPanel"]
@@ -1,4 +1,6 @@
 from .views import PIBViews
 from .oferta import Oferta
 from .demanda import Demanda
-__all__ = ["PIBViews", "Oferta", "Demanda"]
+from .helpers import ColumnView
+from .panel import PIBPanel
+__all__ = ["PIBViews", "Oferta", "Demanda", "ColumnView", "PIBPanel"]
@@ -3,7 +3,7 @@ from typing import Dict, Any
 import pandas as pd
 import re
 
-from .helpers import _concat_by_constants
+from .helpers import ColumnResolver, ColumnView, _concat_by_constants
 from .pib_constantes import ConstantesPIB as C
 
 
@@ -14,8 +14,15 @@ class Demanda:
     - `dataframe` y `series_type` quedan mutables para integrarse con PIBViews.
     """
 
-    def __init__(self, dataframe: pd.DataFrame, series_type: str = 'TC') -> None:
+    def __init__(
+        self,
+        dataframe: pd.DataFrame,
+        series_type: str = 'TC',
+        resolver: ColumnResolver | None = None,
+    ) -> None:
         self._dataframe = dataframe
+        # Índice constante -> posiciones de columna (compartido con PIBViews)
+        self._resolver = resolver if resolver is not None else ColumnResolver()
         # Normaliza el sufijo (acepta "TC" o "_TC")
         self._series_type = series_type if series_type.startswith("_") else f"_{series_type}"
 
@@ -63,6 +70,7 @@ class Demanda:
     @dataframe.setter
     def dataframe(self, value: pd.DataFrame) -> None:
         self._dataframe = value
+        self._resolver.reset()
 
     @property
     def series_type(self) -> str:
@@ -71,6 +79,7 @@ class Demanda:
     @series_type.setter
     def series_type(self, value: str) -> None:
         self._series_type = value if value.startswith("_") else f"_{value}"
+        self._resolver.reset()
 
     # ---------------------------
     # Átomos (read-only)
@@ -183,14 +192,14 @@ class Demanda:
     def terminos_de_intercambio(self) -> str:
         return self._terminos_de_intercambio
     
-    def get_pib(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_pib(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [self.pib + self.series_type]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
     # ---------------------------
     # Métodos que devuelven DataFrames
     # ---------------------------
-    def get_categorias_principales(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_categorias_principales(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [
             self.pib + self.series_type,
             self.gasto_consumo_final_hogares + self.series_type,
@@ -199,25 +208,25 @@ class Demanda:
             self.exportaciones_totales + self.series_type,
             self.importaciones_totales + self.series_type,
         ]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
-    def get_demanda_interna(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_demanda_interna(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [
             self.gasto_consumo_final_hogares + self.series_type,
             self.gasto_consumo_final_gobierno + self.series_type,
             self.formacion_bruta_capital_fijo + self.series_type,
         ]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
-    def get_consumo(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_consumo(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [
             self.gasto_consumo_final + self.series_type,
             self.gasto_consumo_final_hogares + self.series_type,
             self.gasto_consumo_final_gobierno + self.series_type,
         ]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
-    def get_consumo_hogares(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_consumo_hogares(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [
             self.gasto_consumo_final_hogares + self.series_type,
             self.bienes_consumo_duradero + self.series_type,
@@ -225,47 +234,47 @@ class Demanda:
             self.bienes_consumo_no_duradero + self.series_type,
             rf'^(?:PIB_)?{re.escape(self.servicios)}{re.escape(self.series_type)}$',
         ]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
-    def get_inversion(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_inversion(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [
             self.formacion_bruta_capital_fijo + self.series_type,
             self.maquinaria_equipo + self.series_type,
             self.nuevas_construcciones + self.series_type,
         ]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
-    def get_exportaciones(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_exportaciones(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [
             self.exportaciones_totales + self.series_type,
             self.exportaciones_bienes + self.series_type,
             self.exportaciones_servicios + self.series_type,
         ]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
-    def get_exportaciones_bienes(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_exportaciones_bienes(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [
             self.exportaciones_bienes + self.series_type,
             self.exportaciones_bienes_reg_def + self.series_type,
             self.exportaciones_bienes_reg_esp + self.series_type,
         ]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
-    def get_importaciones(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_importaciones(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [
             self.importaciones_totales + self.series_type,
             self.importaciones_bienes + self.series_type,
             self.importaciones_servicios + self.series_type,
         ]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
-    def get_importaciones_bienes(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_importaciones_bienes(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [
             self.importaciones_bienes + self.series_type,
             self.importaciones_bienes_reg_def + self.series_type,
             self.importaciones_bienes_reg_esp + self.series_type,
         ]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
     def get_importaciones_bienes_regimen_def(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
         categories = [
@@ -275,7 +284,7 @@ class Demanda:
 
         ]
 
-        data = _concat_by_constants(self.dataframe, categories, return_dict)
+        data = _concat_by_constants(self.dataframe, categories, return_dict, self._resolver)
 
         data = data.loc[:, ~data.columns.duplicated(keep="first")]
 
@@ -1,34 +1,175 @@
+import re
+import numpy as np
 import pandas as pd
 from typing import Sequence, Any
 
+
+class ColumnResolver:
+    """
+    Índice de resolución de columnas: constante (regex) -> posiciones.
+
+    Cada constante se compila y se resuelve contra las columnas una sola vez;
+    las llamadas siguientes reutilizan las posiciones. El índice se invalida
+    con `reset()` (setters de `dataframe`/`series_type`) o automáticamente si
+    cambia el objeto de columnas del DataFrame.
+    """
+
+    __slots__ = ("_columns", "_names", "_positions")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self, columns: pd.Index | None = None) -> None:
+        self._columns = columns
+        self._names: list[str] | None = None
+        self._positions: dict[str, np.ndarray] = {}
+
+    def positions(self, columns: pd.Index, constant: str) -> np.ndarray:
+        """Posiciones (en orden de columnas) que cumplen `re.search(constant, col)`."""
+        if columns is not self._columns:
+            self.reset(columns)
+        pos = self._positions.get(constant)
+        if pos is None:
+            if self._names is None:
+                self._names = [str(c) for c in columns]
+            search = re.compile(constant).search
+            pos = np.fromiter((i for i, name in enumerate(self._names) if search(name)), dtype=np.intp)
+            self._positions[constant] = pos
+        return pos
+
+
+class ColumnView:
+    """
+    Selección diferida de columnas: guarda el DataFrame padre y las posiciones,
+    sin copiar datos. Se materializa solo cuando se pide (`to_frame`), o se
+    expone como arreglo NumPy (`to_numpy`), que es una vista sin copia cuando
+    las columnas forman un bloque contiguo float64 del padre.
+    """
+
+    __slots__ = ("_parent", "_positions")
+
+    def __init__(self, parent: pd.DataFrame, positions: np.ndarray) -> None:
+        self._parent = parent
+        self._positions = np.asarray(positions, dtype=np.intp)
+
+    @property
+    def parent(self) -> pd.DataFrame:
+        return self._parent
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self._positions
+
+    @property
+    def columns(self) -> pd.Index:
+        return self._parent.columns.take(self._positions)
+
+    @property
+    def index(self) -> pd.Index:
+        return self._parent.index
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self._parent.index), len(self._positions)
+
+    @property
+    def empty(self) -> bool:
+        return 0 in self.shape
+
+    @property
+    def is_contiguous(self) -> bool:
+        """True si las posiciones son un rango consecutivo (start:stop)."""
+        p = self._positions
+        return p.size > 0 and bool((np.diff(p) == 1).all())
+
+    def __len__(self) -> int:
+        return len(self._parent.index)
+
+    def __getitem__(self, column: str) -> pd.Series:
+        loc = self.columns.get_loc(column)
+        if not isinstance(loc, (int, np.integer)):
+            return self.to_frame()[column]
+        return self._parent.iloc[:, int(self._positions[loc])]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self.to_numpy()
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        return f"ColumnView(shape={self.shape}, columns={self.columns.tolist()})"
+
+    def _block_view(self) -> np.ndarray | None:
+        # Vista directa sobre el bloque float64 del padre (internals de pandas):
+        # solo si todas las columnas viven en el mismo bloque y en orden contiguo.
+        # Los internals (_mgr, blknos, blklocs, blocks) no son API pública: si
+        # cambian o no tienen la forma esperada se devuelve None y `to_numpy`
+        # recurre a la copia vía `to_frame()`.
+        if not self.is_contiguous:
+            return None
+        try:
+            mgr = self._parent._mgr
+            start, stop = int(self._positions[0]), int(self._positions[-1]) + 1
+            blknos = np.asarray(mgr.blknos[start:stop])
+            if not (blknos == blknos[0]).all():
+                return None
+            block = mgr.blocks[int(blknos[0])]
+            locs = np.asarray(mgr.blklocs[start:stop])
+            if block.dtype != np.float64 or not (np.diff(locs) == 1).all():
+                return None
+            values = np.asarray(block.values)[int(locs[0]):int(locs[-1]) + 1].T
+        except (AttributeError, IndexError, TypeError, ValueError):
+            return None
+        if values.shape != self.shape or values.dtype != np.float64:
+            return None
+        values = values.view()
+        values.flags.writeable = False
+        return values
+
+    def to_numpy(self) -> np.ndarray:
+        """Arreglo (T, K); sin copia (solo lectura) para bloques contiguos float64."""
+        values = self._block_view()
+        if values is not None:
+            return values
+        return self.to_frame().to_numpy()
+
+    def to_frame(self) -> pd.DataFrame:
+        """Materializa la selección como DataFrame nuevo."""
+        return self._parent.take(self._positions, axis=1)
+
+
 def _concat_by_constants(
     df: pd.DataFrame,
     constants: str | Sequence[str],
-    return_dict: bool = False
-) -> dict[str, Any] | pd.DataFrame:
+    return_dict: bool = False,
+    resolver: ColumnResolver | None = None,
+    as_view: bool = False,
+) -> dict[str, Any] | pd.DataFrame | ColumnView:
     """
-    Helper basado en df.filter(regex=c) por cada constante.
+    Selecciona las columnas que cumplen cada constante (misma semántica que
+    df.filter(regex=c) concatenado), con un solo `take` sobre las posiciones
+    del `resolver`. Con `as_view=True`, `data` es un ColumnView diferido.
     Devuelve un dict con: data, found, constants_used, missing_constants, complete.
     """
     if isinstance(constants, str):
         constants = [constants]
+    if resolver is None:
+        resolver = ColumnResolver()
 
-    frames: list[pd.DataFrame] = []
-    found: list[str] = []
+    taken: list[np.ndarray] = []
     missing: list[str] = []
 
     for c in constants:
-        sub = df.filter(regex=c)
-        if not sub.empty:
-            frames.append(sub)
-            found.extend(sub.columns.tolist())
+        pos = resolver.positions(df.columns, c)
+        if pos.size:
+            taken.append(pos)
         else:
             missing.append(c)
 
-    data = pd.concat(frames, axis=1) if frames else pd.DataFrame(index=df.index)
+    positions = np.concatenate(taken) if taken else np.empty(0, dtype=np.intp)
+    data = ColumnView(df, positions) if as_view else df.take(positions, axis=1)
     s = {
         "data": data,
-        "found": found,
+        "found": data.columns.tolist(),
         "constants_used": list(constants),
         "missing_constants": missing,
         "complete": len(missing) == 0,
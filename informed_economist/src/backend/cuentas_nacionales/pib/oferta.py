@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import Dict, Any
 import pandas as pd
 
-from .helpers import _concat_by_constants
+from .helpers import ColumnResolver, ColumnView, _concat_by_constants
 from .pib_constantes import ConstantesPIB as C
 
 class Oferta:
@@ -10,8 +10,15 @@ class Oferta:
     Vista de oferta (Oferta) sobre un DataFrame del PIB.
     """
 
-    def __init__(self, dataframe: pd.DataFrame, series_type: str = "TC") -> None:
+    def __init__(
+        self,
+        dataframe: pd.DataFrame,
+        series_type: str = "TC",
+        resolver: ColumnResolver | None = None,
+    ) -> None:
         self._dataframe = dataframe
+        # Índice constante -> posiciones de columna (compartido con PIBViews)
+        self._resolver = resolver if resolver is not None else ColumnResolver()
         # Normaliza el sufijo: acepta "TC" o "_TC", "SO" o "_SO", "SD" o "_SD"
         self._series_type = series_type if series_type.startswith("_") else f"_{series_type}"
         self._pib = C.PIB
@@ -45,6 +52,7 @@ class Oferta:
     @dataframe.setter
     def dataframe(self, dataframe: pd.DataFrame) -> None:
         self._dataframe = dataframe
+        self._resolver.reset()
 
     @property
     def series_type(self) -> str:
@@ -53,6 +61,7 @@ class Oferta:
     @series_type.setter
     def series_type(self, series_type: str) -> None:
         self._series_type = series_type if series_type.startswith("_") else f"_{series_type}"
+        self._resolver.reset()
 
     # ---------------------------
     # Atributos read-only
@@ -151,41 +160,41 @@ class Oferta:
     # --------------------------------
     # Métodos que devuelven DataFrames
     # --------------------------------
-    def get_pib(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_pib(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [self.pib + self.series_type]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
-    def get_categorias_principales(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_categorias_principales(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [
             self.pib + self.series_type,
             self.valor_agregado + self.series_type,
             self.impuestos + self.series_type,
         ]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
-    def get_industrias(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_industrias(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [base + self.series_type for base in self.industrias]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
 
-    def get_valor_agregado(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_valor_agregado(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [self.valor_agregado + self.series_type]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
     
     def get_industria_ampliada(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
         categories = [base + self.series_type for base in self.industria_ampliada]
-        df = _concat_by_constants(self.dataframe, categories, return_dict)
+        df = _concat_by_constants(self.dataframe, categories, return_dict, self._resolver)
         df['Industria_Ampliada' + self.series_type] = df.sum(axis = 1)
         return df
 
     def get_servicios(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
         categories = [base + self.series_type for base in self.servicios]
-        df = _concat_by_constants(self.dataframe, categories, return_dict)
+        df = _concat_by_constants(self.dataframe, categories, return_dict, self._resolver)
         df['Servicios' + self.series_type] = df.sum(axis = 1)
         return df
 
     def get_sectores(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
         categories = [self.agricultura_silvicultura_pesca + self.series_type]
-        df = _concat_by_constants(self.dataframe, categories, return_dict)
+        df = _concat_by_constants(self.dataframe, categories, return_dict, self._resolver)
         df.columns = ['Agro' + self.series_type]
 
         servicios = self.get_servicios()
@@ -197,6 +206,6 @@ class Oferta:
         df = pd.concat([df, servicios, industria], axis = 1)
         return df
 
-    def get_impuestos(self, return_dict: bool = False) -> Dict[str, Any] | pd.DataFrame:
+    def get_impuestos(self, return_dict: bool = False, as_view: bool = False) -> Dict[str, Any] | pd.DataFrame | ColumnView:
         categories = [self.impuestos + self.series_type]
-        return _concat_by_constants(self.dataframe, categories, return_dict)
+        return _concat_by_constants(self.dataframe, categories, return_dict, self._resolver, as_view)
@@ -0,0 +1,250 @@
+from __future__ import annotations
+from typing import Iterable, Mapping, Sequence
+import numpy as np
+import pandas as pd
+
+SERIES_TYPES: tuple[str, ...] = ("TC", "SO", "SD")
+
+
+def _normalize_series_type(series_type: str) -> str:
+    # Acepta "TC" o "_TC", igual que Oferta/Demanda
+    return series_type[1:] if series_type.startswith("_") else series_type
+
+
+class ColumnRegistry:
+    """
+    Registro compacto de columnas de un bloque: nombre -> posición.
+    """
+
+    __slots__ = ("_names", "_positions")
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self._names: tuple[str, ...] = tuple(names)
+        self._positions: dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        if len(self._positions) != len(self._names):
+            raise ValueError("Nombres de columna duplicados en el bloque.")
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._positions
+
+    def position(self, name: str) -> int:
+        return self._positions[name]
+
+    def positions(self, names: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self._positions[n] for n in names), dtype=np.intp)
+
+
+class PIBPanel:
+    """
+    Panel columnar del PIB.
+
+    - Un bloque float64 contiguo (T, K) por tipo de serie (TC/SO/SD), todos
+      sobre el mismo índice de fechas.
+    - Un registro de columnas por bloque (`ColumnRegistry`).
+    - Una tabla de metadatos aparte (columnas políticas como categorías ordenadas).
+
+    `frame(series_type)` expone cada bloque como DataFrame de un solo bloque
+    sin copiar (de solo lectura), que es lo que consume PIBViews;
+    `contribution_inputs` / `batch_inputs` arman los pares (crecimiento, pesos)
+    de compute_contributions_fast y compute_contributions_batch.
+    """
+
+    __slots__ = ("_index", "_blocks", "_registries", "_metadata")
+
+    def __init__(
+        self,
+        index: pd.Index,
+        blocks: Mapping[str, np.ndarray],
+        columns: Mapping[str, Sequence[str]],
+        metadata: pd.DataFrame | None = None,
+    ) -> None:
+        self._index = pd.Index(index)
+        self._blocks: dict[str, np.ndarray] = {}
+        self._registries: dict[str, ColumnRegistry] = {}
+        for series_type, values in blocks.items():
+            key = _normalize_series_type(series_type)
+            values = np.ascontiguousarray(values, dtype=np.float64)
+            registry = ColumnRegistry(columns[series_type])
+            if values.shape != (len(self._index), len(registry)):
+                raise ValueError(f"El bloque {key} no coincide con el índice y sus columnas.")
+            values.flags.writeable = False
+            self._blocks[key] = values
+            self._registries[key] = registry
+        self._metadata = (
+            metadata.reindex(self._index) if metadata is not None else pd.DataFrame(index=self._index)
+        )
+
+    # ---------------------------
+    # Construcción
+    # ---------------------------
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame]) -> "PIBPanel":
+        """
+        Construye el panel a partir de un DataFrame por tipo de serie
+        (p. ej. los libros Variables_PIB_TC/SO/SD con `fecha` como índice).
+        Las columnas numéricas van al bloque; el resto, a los metadatos.
+        """
+        if not frames:
+            raise ValueError("Se requiere al menos un DataFrame.")
+        index = None
+        for df in frames.values():
+            index = df.index if index is None else index.union(df.index)
+        index = index.sort_values()
+
+        blocks: dict[str, np.ndarray] = {}
+        columns: dict[str, list[str]] = {}
+        meta_parts: list[pd.DataFrame] = []
+        for series_type, df in frames.items():
+            numeric = df.select_dtypes("number")
+            columns[series_type] = [str(c) for c in numeric.columns]
+            blocks[series_type] = numeric.reindex(index).to_numpy(dtype=np.float64)
+            other = df.drop(columns=numeric.columns)
+            if not other.empty:
+                meta_parts.append(other)
+
+        metadata = None
+        if meta_parts:
+            metadata = meta_parts[0]
+            for part in meta_parts[1:]:
+                metadata = metadata.combine_first(part)
+            metadata = cls._as_categories(metadata.reindex(index))
+        return cls(index, blocks, columns, metadata)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, series_types: Sequence[str] = SERIES_TYPES) -> "PIBPanel":
+        """
+        Separa un DataFrame mixto por sufijo de columna (`*_TC`, `*_SO`, `*_SD`).
+        Las columnas no numéricas pasan a los metadatos.
+        """
+        numeric = df.select_dtypes("number")
+        names = numeric.columns.astype(str)
+        blocks: dict[str, np.ndarray] = {}
+        columns: dict[str, list[str]] = {}
+        for series_type in series_types:
+            key = _normalize_series_type(series_type)
+            mask = np.asarray(names.str.endswith(f"_{key}"))
+            if mask.any():
+                columns[key] = names[mask].tolist()
+                blocks[key] = numeric.iloc[:, np.flatnonzero(mask)].to_numpy(dtype=np.float64)
+        metadata = df.drop(columns=numeric.columns)
+        return cls(df.index, blocks, columns, cls._as_categories(metadata))
+
+    @staticmethod
+    def _as_categories(metadata: pd.DataFrame) -> pd.DataFrame:
+        # Categorías ordenadas por primera aparición (orden cronológico del índice)
+        out = {}
+        for col in metadata.columns:
+            s = metadata[col]
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                out[col] = s
+            else:
+                out[col] = pd.Categorical(s, categories=pd.unique(s.dropna()), ordered=True)
+        return pd.DataFrame(out, index=metadata.index)
+
+    # ---------------------------
+    # Acceso
+    # ---------------------------
+    @property
+    def index(self) -> pd.Index:
+        return self._index
+
+    @property
+    def series_types(self) -> list[str]:
+        return list(self._blocks)
+
+    @property
+    def metadata(self) -> pd.DataFrame:
+        return self._metadata
+
+    def registry(self, series_type: str) -> ColumnRegistry:
+        return self._registries[_normalize_series_type(series_type)]
+
+    def columns(self, series_type: str) -> list[str]:
+        return list(self.registry(series_type).names)
+
+    def values(self, series_type: str, columns: Sequence[str] | None = None) -> np.ndarray:
+        """
+        Bloque (T, K) de solo lectura. Sin `columns` es el bloque completo sin
+        copia; con `columns` se hace un único take sobre sus posiciones.
+        """
+        key = _normalize_series_type(series_type)
+        block = self._blocks[key]
+        if columns is None:
+            return block
+        return block.take(self._registries[key].positions(columns), axis=1)
+
+    def frame(
+        self, series_type: str, columns: Sequence[str] | None = None, copy: bool = False
+    ) -> pd.DataFrame:
+        """
+        DataFrame float64 de un solo bloque. Sin `columns` ni `copy` comparte la
+        memoria del panel y es de solo lectura: escribir en él (`df.iloc[...] = x`)
+        lanza ValueError. Con `copy=True` devuelve una copia modificable.
+        """
+        names = self.columns(series_type) if columns is None else list(columns)
+        values = self.values(series_type, columns)
+        return pd.DataFrame(
+            values.copy() if copy else values, index=self._index, columns=names, copy=False
+        )
+
+    # ---------------------------
+    # Contribuciones
+    # ---------------------------
+    def contribution_inputs(
+        self,
+        components: Sequence[str],
+        total: str,
+        growth_type: str = "TC",
+        level_type: str = "SO",
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Par (crecimiento, pesos) para compute_contributions_fast / compute_contributions_batch.
+
+        `components` y `total` son nombres base, sin sufijo (p. ej. "PIB_Manufactura").
+        El crecimiento sale del bloque `growth_type` (en %, growth_scale="percent") y
+        los pesos son la participación de cada componente en `total` dentro del
+        bloque de niveles `level_type` (en unidades, weight_scale="unit"). Ambos
+        DataFrames usan los nombres base como columnas para que se alineen.
+        """
+        growth_key = _normalize_series_type(growth_type)
+        level_key = _normalize_series_type(level_type)
+        names = list(components)
+        growth = self.values(growth_key, [f"{name}_{growth_key}" for name in names])
+        levels = self.values(level_key, [f"{name}_{level_key}" for name in names])
+        total_level = self.values(level_key, [f"{total}_{level_key}"])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weights = levels / total_level
+        return (
+            pd.DataFrame(growth, index=self._index, columns=names),
+            pd.DataFrame(weights, index=self._index, columns=names),
+        )
+
+    def batch_inputs(
+        self,
+        decompositions: Mapping[str, tuple[Sequence[str], str]],
+        growth_type: str = "TC",
+        level_type: str = "SO",
+    ) -> dict[str, tuple[pd.DataFrame, pd.DataFrame]]:
+        """`{nombre: (componentes, total)}` -> `{nombre: (crecimiento, pesos)}` para compute_contributions_batch."""
+        return {
+            name: self.contribution_inputs(components, total, growth_type, level_type)
+            for name, (components, total) in decompositions.items()
+        }
+
+    def to_frame(self, series_type: str, include_metadata: bool = True) -> pd.DataFrame:
+        """Bloque más metadatos, con la forma de los DataFrames etiquetados de script.py."""
+        df = self.frame(series_type)
+        if include_metadata and not self._metadata.empty:
+            df = pd.concat([df, self._metadata], axis=1)
+        return df
+
+    def __repr__(self) -> str:
+        shapes = ", ".join(f"{k}={v.shape}" for k, v in self._blocks.items())
+        return f"PIBPanel(T={len(self._index)}, {shapes}, metadata={list(self._metadata.columns)})"
@@ -1,24 +1,40 @@
+from __future__ import annotations
 import pandas as pd
 from .oferta import Oferta
 from .demanda import Demanda
+from .helpers import ColumnResolver
+from .panel import PIBPanel
 
 
 class PIBViews:
-    def __init__(self, dataframe: pd.DataFrame, series_type: str = "TC") -> None:
+    def __init__(self, dataframe: pd.DataFrame | PIBPanel, series_type: str = "TC") -> None:
+        # Con un PIBPanel, `dataframe` es el bloque float64 del tipo de serie activo
+        self._panel = dataframe if isinstance(dataframe, PIBPanel) else None
+        if self._panel is not None:
+            dataframe = self._panel.frame(series_type)
         self._dataframe = dataframe
-        self._oferta = Oferta(dataframe, series_type=series_type)
-        self._demanda = Demanda(dataframe, series_type=series_type)
+        # Un solo índice de columnas para ambas vistas; los setters lo invalidan
+        self._resolver = ColumnResolver()
+        self._oferta = Oferta(dataframe, series_type=series_type, resolver=self._resolver)
+        self._demanda = Demanda(dataframe, series_type=series_type, resolver=self._resolver)
 
     @property
     def dataframe(self) -> pd.DataFrame:
         return self._dataframe
 
     @dataframe.setter
-    def dataframe(self, new_dataframe: pd.DataFrame) -> None:
+    def dataframe(self, new_dataframe: pd.DataFrame | PIBPanel) -> None:
+        self._panel = new_dataframe if isinstance(new_dataframe, PIBPanel) else None
+        if self._panel is not None:
+            new_dataframe = self._panel.frame(self.series_type)
         self._dataframe = new_dataframe
         self._oferta.dataframe = new_dataframe
         self._demanda.dataframe = new_dataframe
 
+    @property
+    def panel(self) -> PIBPanel | None:
+        return self._panel
+
     @property
     def oferta(self) -> "Oferta":
         return self._oferta
@@ -36,3 +52,5 @@ class PIBViews:
     def series_type(self, value: str) -> None:
         self._oferta.series_type = value
         self._demanda.series_type = value
+        if self._panel is not None:
+            self.dataframe = self._panel
@@ -787,7 +787,7 @@ def plot_contributions(
 
 def plot_admin_sector_dumbbell(
     summary: pd.DataFrame,
-    admin_order: List[str],
+    admin_order: Optional[List[str]],
     presidential_colors: Dict[str, str],
     x_range: Optional[Tuple[float, float]] = None,
     width: Optional[int] = None,
@@ -804,9 +804,16 @@ def plot_admin_sector_dumbbell(
     """
     Dumbbell chart showing, for each administration, the economic activity with 
     the highest and lowest average interannual GDP growth.
+    If ``admin_order`` is None, the order of an ordered categorical index
+    (e.g. ``Label`` from ``tag_politics``) is used.
     """
 
     # --- Filtra admins en el orden dado ---
+    if admin_order is None:
+        if isinstance(summary.index, pd.CategoricalIndex) and summary.index.ordered:
+            admin_order = list(summary.index.categories)
+        else:
+            admin_order = list(summary.index)
     admins = [a for a in admin_order if a in summary.index]
     df_plot = summary.loc[admins].copy()
 
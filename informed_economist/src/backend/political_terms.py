@@ -11,6 +11,17 @@ Functions
     Returns a DataFrame with the start and end dates of each presidential term,
     including President, Party, Term (e.g., "2006–2010"), and Label (short surname).
 
+- term_positions(index, terms_df=None) :
+    Returns, for each timestamp, the row position of its term in terms_df
+    (-1 outside every term). Memoized by index identity.
+
+- political_tags(index, terms_df=None, columns=("President","Party","Term","Label")) :
+    Returns every requested political attribute for an index with one take,
+    as ordered categoricals (administration chronology).
+
+- administration_order(terms_df=None, column="Label") :
+    Returns the chronological order of administrations (or parties, terms...).
+
 - assign_by_terms(index, terms_df, column) :
     Maps each timestamp in a DatetimeIndex to the corresponding political
     attribute (e.g., President or Party) according to the presidential terms.
@@ -25,10 +36,17 @@ Notes
 -----
 - The mapping is currently specific to Costa Rica from 1990 onwards.
 - The Label field uses the most recognizable surname (e.g., "Arias", "Solís", "Chaves").
-- Overlapping transfer dates (e.g., May 8) are handled gracefully using
-  pandas IntervalIndex with non-unique lookups.
+- Transfer dates (e.g., May 8) belong to both adjacent terms; they are
+  assigned to the incoming administration.
+- build_cr_terms() is cached and the interval lookup for a given index is
+  computed once, so tagging a panel is a single vectorized pass whatever
+  the number of columns (this module is also used by be_government/script.py).
 """
 
+import weakref
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
 # -----------------------------
@@ -69,21 +87,8 @@ def _short_label(name: str) -> str:
 # ------------------------------------
 # 2) Costa Rican presidential terms
 # ------------------------------------
-def build_cr_terms() -> pd.DataFrame:
-    """
-    Build a DataFrame of Costa Rican presidential terms (1990 onwards).
-
-    Returns
-    -------
-    pd.DataFrame
-        A DataFrame with columns:
-        - start : datetime64, start date of the term
-        - end   : datetime64, end date of the term
-        - President : str, full name of the president
-        - Party     : str, party acronym
-        - Term      : str, formatted range (e.g., "2006–2010")
-        - Label     : str, simplified surname for easier reference
-    """
+@lru_cache(maxsize=1)
+def _cr_terms() -> pd.DataFrame:
     terms = [
         ("1990-05-08", "1994-05-08", "Rafael Ángel Calderón Fournier", "PUSC"),
         ("1994-05-08", "1998-05-08", "José María Figueres Olsen", "PLN"),
@@ -103,9 +108,132 @@ def build_cr_terms() -> pd.DataFrame:
     df["Label"] = df["President"].map(_short_label)
     return df
 
+def build_cr_terms() -> pd.DataFrame:
+    """
+    Build a DataFrame of Costa Rican presidential terms (1990 onwards).
+
+    The table is built once per process; each call returns a copy so callers
+    may modify it freely.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame with columns:
+        - start : datetime64, start date of the term
+        - end   : datetime64, end date of the term
+        - President : str, full name of the president
+        - Party     : str, party acronym
+        - Term      : str, formatted range (e.g., "2006–2010")
+        - Label     : str, simplified surname for easier reference
+    """
+    return _cr_terms().copy()
+
 # ---------------------------------------------------
 # 3) Generic assignment engine (handles overlaps)
 # ---------------------------------------------------
+_POSITIONS_CACHE_SIZE = 16
+_positions_cache: list = []
+
+def _compute_positions(index: pd.DatetimeIndex, terms_df: pd.DataFrame) -> np.ndarray:
+    starts = pd.DatetimeIndex(terms_df["start"])
+    ends = pd.DatetimeIndex(terms_df["end"])
+    order = np.argsort(starts.asi8, kind="stable")
+    sorted_starts = starts.asi8[order]
+    stamps = pd.DatetimeIndex(index).asi8
+
+    # Last term starting on or before each date (incoming administration on transfer days)
+    candidate = np.searchsorted(sorted_starts, stamps, side="right") - 1
+    valid = candidate >= 0
+    rows = np.where(valid, order[np.clip(candidate, 0, None)], -1)
+    valid &= stamps <= ends.asi8[np.clip(rows, 0, None)]
+    valid &= ~pd.isna(index)
+    return np.where(valid, rows, -1)
+
+def term_positions(index: pd.DatetimeIndex, terms_df: pd.DataFrame | None = None) -> np.ndarray:
+    """
+    Locate the term of each timestamp in a DatetimeIndex.
+
+    The lookup is a single ``searchsorted`` over the term start dates and is
+    memoized by the identity of ``index`` and ``terms_df``, so tagging several
+    columns (or calling again with the same index) reuses the positions.
+
+    Parameters
+    ----------
+    index : pd.DatetimeIndex
+        Index of dates to be mapped to political terms.
+    terms_df : pd.DataFrame, optional
+        DataFrame with 'start' and 'end' columns. If None, build_cr_terms() is used.
+
+    Returns
+    -------
+    np.ndarray
+        Integer row positions into ``terms_df`` (-1 for dates outside every term).
+    """
+    if terms_df is None:
+        terms_df = _cr_terms()
+    for index_ref, terms_ref, positions in _positions_cache:
+        if index_ref() is index and terms_ref() is terms_df:
+            return positions
+
+    positions = _compute_positions(index, terms_df)
+    positions.setflags(write=False)
+    _positions_cache.insert(0, (weakref.ref(index), weakref.ref(terms_df), positions))
+    del _positions_cache[_POSITIONS_CACHE_SIZE:]
+    return positions
+
+def political_tags(index: pd.DatetimeIndex,
+                   terms_df: pd.DataFrame | None = None,
+                   columns: tuple[str, ...] = ("President","Party","Term","Label")) -> pd.DataFrame:
+    """
+    Return every requested political attribute for ``index`` with one take.
+
+    Parameters
+    ----------
+    index : pd.DatetimeIndex
+        Index of dates to be mapped to political terms.
+    terms_df : pd.DataFrame, optional
+        DataFrame returned by build_cr_terms(). If None, the cached default is used.
+    columns : tuple of str, default ("President","Party","Term","Label")
+        Columns of terms_df to return.
+
+    Returns
+    -------
+    pd.DataFrame
+        One ordered ``pd.Categorical`` column per requested attribute, aligned
+        with ``index``; the category order is the chronology of the terms.
+        Rows outside the defined intervals are NaN.
+    """
+    if terms_df is None:
+        terms_df = _cr_terms()
+    positions = term_positions(index, terms_df)
+
+    # Codes of every term row for every column; a trailing -1 row absorbs the
+    # dates outside every term, so one take fills all columns at once
+    chronological = terms_df.sort_values("start", kind="stable")
+    categories, codes = [], []
+    for column in columns:
+        dtype = pd.CategoricalDtype(pd.unique(chronological[column].to_numpy()), ordered=True)
+        categories.append(dtype)
+        codes.append(pd.Categorical(terms_df[column], dtype=dtype).codes)
+    padded = np.vstack([np.column_stack(codes), np.full((1, len(columns)), -1, dtype=np.int8)])
+    taken = padded.take(np.where(positions >= 0, positions, len(terms_df)), axis=0)
+
+    return pd.DataFrame(
+        {column: pd.Categorical.from_codes(taken[:, i], dtype=categories[i])
+         for i, column in enumerate(columns)},
+        index=index,
+    )
+
+def administration_order(terms_df: pd.DataFrame | None = None, column: str = "Label") -> list[str]:
+    """
+    Return the values of ``column`` in chronological order of the terms.
+
+    This is the category order used by political_tags / tag_politics.
+    """
+    if terms_df is None:
+        terms_df = _cr_terms()
+    return list(pd.unique(terms_df.sort_values("start", kind="stable")[column].to_numpy()))
+
 def assign_by_terms(index: pd.DatetimeIndex, terms_df: pd.DataFrame, column: str) -> pd.Series:
     """
     Assign political attributes to each timestamp in a DatetimeIndex.
@@ -123,18 +251,10 @@ def assign_by_terms(index: pd.DatetimeIndex, terms_df: pd.DataFrame, column: str
     Returns
     -------
     pd.Series
-        A Series aligned with the input index, containing the mapped values.
-        Rows outside the defined intervals return <NA>.
+        An ordered categorical Series aligned with the input index.
+        Rows outside the defined intervals return NaN.
     """
-    intervals = pd.IntervalIndex.from_arrays(terms_df["start"], terms_df["end"], closed="both")
-    locs, _ = intervals.get_indexer_non_unique(index)
-
-    out = pd.Series(pd.NA, index=index, dtype="object")
-    mask = locs >= 0
-    if mask.any():
-        values = terms_df[column].to_numpy()
-        out[mask] = values[locs[mask]]
-    return out
+    return political_tags(index, terms_df, (column,))[column]
 
 def tag_politics(df: pd.DataFrame,
                  terms_df: pd.DataFrame | None = None,
@@ -155,16 +275,15 @@ def tag_politics(df: pd.DataFrame,
     Returns
     -------
     pd.DataFrame
-        Copy of the input DataFrame with additional columns:
+        Copy of the input DataFrame with additional ordered categorical columns
+        (categories in chronological order of the terms):
         - President (full name)
         - Party     (acronym)
         - Term      (period string "YYYY–YYYY")
         - Label     (short surname)
     """
-    if terms_df is None:
-        terms_df = build_cr_terms()
+    tags = political_tags(df.index, terms_df, tuple(add_cols))
     out = df.copy()
     for c in add_cols:
-        out[c] = assign_by_terms(out.index, terms_df, c)
+        out[c] = tags[c]
     return out
-
@@ -4,8 +4,18 @@ import numpy as np
 from typing import List, Optional, Literal, Union
 
 def compute_basic_statistics(df, value_col="PIB_TC", groupby_col="Label"):
+    """
+    Descriptive statistics of ``value_col`` per group.
+
+    The group key is used as an ordered ``pd.Categorical``: tags from
+    ``tag_politics`` already are (administration chronology); any other
+    column is ordered by first appearance. The result index keeps that order.
+    """
+    key = df[groupby_col]
+    if not isinstance(key.dtype, pd.CategoricalDtype):
+        key = pd.Categorical(key, categories=pd.unique(key.dropna()), ordered=True)
     stats = (
-        df.groupby(groupby_col)[value_col]
+        df[value_col].groupby(key, observed=True)
         .agg(
             mean="mean",
             median="median",
@@ -17,7 +27,7 @@ def compute_basic_statistics(df, value_col="PIB_TC", groupby_col="Label"):
             count="count"
         )
     )
-    return stats
+    return stats.rename_axis(groupby_col)
 
 
 def calculate_component_percentages(
@@ -0,0 +1,37 @@
+import pandas as pd
+
+from backend.contributions import to_long_format
+from backend.political_terms import administration_order, political_tags, tag_politics
+from backend.utils import compute_basic_statistics
+
+
+def test_political_tags_are_chronologically_ordered_categories():
+    index = pd.date_range("2015-03-31", "2024-12-31", freq="QE")
+    tags = political_tags(index)
+    for column in ("President", "Party", "Term", "Label"):
+        assert isinstance(tags[column].dtype, pd.CategoricalDtype) and tags[column].cat.ordered
+    assert list(tags["Label"].cat.categories) == administration_order()
+    assert list(tags["Party"].cat.categories) == ["PUSC", "PLN", "PAC", "PPSD"]
+    assert tags["Label"].cat.codes.is_monotonic_increasing
+    assert (tags["Label"] < "Chaves").iloc[0]
+
+
+def test_basic_statistics_follow_the_administration_chronology():
+    index = pd.date_range("2006-06-30", "2019-12-31", freq="QE", name="fecha")
+    df = tag_politics(pd.DataFrame({"PIB_TC": range(len(index))}, index=index, dtype=float))
+    stats = compute_basic_statistics(df)
+    assert stats.index.name == "Label"
+    assert list(stats.index) == ["Arias", "Chinchilla", "Solís", "Alvarado"]
+
+
+def test_plain_group_keys_keep_first_appearance_order():
+    df = pd.DataFrame({"PIB_TC": [1.0, 2.0, 3.0], "Grupo": ["zeta", "alfa", "zeta"]})
+    assert list(compute_basic_statistics(df, groupby_col="Grupo").index) == ["zeta", "alfa"]
+
+
+def test_long_format_components_are_ordered_categories():
+    index = pd.date_range("2020-03-31", periods=2, freq="QE")
+    frame = pd.DataFrame({"Manuf": [1.0, 2.0], "Agro": [3.0, 4.0]}, index=index)
+    tidy = to_long_format(frame, frame / 10, frame / 100)
+    component = tidy["component"]
+    assert component.cat.ordered and list(component.cat.categories) == ["Agro", "Manuf"]
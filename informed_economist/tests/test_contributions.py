@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.contributions import (
+    chain_link_contributions_array,
+    compute_contributions,
+    fisher_chained_contributions_array,
+)
+
+
+def _inputs(seed=0, shape=(6, 4)):
+    rng = np.random.default_rng(seed)
+    g = rng.normal(0.03, 0.05, shape)
+    w_lag = rng.dirichlet(np.ones(shape[1]), shape[0])
+    w = rng.dirichlet(np.ones(shape[1]), shape[0])
+    return g, w_lag, w
+
+
+def _frames(periods=8):
+    index = pd.date_range("2020-03-31", periods=periods, freq="QE")
+    g, _, w = _inputs(shape=(periods, 3))
+    return (pd.DataFrame(g, index=index, columns=["A", "B", "C"]),
+            pd.DataFrame(w, index=index, columns=["A", "B", "C"]))
+
+
+def test_rows_add_up_exactly_to_the_fisher_growth():
+    g, w_lag, w = _inputs()
+    contrib, total = fisher_chained_contributions_array(g, w_lag, w)
+    laspeyres = (w_lag * g).sum(axis=1)
+    paasche = (w * g).sum(axis=1)
+    np.testing.assert_allclose(total, np.sqrt((1 + laspeyres) * (1 + paasche)) - 1)
+    np.testing.assert_allclose(contrib.sum(axis=1), total, rtol=0, atol=1e-15)
+
+
+def test_contributions_follow_the_additive_fisher_formula():
+    g, w_lag, w = _inputs()
+    contrib, total = fisher_chained_contributions_array(g, w_lag, w)
+    laspeyres = (w_lag * g).sum(axis=1, keepdims=True)
+    paasche = (w * g).sum(axis=1, keepdims=True)
+    expected = g * (w_lag * (2 + paasche) + w * (2 + laspeyres)) / (2 * (2 + total[:, None]))
+    np.testing.assert_allclose(contrib, expected)
+
+
+def test_equal_weights_reduce_to_the_laspeyres_contributions():
+    g, _, w = _inputs()
+    contrib, total = fisher_chained_contributions_array(g, w, w)
+    np.testing.assert_allclose(contrib, w * g)
+    np.testing.assert_allclose(total, (w * g).sum(axis=1))
+
+
+def test_groups_are_separate_decompositions():
+    g, w_lag, w = _inputs(shape=(5, 5))
+    contrib, totals = fisher_chained_contributions_array(g, w_lag, w, group_starts=np.array([0, 2]))
+    left, left_total = fisher_chained_contributions_array(g[:, :2], w_lag[:, :2], w[:, :2])
+    np.testing.assert_allclose(contrib[:, :2], left)
+    np.testing.assert_allclose(totals[:, 0], left_total)
+    np.testing.assert_allclose(contrib[:, 2:].sum(axis=1), totals[:, 1])
+
+
+def test_nan_inputs_give_nan_rows():
+    g, w_lag, w = _inputs()
+    g[2, 1] = np.nan
+    contrib, total = fisher_chained_contributions_array(g, w_lag, w)
+    assert np.isnan(total[2]) and np.isnan(contrib[2]).all()
+    assert not np.isnan(contrib[3]).any()
+    with pytest.raises(ValueError):
+        fisher_chained_contributions_array(g, w_lag[:-1], w)
+
+
+def test_chained_contributions_add_up_to_the_cumulative_growth():
+    g, w_lag, w = _inputs(shape=(10, 4))
+    contrib, link = fisher_chained_contributions_array(g, w_lag, w)
+    chained = chain_link_contributions_array(contrib, link)
+    np.testing.assert_allclose(chained.sum(axis=1), np.cumprod(1 + link) - 1)
+    np.testing.assert_allclose(chained[0], contrib[0])
+
+
+def test_fisher_chained_method_matches_the_array_engine():
+    growth, weights = _frames()
+    result = compute_contributions(growth, weights, method="Fisher_chained", lag_periods=4, scale_output="unit")
+    assert list(result.index) == list(growth.index[4:])
+    g, w = growth.to_numpy(), weights.to_numpy()
+    expected, _ = fisher_chained_contributions_array(g[4:], w[:4], w[4:])
+    np.testing.assert_allclose(result.to_numpy(), expected)
+
+
+def test_fisher_keeps_the_arithmetic_mean_of_both_legs():
+    # "Fisher" keeps its historical output for existing callers; the exact
+    # additive decomposition is the separate "Fisher_chained" method
+    growth, weights = _frames()
+    laspeyres = compute_contributions(growth, weights, method="Laspeyres", lag_periods=4)
+    paasche = compute_contributions(growth, weights, method="Paasche", lag_periods=4)
+    fisher = compute_contributions(growth, weights, method="Fisher", lag_periods=4)
+    expected = 0.5 * (laspeyres + paasche.loc[laspeyres.index])
+    pd.testing.assert_frame_equal(fisher, expected)
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.contributions import compute_contributions_batch, compute_contributions_fast
+
+
+def _pair(seed, start, periods, components):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=periods, freq="QE")
+    growth = pd.DataFrame(rng.normal(0.02, 0.03, (periods, len(components))), index=index, columns=components)
+    weights = pd.DataFrame(rng.dirichlet(np.ones(len(components)), periods), index=index, columns=components)
+    return growth, weights
+
+
+@pytest.fixture
+def pairs():
+    # Different calendars and components force the union calendar
+    return {
+        "demanda": _pair(0, "2000-03-31", 24, ["consumo", "inversion", "exportaciones"]),
+        "oferta": _pair(1, "2001-03-31", 20, ["agro", "industria"]),
+    }
+
+
+@pytest.mark.parametrize("method", ["Laspeyres", "Paasche", "Fisher", "Fisher_chained"])
+def test_each_block_matches_the_single_decomposition(pairs, method):
+    wide = compute_contributions_batch(
+        pairs, method=method, lag_periods=4, growth_scale="unit", weight_scale="unit", return_long=False,
+    )
+    for name, (growth, weights) in pairs.items():
+        expected = compute_contributions_fast(growth, weights, method=method, lag_periods=4)
+        block = wide[name].dropna(how="all")
+        pd.testing.assert_frame_equal(block, expected, check_freq=False, check_names=False)
+
+
+def test_panel_input_matches_mapping_input(pairs):
+    growth_panel = pd.concat({k: g for k, (g, _) in pairs.items()}, axis=1)
+    weights_panel = pd.concat({k: w for k, (_, w) in pairs.items()}, axis=1)
+    from_panel = compute_contributions_batch((growth_panel, weights_panel), method="Fisher_chained", lag_periods=4,
+                                             growth_scale="unit", weight_scale="unit")
+    from_mapping = compute_contributions_batch(pairs, method="Fisher_chained", lag_periods=4,
+                                               growth_scale="unit", weight_scale="unit")
+    pd.testing.assert_frame_equal(from_panel, from_mapping)
+
+
+def test_long_output_is_tidy_and_categorical(pairs):
+    tidy = compute_contributions_batch(pairs, method="Paasche", growth_scale="unit", weight_scale="unit")
+    assert list(tidy.columns) == ["date", "decomposition", "component", "growth_pp", "weight_unit", "contribution_pp"]
+    assert list(tidy["decomposition"].cat.categories) == ["demanda", "oferta"]
+    assert tidy["decomposition"].cat.ordered
+    assert not tidy["contribution_pp"].isna().any()
+    sizes = tidy.groupby("decomposition", observed=True).size()
+    assert sizes.to_dict() == {"demanda": 24 * 3, "oferta": 20 * 2}
+
+
+def test_rolling_mode_uses_each_block_window(pairs):
+    wide = compute_contributions_batch(pairs, method="Paasche", mode="rolling", window=4,
+                                       growth_scale="unit", weight_scale="unit", return_long=False)
+    growth, weights = pairs["oferta"]
+    expected = compute_contributions_fast(growth, weights, method="Paasche", mode="rolling", window=4)
+    pd.testing.assert_frame_equal(wide["oferta"].loc[expected.index], expected, check_freq=False, check_names=False)
+
+
+def test_invalid_arguments_raise():
+    with pytest.raises(ValueError):
+        compute_contributions_batch({}, method="Paasche")
+    with pytest.raises(ValueError):
+        compute_contributions_batch({"x": _pair(0, "2000-03-31", 4, ["a"])}, mode="rolling")
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.contributions import (
+    compute_contributions,
+    compute_contributions_fast,
+    contributions_array,
+    cumulative_by_group_array,
+    rolling_contributions_array,
+)
+
+
+def _frames(seed=0, periods=30, components=("a", "b", "c")):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2000-03-31", periods=periods, freq="QE")
+    growth = pd.DataFrame(rng.normal(0.02, 0.03, (periods, len(components))), index=index, columns=list(components))
+    weights = pd.DataFrame(rng.dirichlet(np.ones(len(components)), periods), index=index, columns=list(components))
+    return growth, weights
+
+
+@pytest.mark.parametrize("method", ["Laspeyres", "Paasche", "Fisher", "Fisher_chained"])
+def test_fast_engine_matches_compute_contributions(method):
+    growth, weights = _frames()
+    expected = compute_contributions(growth, weights, method=method, lag_periods=4)
+    result = compute_contributions_fast(growth, weights, method=method, lag_periods=4)
+    pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+
+def test_contributions_array_lags_laspeyres_weights():
+    growth, weights = _frames(periods=6)
+    g, w = growth.to_numpy(), weights.to_numpy()
+    out = contributions_array(g, w, lag_periods=2, methods=("Laspeyres", "Paasche"), scale_output="unit")
+    assert out.shape == (2, 6, 3)
+    assert np.isnan(out[0, :2]).all()
+    np.testing.assert_allclose(out[0, 2:], w[:-2] * g[2:])
+    np.testing.assert_allclose(out[1], w * g)
+
+
+def test_contributions_array_rejects_mismatched_shapes():
+    with pytest.raises(ValueError):
+        contributions_array(np.zeros((3, 2)), np.zeros((3, 3)))
+
+
+def test_rolling_mean_matches_pandas_and_propagates_nan():
+    rng = np.random.default_rng(1)
+    contrib = rng.normal(size=(10, 2))
+    contrib[5, 1] = np.nan
+    result = rolling_contributions_array(contrib, window=3)
+    expected = pd.DataFrame(contrib).rolling(3).mean().to_numpy()
+    np.testing.assert_allclose(result, expected)
+    assert np.isnan(result[5:8, 1]).all()
+    assert np.isnan(rolling_contributions_array(contrib, window=11)).all()
+
+
+def test_cumulative_restarts_at_each_group():
+    contrib = np.array([[1.0], [2.0], [np.nan], [4.0], [5.0], [6.0]])
+    codes = np.array([-1, 0, 0, 1, 1, 1])
+    result = cumulative_by_group_array(contrib, codes)
+    assert np.isnan(result[0, 0])
+    np.testing.assert_allclose(result[1:, 0], [2.0, 2.0, 4.0, 9.0, 15.0])
+
+
+def test_fast_rolling_and_cumulative_modes():
+    growth, weights = _frames()
+    point = compute_contributions_fast(growth, weights, method="Paasche")
+    rolling = compute_contributions_fast(growth, weights, method="Paasche", mode="rolling", window=4)
+    pd.testing.assert_frame_equal(rolling, point.rolling(4).mean(), check_freq=False)
+
+    groups = np.repeat([0, 1, 2], 10)
+    cumulative = compute_contributions_fast(growth, weights, method="Paasche", mode="cumulative_admin", groups=groups)
+    expected = point.groupby(groups).cumsum()
+    pd.testing.assert_frame_equal(cumulative, expected, check_freq=False)
+
+    with pytest.raises(ValueError):
+        compute_contributions_fast(growth, weights, mode="rolling")
+
+
+def test_groups_use_the_aligned_input_length():
+    growth, weights = _frames()
+    groups = np.repeat([0, 1, 2], 10)
+    # Laspeyres drops the first lag rows: groups still follow the 30 input rows
+    result = compute_contributions_fast(growth, weights, lag_periods=4, mode="cumulative_admin", groups=groups)
+    point = compute_contributions_fast(growth, weights, lag_periods=4)
+    expected = point.groupby(groups[4:]).cumsum()
+    pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    with pytest.raises(ValueError):
+        compute_contributions_fast(growth, weights, lag_periods=4, mode="cumulative_admin", groups=groups[4:])
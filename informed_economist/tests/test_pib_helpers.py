@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from backend.cuentas_nacionales.pib.helpers import ColumnResolver, ColumnView, _concat_by_constants
+
+
+def _frame():
+    index = pd.date_range("2020-03-31", periods=4, freq="QE")
+    return pd.DataFrame(np.arange(20.0).reshape(4, 5), index=index,
+                        columns=["PIB_TC", "PIB_Agro_TC", "PIB_Manuf_TC", "PIB_Agro_SO", "PIB_Manuf_SO"])
+
+
+class WithoutInternals:
+    """DataFrame sin `_mgr`, como si cambiaran los internals de pandas."""
+
+    def __init__(self, frame):
+        self._frame = frame
+
+    def __getattr__(self, name):
+        if name == "_mgr":
+            raise AttributeError(name)
+        return getattr(self._frame, name)
+
+
+def test_contiguous_float_block_is_a_read_only_view():
+    df = _frame()
+    view = ColumnView(df, np.array([1, 2]))
+    values = view.to_numpy()
+    np.testing.assert_array_equal(values, df.iloc[:, 1:3].to_numpy())
+    assert np.shares_memory(values, df.iloc[:, 1].to_numpy())
+    assert not values.flags.writeable
+
+
+def test_non_contiguous_or_mixed_columns_are_copied():
+    df = _frame()
+    sparse = ColumnView(df, np.array([0, 2, 4]))
+    np.testing.assert_array_equal(sparse.to_numpy(), df.iloc[:, [0, 2, 4]].to_numpy())
+    df["Label"] = "Arias"
+    mixed = ColumnView(df, np.array([4, 5]))
+    assert mixed.to_numpy().shape == (4, 2)
+
+
+def test_missing_pandas_internals_fall_back_to_a_copy():
+    df = _frame()
+    view = ColumnView(WithoutInternals(df), np.array([1, 2]))
+    assert view._block_view() is None
+    values = view.to_numpy()
+    np.testing.assert_array_equal(values, df.iloc[:, 1:3].to_numpy())
+    assert not np.shares_memory(values, df.iloc[:, 1].to_numpy())
+
+
+def test_concat_by_constants_view_matches_the_frame_path():
+    df = _frame()
+    resolver = ColumnResolver()
+    eager = _concat_by_constants(df, ["Agro", "Manuf"], return_dict=True, resolver=resolver)
+    lazy = _concat_by_constants(df, ["Agro", "Manuf"], return_dict=True, resolver=resolver, as_view=True)
+    pd.testing.assert_frame_equal(lazy["data"].to_frame(), eager["data"])
+    assert list(eager["data"].columns) == ["PIB_Agro_TC", "PIB_Agro_SO", "PIB_Manuf_TC", "PIB_Manuf_SO"]
+    assert _concat_by_constants(df, ["Minas"], return_dict=True)["missing_constants"] == ["Minas"]
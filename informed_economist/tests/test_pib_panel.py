@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.contributions import compute_contributions_batch, compute_contributions_fast
+from backend.cuentas_nacionales.pib import PIBPanel, PIBViews
+
+
+def _mixed_frame():
+    index = pd.date_range("2020-03-31", periods=4, freq="QE")
+    df = pd.DataFrame(
+        {
+            "PIB_TC": [1.0, 2.0, 3.0, 4.0],
+            "Manufactura_TC": [0.5, 0.6, 0.7, 0.8],
+            "PIB_SO": [10.0, 20.0, 30.0, 40.0],
+            "Manufactura_SO": [5.0, 6.0, 7.0, 8.0],
+        },
+        index=index,
+    )
+    df["President"] = ["Arias", "Arias", "Chinchilla", "Chinchilla"]
+    return df
+
+
+def test_from_frame_splits_blocks_by_suffix_and_metadata():
+    panel = PIBPanel.from_frame(_mixed_frame())
+    assert panel.series_types == ["TC", "SO"]
+    assert panel.columns("_SO") == ["PIB_SO", "Manufactura_SO"]
+    assert panel.values("TC").flags.c_contiguous
+    assert not panel.values("TC").flags.writeable
+    president = panel.metadata["President"]
+    assert president.cat.ordered
+    assert list(president.cat.categories) == ["Arias", "Chinchilla"]
+
+
+def test_frame_is_a_view_and_values_take_columns():
+    panel = PIBPanel.from_frame(_mixed_frame())
+    frame = panel.frame("TC")
+    assert np.shares_memory(frame.to_numpy(), panel.values("TC"))
+    np.testing.assert_array_equal(panel.values("SO", ["Manufactura_SO"])[:, 0], [5.0, 6.0, 7.0, 8.0])
+    full = panel.to_frame("TC")
+    assert list(full.columns) == ["PIB_TC", "Manufactura_TC", "President"]
+
+
+def test_from_frames_uses_the_union_calendar():
+    df = _mixed_frame()
+    panel = PIBPanel.from_frames({
+        "TC": df[["PIB_TC", "President"]],
+        "SO": df[["PIB_SO"]].iloc[2:],
+    })
+    assert len(panel.index) == 4
+    assert np.isnan(panel.values("SO")[:2]).all()
+    assert list(panel.metadata["President"].astype(str)) == ["Arias", "Arias", "Chinchilla", "Chinchilla"]
+
+
+def test_block_shape_must_match_index_and_columns():
+    with pytest.raises(ValueError):
+        PIBPanel(pd.RangeIndex(3), {"TC": np.zeros((3, 2))}, {"TC": ["PIB_TC"]})
+
+
+def test_views_follow_the_panel_series_type():
+    views = PIBViews(PIBPanel.from_frame(_mixed_frame()), series_type="TC")
+    assert list(views.oferta.get_pib().columns) == ["PIB_TC"]
+    views.series_type = "SO"
+    assert list(views.dataframe.columns) == ["PIB_SO", "Manufactura_SO"]
+    np.testing.assert_array_equal(views.oferta.get_pib()["PIB_SO"], [10.0, 20.0, 30.0, 40.0])
+
+
+def test_frames_are_read_only_unless_copied():
+    panel = PIBPanel.from_frame(_mixed_frame())
+    shared = panel.frame("TC")
+    with pytest.raises(ValueError):
+        shared.iloc[0, 0] = 99.0
+    editable = panel.frame("TC", copy=True)
+    editable.iloc[0, 0] = 99.0
+    assert panel.values("TC")[0, 0] == 1.0
+    # Los getters de PIBViews trabajan sobre copias y pueden añadir columnas
+    views = PIBViews(panel, series_type="SO")
+    assert "Industria_Ampliada_SO" in views.oferta.get_industria_ampliada().columns
+
+
+def _levels_panel(periods=12):
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2020-03-31", periods=periods, freq="QE")
+    levels = pd.DataFrame(rng.uniform(10, 20, (periods, 3)), index=index, columns=["Hogares", "Gobierno", "Inversion"])
+    levels["PIB"] = levels.sum(axis=1)
+    growth = pd.DataFrame(rng.normal(3, 2, (periods, 4)), index=index, columns=levels.columns)
+    return PIBPanel.from_frames({"SO": levels.add_suffix("_SO"), "TC": growth.add_suffix("_TC")}), levels, growth
+
+
+def test_contribution_inputs_feed_the_fast_engine():
+    panel, levels, growth = _levels_panel()
+    components = ["Hogares", "Gobierno", "Inversion"]
+    g, w = panel.contribution_inputs(components, "PIB")
+    np.testing.assert_allclose(w.sum(axis=1), 1.0)
+    result = compute_contributions_fast(g / 100.0, w, method="Laspeyres", lag_periods=4)
+    shares = levels[components].div(levels["PIB"], axis=0)
+    expected = compute_contributions_fast(growth[components] / 100.0, shares, method="Laspeyres", lag_periods=4)
+    pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+
+def test_batch_inputs_feed_the_batch_engine():
+    panel, _, _ = _levels_panel()
+    inputs = panel.batch_inputs({
+        "demanda": (["Hogares", "Gobierno", "Inversion"], "PIB"),
+        "consumo": (["Hogares", "Gobierno"], "PIB"),
+    })
+    tidy = compute_contributions_batch(inputs, method="Paasche", growth_scale="percent", weight_scale="unit")
+    g, w = inputs["consumo"]
+    expected = compute_contributions_fast(g / 100.0, w, method="Paasche")
+    consumo = tidy[tidy["decomposition"] == "consumo"].pivot(index="date", columns="component", values="contribution_pp")
+    np.testing.assert_allclose(consumo[expected.columns].to_numpy(), expected.to_numpy())
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from backend.cuentas_nacionales.pib import PIBViews
+from backend.cuentas_nacionales.pib.helpers import ColumnResolver
+
+
+def _frame():
+    index = pd.date_range("2020-03-31", periods=3, freq="QE")
+    columns = [
+        "PIB_TC", "Valor_Agregado_TC", "Impuestos_TC", "Manufactura_TC",
+        "PIB_SO", "Valor_Agregado_SO", "Impuestos_SO", "Manufactura_SO",
+    ]
+    return pd.DataFrame(np.arange(24.0).reshape(3, 8), index=index, columns=columns)
+
+
+def test_positions_match_regex_filter_and_are_cached():
+    df = _frame()
+    resolver = ColumnResolver()
+    pos = resolver.positions(df.columns, "_SO")
+    assert list(df.columns[pos]) == list(df.filter(regex="_SO").columns)
+    assert resolver.positions(df.columns, "_SO") is pos
+
+
+def test_resolver_resets_when_columns_change():
+    df = _frame()
+    resolver = ColumnResolver()
+    first = resolver.positions(df.columns, "PIB")
+    renamed = df.rename(columns={"PIB_TC": "Otro_TC"})
+    second = resolver.positions(renamed.columns, "PIB")
+    assert list(first) == [0, 4]
+    assert list(second) == [4]
+
+
+def test_views_share_one_resolver_and_setters_invalidate_it():
+    views = PIBViews(_frame(), series_type="TC")
+    assert views.oferta._resolver is views.demanda._resolver
+    cats = views.oferta.get_categorias_principales()
+    assert list(cats.columns) == ["PIB_TC", "Valor_Agregado_TC", "Impuestos_TC"]
+    assert views.oferta._resolver._positions
+
+    views.series_type = "SO"
+    assert not views.oferta._resolver._positions
+    assert list(views.oferta.get_pib().columns) == ["PIB_SO"]
+
+    views.dataframe = _frame()[["PIB_SO", "Manufactura_SO"]]
+    assert list(views.oferta.get_pib().columns) == ["PIB_SO"]
+    assert views.oferta.get_categorias_principales(return_dict=True)["missing_constants"] == [
+        "Valor_Agregado_SO", "Impuestos_SO",
+    ]
@@ -0,0 +1,45 @@
+import pandas as pd
+
+from backend.political_terms import assign_by_terms, build_cr_terms, political_tags, tag_politics, term_positions
+
+
+def _naive_label(stamp, terms):
+    # Referencia fila por fila: el último período que empieza antes o el mismo día
+    label = ""
+    for row in terms.itertuples():
+        if row.start <= stamp <= row.end:
+            label = row.Label
+    return label
+
+
+def test_vectorized_tags_match_a_row_by_row_lookup():
+    index = pd.date_range("1989-01-31", "2027-12-31", freq="ME")
+    terms = build_cr_terms()
+    tags = political_tags(index, columns=("Label",))
+    expected = [_naive_label(stamp, terms) for stamp in index]
+    assert tags["Label"].astype(object).fillna("").tolist() == expected
+
+
+def test_transfer_day_belongs_to_the_incoming_administration():
+    index = pd.DatetimeIndex(["2018-05-07", "2018-05-08", "1990-05-07", "2026-05-09"])
+    labels = assign_by_terms(index, build_cr_terms(), "Label")
+    assert labels.iloc[0] == "Solís" and labels.iloc[1] == "Alvarado"
+    assert labels.iloc[2:].isna().all()
+
+
+def test_positions_are_memoized_per_index():
+    index = pd.date_range("2000-03-31", periods=40, freq="QE")
+    first = term_positions(index)
+    assert term_positions(index) is first
+    assert not first.flags.writeable
+    assert term_positions(pd.DatetimeIndex(index.copy())) is not first
+
+
+def test_tag_politics_adds_every_column_without_touching_the_input():
+    df = pd.DataFrame({"PIB": [1.0, 2.0]}, index=pd.DatetimeIndex(["2007-03-31", "2023-06-30"], name="fecha"))
+    tagged = tag_politics(df)
+    assert list(df.columns) == ["PIB"]
+    assert tagged[["President", "Party", "Term", "Label"]].astype(str).values.tolist() == [
+        ["Óscar Arias Sánchez", "PLN", "2006–2010", "Arias"],
+        ["Rodrigo Chaves Robles", "PPSD", "2022–2026", "Chaves"],
+    ]